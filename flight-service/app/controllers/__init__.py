@@ -4,7 +4,9 @@ from .flight_controller import FlightController, flight_bp
 from .booking_controller import BookingController, booking_bp
 from .rating_controller import RatingController, rating_bp
 from .report_controller import ReportController, report_bp, create_report_controller
+from .export_controller import ExportController, export_bp
 from .health_controller import health_bp
+from .metrics_controller import metrics_bp
 from app.domain.interfaces.controllers.airport_controller_interface import AirportControllerInterface
 from app.domain.interfaces.controllers.airline_controller_interface import AirlineControllerInterface
 from app.domain.interfaces.controllers.flight_controller_interface import FlightControllerInterface
@@ -18,13 +20,16 @@ __all__ = [
     'BookingController',
     'RatingController',
     'ReportController',
+    'ExportController',
     'airport_bp',
     'airline_bp',
     'flight_bp',
     'booking_bp',
     'rating_bp',
     'report_bp',
+    'export_bp',
     'health_bp',
+    'metrics_bp',
     'create_report_controller',
     'AirportControllerInterface',
     'AirlineControllerInterface',
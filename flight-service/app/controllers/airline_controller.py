@@ -3,11 +3,15 @@ from ..domain.dtos.airline_dto import AirlineCreateDTO, AirlineUpdateDTO, Airlin
 from app.domain.interfaces.services.airline_service_interface import AirlineServiceInterface
 from app.domain.interfaces.controllers.airline_controller_interface import AirlineControllerInterface
 from .validators.airline_validator import validate_create_airline_data, validate_update_airline_data
+from .validators.search_validator import validate_search_params
+from app.infrastructure.caching import conditional_get
+from app.infrastructure.serialization import CompiledSerializer
 from app.utils.logger_service import get_logger, LoggerService
 import time
 
 logger = get_logger(__name__)
 airline_bp = Blueprint('airline', __name__)
+airline_serializer = CompiledSerializer(AirlineResponseDTO)
 
 class AirlineController(AirlineControllerInterface):
     def __init__(self, airline_service: AirlineServiceInterface, blueprint: Blueprint):
@@ -53,11 +57,11 @@ class AirlineController(AirlineControllerInterface):
                                        airline_id=airline.id,
                                        name=airline.name)
         
-        response_dto = AirlineResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'POST', '/airlines', 201, duration_ms, airline_id=airline.id)
-        return jsonify(response_dto.dump(airline)), 201
+        return jsonify(airline_serializer.dump(airline)), 201
 
+    @conditional_get(('airlines',), reference_data=True)
     def get_airline(self, airline_id: int):
         """
         GET /airlines/<int:airline_id>
@@ -73,9 +77,33 @@ class AirlineController(AirlineControllerInterface):
         if not airline:
             return jsonify({'error': 'Airline not found'}), 404
         
-        response_dto = AirlineResponseDTO()
-        return jsonify(response_dto.dump(airline))
+        return jsonify(airline_serializer.dump(airline))
 
+    def search_airlines(self):
+        """
+        GET /airlines/search
+        Fuzzy searches airlines by name, tolerating typos.
+
+        Query parameters:
+            q (str): Search term (required)
+            limit (int): Maximum number of results (default: 10, max: 50)
+
+        Returns:
+            Response: JSON response with matching airlines, best match first.
+        """
+        try:
+            term, limit = validate_search_params(request.args.get('q'), request.args.get('limit', type=int))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        airlines = self.airline_service.search_airlines(term, limit)
+
+        return jsonify({
+            'airlines': airline_serializer.dump_many(airlines),
+            'query': term
+        })
+
+    @conditional_get(('airlines',), reference_data=True)
     def get_all_airlines(self):
         """
         GET /airlines
@@ -97,10 +125,9 @@ class AirlineController(AirlineControllerInterface):
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
         
         result = self.airline_service.get_all_airlines(page, per_page)
-        response_dto = AirlineResponseDTO(many=True)
         
         return jsonify({
-            'airlines': response_dto.dump(result['airlines']),
+            'airlines': airline_serializer.dump_many(result['airlines']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
@@ -138,8 +165,7 @@ class AirlineController(AirlineControllerInterface):
         if not airline:
             return jsonify({'error': 'Airline not found'}), 404
         
-        response_dto = AirlineResponseDTO()
-        return jsonify(response_dto.dump(airline))
+        return jsonify(airline_serializer.dump(airline))
 
     def delete_airline(self, airline_id: int):
         """
@@ -161,6 +187,7 @@ class AirlineController(AirlineControllerInterface):
     def register_routes(self, bp: Blueprint):
         bp.add_url_rule('/airlines', 'create_airline', self.create_airline, methods=['POST', 'OPTIONS'])
         bp.add_url_rule('/airlines', 'get_all_airlines', self.get_all_airlines, methods=['GET', 'OPTIONS'])
+        bp.add_url_rule('/airlines/search', 'search_airlines', self.search_airlines, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/airlines/<int:airline_id>', 'get_airline', self.get_airline, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/airlines/<int:airline_id>', 'update_airline', self.update_airline, methods=['PATCH', 'OPTIONS'])
         bp.add_url_rule('/airlines/<int:airline_id>', 'delete_airline', self.delete_airline, methods=['DELETE', 'OPTIONS'])
@@ -3,11 +3,15 @@ from ..domain.dtos.airport_dto import AirportUpdateDTO, AirportResponseDTO, Airp
 from app.domain.interfaces.services.airport_service_interface import AirportServiceInterface
 from app.domain.interfaces.controllers.airport_controller_interface import AirportControllerInterface
 from .validators.airport_validator import validate_create_airport_data, validate_update_airport_data
+from .validators.search_validator import validate_search_params
+from app.infrastructure.caching import conditional_get
+from app.infrastructure.serialization import CompiledSerializer
 from app.utils.logger_service import get_logger, LoggerService
 import time
 
 logger = get_logger(__name__)
 airport_bp = Blueprint('airport', __name__)
+airport_serializer = CompiledSerializer(AirportResponseDTO)
 
 class AirportController(AirportControllerInterface):
     def __init__(self, airport_service: AirportServiceInterface, blueprint: Blueprint):
@@ -54,11 +58,11 @@ class AirportController(AirportControllerInterface):
                                        airport_id=airport.id,
                                        code=airport.code)
 
-        response_dto = AirportResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'POST', '/airports', 201, duration_ms, airport_id=airport.id)
-        return jsonify(response_dto.dump(airport)), 201
+        return jsonify(airport_serializer.dump(airport)), 201
 
+    @conditional_get(('airports',), reference_data=True)
     def get_airport(self, airport_id: int):
         """
         GET /airports/<int:airport_id>
@@ -73,9 +77,33 @@ class AirportController(AirportControllerInterface):
         airport = self.airport_service.get_airport(airport_id)
         if not airport:
             return jsonify({'error': 'Airport not found'}), 404
-        response_dto = AirportResponseDTO()
-        return jsonify(response_dto.dump(airport))
+        return jsonify(airport_serializer.dump(airport))
 
+    def search_airports(self):
+        """
+        GET /airports/search
+        Fuzzy searches airports by name, tolerating typos.
+
+        Query parameters:
+            q (str): Search term (required)
+            limit (int): Maximum number of results (default: 10, max: 50)
+
+        Returns:
+            Response: JSON response with matching airports, best match first.
+        """
+        try:
+            term, limit = validate_search_params(request.args.get('q'), request.args.get('limit', type=int))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        airports = self.airport_service.search_airports(term, limit)
+
+        return jsonify({
+            'airports': airport_serializer.dump_many(airports),
+            'query': term
+        })
+
+    @conditional_get(('airports',), reference_data=True)
     def get_all_airports(self):
         """
         GET /airports
@@ -97,9 +125,8 @@ class AirportController(AirportControllerInterface):
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
         
         result = self.airport_service.get_all_airports(page=page, per_page=per_page)
-        response_dto = AirportResponseDTO(many=True)
         return jsonify({
-            'airports': response_dto.dump(result['airports']),
+            'airports': airport_serializer.dump_many(result['airports']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
@@ -138,8 +165,7 @@ class AirportController(AirportControllerInterface):
         airport = self.airport_service.update_airport(airport_id, validated_data)
         if not airport:
             return jsonify({'error': 'Airport not found'}), 404
-        response_dto = AirportResponseDTO()
-        return jsonify(response_dto.dump(airport))
+        return jsonify(airport_serializer.dump(airport))
 
     def delete_airport(self, airport_id: int):
         """
@@ -174,12 +200,12 @@ class AirportController(AirportControllerInterface):
         airport = self.airport_service.fetch_airport_info(airport_code)
         if not airport:
             return jsonify({'error': 'Airport not found'}), 404
-        response_dto = AirportResponseDTO()
-        return jsonify(response_dto.dump(airport))
+        return jsonify(airport_serializer.dump(airport))
 
     def register_routes(self, bp: Blueprint):
         bp.add_url_rule('/airports', 'create_airport', self.create_airport, methods=['POST', 'OPTIONS'])
         bp.add_url_rule('/airports', 'get_all_airports', self.get_all_airports, methods=['GET', 'OPTIONS'])
+        bp.add_url_rule('/airports/search', 'search_airports', self.search_airports, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/airports/<int:airport_id>', 'get_airport', self.get_airport, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/airports/<int:airport_id>', 'update_airport', self.update_airport, methods=['PATCH', 'OPTIONS'])
         bp.add_url_rule('/airports/<int:airport_id>', 'delete_airport', self.delete_airport, methods=['DELETE', 'OPTIONS'])
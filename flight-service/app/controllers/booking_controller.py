@@ -6,13 +6,17 @@ from ..domain.dtos.booking_dto import (
     BookingDTO
 )
 from app.domain.interfaces.services.booking_service_interface import BookingServiceInterface
+from app.domain.enums.booking_outcome import BookingOutcome
 from app.domain.interfaces.controllers.booking_controller_interface import BookingControllerInterface
 from .validators.booking_validator import validate_create_booking_data
 from .validators.header_validator import validate_user_id_header
+from .validators.pagination_validator import validate_count_mode
+from app.infrastructure.serialization import CompiledSerializer
 from app.utils.logger_service import get_logger
 
 logger = get_logger(__name__)
 booking_bp = Blueprint('booking', __name__)
+booking_serializer = CompiledSerializer(BookingResponseDTO)
 
 
 class BookingController(BookingControllerInterface):
@@ -34,7 +38,8 @@ class BookingController(BookingControllerInterface):
             user-id: "integer (required)"
 
         Returns:
-            tuple: JSON response with booking data, and HTTP status code.
+            tuple: JSON response with booking data (201), or an error with a reason:
+            404 FLIGHT_NOT_FOUND, 400 NOT_BOOKABLE, 409 SOLD_OUT or 409 DUPLICATE.
         """
         data = request.get_json()
         if not data:
@@ -49,9 +54,17 @@ class BookingController(BookingControllerInterface):
         except ValueError as e:
             return jsonify(e.args[0]), 400
         
-        booking_result = self.booking_service.create_booking(user_id, validated_data)
+        outcome, booking_result = self.booking_service.create_booking(user_id, validated_data)
+        if outcome == BookingOutcome.FLIGHT_NOT_FOUND:
+            return jsonify({'error': 'Flight not found', 'reason': outcome.value}), 404
+        if outcome == BookingOutcome.NOT_BOOKABLE:
+            return jsonify({'error': 'Flight is not open for booking', 'reason': outcome.value}), 400
+        if outcome == BookingOutcome.SOLD_OUT:
+            return jsonify({'error': 'Flight is sold out', 'reason': outcome.value}), 409
+        if outcome == BookingOutcome.DUPLICATE:
+            return jsonify({'error': 'User has already booked this flight', 'reason': outcome.value}), 409
         if not booking_result:
-            return jsonify({'error': 'Failed to create booking'}), 400
+            return jsonify({'error': 'Failed to create booking', 'reason': outcome.value}), 400
         
         return jsonify(booking_result.to_dict()), 201
     
@@ -84,8 +97,7 @@ class BookingController(BookingControllerInterface):
         if not booking:
             return jsonify({'error': 'Booking not found'}), 404
         
-        response_dto = BookingResponseDTO()
-        return jsonify(response_dto.dump(booking))
+        return jsonify(booking_serializer.dump(booking))
 
     def get_user_bookings(self, user_id: int):
         """
@@ -98,6 +110,8 @@ class BookingController(BookingControllerInterface):
         Query parameters:
             page (int): Page number (default: 1)
             per_page (int): Items per page (default: 10)
+            cursor (str): Opt-in keyset pagination; empty for the first page, then the returned next_cursor
+            count (str): How total is computed: exact (default), cached or estimated
 
         Returns:
             Response: JSON response with paginated list of user bookings.
@@ -110,15 +124,25 @@ class BookingController(BookingControllerInterface):
         if per_page < 1 or per_page > 100:
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
         
-        result = self.booking_service.get_user_bookings(user_id, page, per_page)
-        response_dto = BookingResponseDTO(many=True)
+        try:
+            count_mode = validate_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        cursor = request.args.get('cursor')
+        try:
+            result = self.booking_service.get_user_bookings(user_id, page, per_page, cursor, count_mode)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
         
         return jsonify({
-            'bookings': response_dto.dump(result['bookings']),
+            'bookings': booking_serializer.dump_many(result['bookings']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
-            'pages': result['pages']
+            'pages': result['pages'],
+            'next_cursor': result.get('next_cursor'),
+            'total_mode': result.get('total_mode')
         })
 
     def get_all_bookings(self):
@@ -129,6 +153,8 @@ class BookingController(BookingControllerInterface):
         Query parameters:
             page (int): Page number (default: 1)
             per_page (int): Items per page (default: 10)
+            cursor (str): Opt-in keyset pagination; empty for the first page, then the returned next_cursor
+            count (str): How total is computed: exact (default), cached or estimated
 
         Returns:
             Response: JSON response with paginated list of all bookings.
@@ -141,15 +167,25 @@ class BookingController(BookingControllerInterface):
         if per_page < 1 or per_page > 100:
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
         
-        result = self.booking_service.get_all_bookings(page, per_page)
-        response_dto = BookingResponseDTO(many=True)
+        try:
+            count_mode = validate_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        cursor = request.args.get('cursor')
+        try:
+            result = self.booking_service.get_all_bookings(page, per_page, cursor, count_mode)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
         
         return jsonify({
-            'bookings': response_dto.dump(result['bookings']),
+            'bookings': booking_serializer.dump_many(result['bookings']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
-            'pages': result['pages']
+            'pages': result['pages'],
+            'next_cursor': result.get('next_cursor'),
+            'total_mode': result.get('total_mode')
         })
 
     def delete_booking(self, booking_id: int):
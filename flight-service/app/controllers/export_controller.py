@@ -0,0 +1,110 @@
+"""
+Export Controller - streaming CSV / Parquet data exports
+Following Clean Architecture and SOLID principles
+"""
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Optional
+from app.domain.enums.export_format import ExportFormat
+from app.domain.interfaces.services.export_service_interface import ExportServiceInterface
+from app.domain.interfaces.controllers.export_controller_interface import ExportControllerInterface
+from app.controllers.validators.header_validator import validate_admin_id_header
+from app.controllers.validators.export_validator import validate_export_format
+from app.controllers.validators.flight_validator import extract_flight_filters
+from app.utils.logger_service import get_logger, LoggerService
+import time
+
+logger = get_logger(__name__)
+
+export_bp = Blueprint('export', __name__)
+
+EXPORT_MIMETYPES = {
+    ExportFormat.CSV: 'text/csv',
+    ExportFormat.PARQUET: 'application/vnd.apache.parquet'
+}
+
+
+class ExportController(ExportControllerInterface):
+    """Controller streaming data exports (ADMINISTRATOR only)"""
+
+    def __init__(self, export_service: ExportServiceInterface, blueprint: Blueprint):
+        self.export_service = export_service
+        self.register_routes(blueprint)
+
+    def export_flights(self):
+        """
+        GET /exports/flights?format=csv|parquet
+        Stream all flights matching the GET /flights filters
+        """
+        return self._export('flights', self.export_service.export_flights, extract_flight_filters(request.args))
+
+    def export_bookings(self):
+        """
+        GET /exports/bookings?format=csv|parquet
+        Stream all bookings, optionally filtered by user_id and flight_id
+        """
+        return self._export('bookings', self.export_service.export_bookings, self._id_filters())
+
+    def export_ratings(self):
+        """
+        GET /exports/ratings?format=csv|parquet
+        Stream all ratings, optionally filtered by user_id and flight_id
+        """
+        return self._export('ratings', self.export_service.export_ratings, self._id_filters())
+
+    @staticmethod
+    def _id_filters() -> Dict[str, int]:
+        filters = {}
+        for key in ('user_id', 'flight_id'):
+            value = request.args.get(key, type=int)
+            if value:
+                filters[key] = value
+        return filters
+
+    def _export(self, entity: str, export: Callable[[ExportFormat, Optional[Dict]], Iterator[bytes]],
+                filters: Dict):
+        start_time = time.time()
+        path = f'/exports/{entity}'
+        LoggerService.log_request(logger, 'GET', path)
+
+        try:
+            validate_admin_id_header(request.headers.get('admin-id'))
+        except ValueError as e:
+            duration_ms = (time.time() - start_time) * 1000
+            LoggerService.log_response(logger, 'GET', path, 401, duration_ms,
+                                     error='Unauthorized - Admin ID required')
+            return jsonify(e.args[0]), 401
+
+        try:
+            export_format = validate_export_format(request.args.get('format'))
+        except ValueError as e:
+            duration_ms = (time.time() - start_time) * 1000
+            LoggerService.log_response(logger, 'GET', path, 400, duration_ms,
+                                     error='Invalid export format')
+            return jsonify(e.args[0]), 400
+
+        if not self.export_service.is_format_available(export_format):
+            duration_ms = (time.time() - start_time) * 1000
+            LoggerService.log_response(logger, 'GET', path, 501, duration_ms,
+                                     error='Export format not available')
+            return jsonify({'error': f'{export_format.value} export is not available on this server'}), 501
+
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        filename = f"{entity}_{timestamp}.{export_format.value}"
+
+        duration_ms = (time.time() - start_time) * 1000
+        LoggerService.log_response(logger, 'GET', path, 200, duration_ms,
+                                 format=export_format.value, filters=filters)
+
+        # stream_with_context keeps the app context (and its DB session) open while the body streams
+        return Response(
+            stream_with_context(export(export_format, filters or None)),
+            mimetype=EXPORT_MIMETYPES[export_format],
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
+
+    def register_routes(self, blueprint: Blueprint):
+        """Register all export routes"""
+        blueprint.add_url_rule('/exports/flights', 'export_flights', self.export_flights, methods=['GET'])
+        blueprint.add_url_rule('/exports/bookings', 'export_bookings', self.export_bookings, methods=['GET'])
+        blueprint.add_url_rule('/exports/ratings', 'export_ratings', self.export_ratings, methods=['GET'])
@@ -11,14 +11,19 @@ from ..domain.dtos.flight_dto import (
 )
 from app.domain.interfaces.services.flight_service_interface import FlightServiceInterface
 from app.domain.interfaces.controllers.flight_controller_interface import FlightControllerInterface
-from .validators.flight_validator import validate_create_flight_data, validate_update_flight_data, validate_update_flight_status_data
+from .validators.flight_validator import validate_create_flight_data, validate_update_flight_data, validate_update_flight_status_data, extract_flight_filters
 from .validators.header_validator import validate_admin_id_header, validate_user_id_header  # Assuming validate_user_id_header is added to header_validator.py
+from .validators.pagination_validator import validate_count_mode
+from .validators.search_validator import validate_search_params
+from app.infrastructure.caching import FLIGHT_LIST_TABLES, FLIGHT_TABLES, conditional_get, exact_count_requested
+from app.infrastructure.serialization import CompiledSerializer
 from app.utils.logger_service import get_logger, LoggerService
 import time
 
 logger = get_logger(__name__)
 
 flight_bp = Blueprint('flight', __name__)
+flight_serializer = CompiledSerializer(FlightResponseDTO)
 
 
 class FlightController(FlightControllerInterface):
@@ -70,11 +75,11 @@ class FlightController(FlightControllerInterface):
                                        flight_name=flight.flight_name,
                                        user_id=user_id)
         
-        response_dto = FlightResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'POST', '/flights', 201, duration_ms, flight_id=flight.flight_id)
-        return jsonify(response_dto.dump(flight)), 201
+        return jsonify(flight_serializer.dump(flight)), 201
 
+    @conditional_get(FLIGHT_TABLES)
     def get_flight(self, flight_id: int):
         """GET /flights/<int:flight_id> - Retrieve a flight by ID"""
         start_time = time.time()
@@ -86,15 +91,19 @@ class FlightController(FlightControllerInterface):
             LoggerService.log_response(logger, 'GET', f'/flights/{flight_id}', 404, duration_ms)
             return jsonify({'error': 'Flight not found'}), 404
         
-        response_dto = FlightResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'GET', f'/flights/{flight_id}', 200, duration_ms)
-        return jsonify(response_dto.dump(flight))
+        return jsonify(flight_serializer.dump(flight))
 
+    @conditional_get(FLIGHT_LIST_TABLES, when=exact_count_requested)
     def get_all_flights(self):
         """
         GET /flights
         Retrieves all flights with pagination and optional filters
+
+        Pass ?cursor= (empty for the first page, then the returned next_cursor)
+        to page by keyset instead of page number, and ?count=cached|estimated
+        to get a cheaper total; total_mode tells which mode produced it.
         """
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
@@ -104,33 +113,53 @@ class FlightController(FlightControllerInterface):
         if per_page < 1 or per_page > 100:
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
         
+        filters = extract_flight_filters(request.args)
+        
+        try:
+            count_mode = validate_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        cursor = request.args.get('cursor')
+        try:
+            result = self.flight_service.get_all_flights(page, per_page, filters if filters else None, cursor, count_mode)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        
+        return jsonify({
+            'flights': flight_serializer.dump_many(result['flights']),
+            'page': result['page'],
+            'per_page': result['per_page'],
+            'total': result['total'],
+            'pages': result['pages'],
+            'next_cursor': result.get('next_cursor'),
+            'total_mode': result.get('total_mode')
+        })
+    
+    def search_flights(self):
+        """
+        GET /flights/search
+        Fuzzy searches flights by name, tolerating typos, best match first.
+
+        Query parameters: q (required), limit (default 10, max 50), and
+        optionally airline_id and status to narrow the results.
+        """
+        try:
+            term, limit = validate_search_params(request.args.get('q'), request.args.get('limit', type=int))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
         filters = {}
-        if request.args.get('flight_name'):
-            filters['flight_name'] = request.args.get('flight_name')
         if request.args.get('airline_id'):
             filters['airline_id'] = request.args.get('airline_id', type=int)
         if request.args.get('status'):
             filters['status'] = request.args.get('status')
-        if request.args.get('departure_airport_id'):
-            filters['departure_airport_id'] = request.args.get('departure_airport_id', type=int)
-        if request.args.get('arrival_airport_id'):
-            filters['arrival_airport_id'] = request.args.get('arrival_airport_id', type=int)
-        if request.args.get('min_price'):
-            filters['min_price'] = request.args.get('min_price', type=float)
-        if request.args.get('max_price'):
-            filters['max_price'] = request.args.get('max_price', type=float)
-        if request.args.get('departure_date'):
-            filters['departure_date'] = request.args.get('departure_date')
-        
-        result = self.flight_service.get_all_flights(page, per_page, filters if filters else None)
-        response_dto = FlightResponseDTO(many=True)
-        
+
+        flights = self.flight_service.search_flights(term, limit, filters if filters else None)
+
         return jsonify({
-            'flights': response_dto.dump(result['flights']),
-            'page': result['page'],
-            'per_page': result['per_page'],
-            'total': result['total'],
-            'pages': result['pages']
+            'flights': flight_serializer.dump_many(flights),
+            'query': term
         })
     
     def get_flights_by_tab(self, tab: str):
@@ -158,17 +187,22 @@ class FlightController(FlightControllerInterface):
             filters['flight_name'] = request.args.get('flight_name')
         if request.args.get('airline_id'):
             filters['airline_id'] = request.args.get('airline_id', type=int)
+
+        try:
+            count_mode = validate_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
         
-        result = self.flight_service.get_flights_by_tab(tab, page, per_page, filters if filters else None)
-        response_dto = FlightResponseDTO(many=True)
+        result = self.flight_service.get_flights_by_tab(tab, page, per_page, filters if filters else None, count_mode)
         
         return jsonify({
             'tab': tab,
-            'flights': response_dto.dump(result['flights']),
+            'flights': flight_serializer.dump_many(result['flights']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
-            'pages': result['pages']
+            'pages': result['pages'],
+            'total_mode': result.get('total_mode')
         })
     
     def get_flight_remaining_time(self, flight_id: int):
@@ -217,10 +251,9 @@ class FlightController(FlightControllerInterface):
             LoggerService.log_response(logger, 'PUT', f'/flights/{flight_id}', 404, duration_ms, error='Flight not found or update failed')
             return jsonify({'error': 'Flight not found or update failed'}), 404
         
-        response_dto = FlightResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'PUT', f'/flights/{flight_id}', 200, duration_ms)
-        return jsonify(response_dto.dump(flight)), 200
+        return jsonify(flight_serializer.dump(flight)), 200
 
     def update_flight_status(self, flight_id: int):
         """
@@ -268,10 +301,9 @@ class FlightController(FlightControllerInterface):
                                        new_status=flight.status.value,
                                        admin_id=admin_id)
         
-        response_dto = FlightResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'PUT', f'/flights/{flight_id}/status', 200, duration_ms)
-        return jsonify(response_dto.dump(flight)), 200
+        return jsonify(flight_serializer.dump(flight)), 200
     
     def cancel_flight(self, flight_id: int):
         """
@@ -317,11 +349,10 @@ class FlightController(FlightControllerInterface):
                                        flight_name=flight.flight_name,
                                        admin_id=admin_id)
         
-        response_dto = FlightResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'POST', f'/flights/{flight_id}/cancel', 200, duration_ms)
         return jsonify({
-            'flight': response_dto.dump(flight),
+            'flight': flight_serializer.dump(flight),
             'affected_user_ids': cancelled_user_ids
         }), 200
 
@@ -374,6 +405,7 @@ class FlightController(FlightControllerInterface):
         """Register routes to the blueprint."""
         bp.add_url_rule('/flights', 'create_flight', self.create_flight, methods=['POST', 'OPTIONS'])
         bp.add_url_rule('/flights', 'get_all_flights', self.get_all_flights, methods=['GET', 'OPTIONS'])
+        bp.add_url_rule('/flights/search', 'search_flights', self.search_flights, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/flights/tabs/<string:tab>', 'get_flights_by_tab', self.get_flights_by_tab, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/flights/<int:flight_id>', 'get_flight', self.get_flight, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/flights/<int:flight_id>', 'update_flight', self.update_flight, methods=['PATCH', 'PUT', 'OPTIONS'])
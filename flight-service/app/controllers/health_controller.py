@@ -2,7 +2,7 @@
 Health check endpoint for the flight service.
 Add this to your Flask application to verify deployment status.
 """
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 import os
 from datetime import datetime
 
@@ -27,7 +27,8 @@ def health_check():
 def readiness_check():
     """
     Readiness check - verifies if the service is ready to accept traffic.
-    Checks database connectivity.
+    Checks database connectivity and reports whether this process is the
+    leader running the flight scheduler (a standby is still ready).
     """
     checks = {
         'database': False
@@ -44,13 +45,31 @@ def readiness_check():
     
     all_healthy = all(checks.values())
     status_code = 200 if all_healthy else 503
+
+    leader_elector = current_app.extensions.get('leader_elector')
     
     return jsonify({
         'ready': all_healthy,
         'checks': checks,
+        'leadership': leader_elector.get_status() if leader_elector else None,
         'timestamp': datetime.utcnow().isoformat()
     }), status_code
 
+@health_bp.route('/health/tasks', methods=['GET'])
+def task_metrics():
+    """
+    Background task pool metrics - queue depth, wait and run times,
+    rejected and timed-out tasks - for sizing the pool under booking bursts.
+    """
+    task_manager = current_app.extensions.get('task_manager')
+    if task_manager is None:
+        return jsonify({'error': 'Task manager not running'}), 503
+
+    return jsonify({
+        'tasks': task_manager.get_metrics(),
+        'timestamp': datetime.utcnow().isoformat()
+    }), 200
+
 @health_bp.route('/health/live', methods=['GET'])
 def liveness_check():
     """
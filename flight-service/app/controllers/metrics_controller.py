@@ -0,0 +1,16 @@
+"""
+Prometheus scrape endpoint for the flight service.
+Registered without the API prefix, next to the health checks.
+"""
+from flask import Blueprint, Response, current_app
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Per-route request latency, in-flight requests and status codes,
+    gunicorn worker count and database/Redis pool usage.
+    """
+    payload, content_type = current_app.extensions['request_metrics'].render()
+    return Response(payload, content_type=content_type)
@@ -8,11 +8,14 @@ from app.domain.interfaces.services.rating_service_interface import RatingServic
 from app.domain.interfaces.controllers.rating_controller_interface import RatingControllerInterface
 from .validators.rating_validator import validate_create_rating_data, validate_update_rating_data
 from .validators.header_validator import validate_user_id_header
+from .validators.pagination_validator import validate_count_mode
+from app.infrastructure.serialization import CompiledSerializer
 from app.utils.logger_service import get_logger, LoggerService
 import time
 
 logger = get_logger(__name__)
 rating_bp = Blueprint('rating', __name__)
+rating_serializer = CompiledSerializer(RatingResponseDTO)
 
 
 class RatingController(RatingControllerInterface):
@@ -75,10 +78,9 @@ class RatingController(RatingControllerInterface):
                                        flight_id=rating.flight_id,
                                        rating_value=rating.rating)
         
-        response_dto = RatingResponseDTO()
         duration_ms = (time.time() - start_time) * 1000
         LoggerService.log_response(logger, 'POST', '/ratings', 201, duration_ms, rating_id=rating.id)
-        return jsonify(response_dto.dump(rating)), 201
+        return jsonify(rating_serializer.dump(rating)), 201
 
     def update_rating(self, rating_id: int):
         """
@@ -114,8 +116,7 @@ class RatingController(RatingControllerInterface):
         if not rating:
             return jsonify({'error': 'Failed to update rating. Check if rating exists and belongs to you.'}), 400
 
-        response_dto = RatingResponseDTO()
-        return jsonify(response_dto.dump(rating)), 200
+        return jsonify(rating_serializer.dump(rating)), 200
 
     def get_rating(self, rating_id: int):
         """
@@ -132,8 +133,41 @@ class RatingController(RatingControllerInterface):
         if not rating:
             return jsonify({'error': 'Rating not found'}), 404
 
-        response_dto = RatingResponseDTO()
-        return jsonify(response_dto.dump(rating))
+        return jsonify(rating_serializer.dump(rating))
+
+    def get_flight_rating_summary(self, flight_id: int):
+        """
+        GET /flights/<int:flight_id>/rating-summary
+        Retrieves the rating count, sum, average and histogram of a flight.
+
+        Args:
+            flight_id (int): The flight ID from the URL.
+
+        Returns:
+            tuple: JSON response with the summary or error message, and HTTP status code.
+        """
+        summary = self.rating_service.get_flight_rating_summary(flight_id)
+        if summary is None:
+            return jsonify({'error': 'Flight not found'}), 404
+
+        return jsonify({'flight_id': flight_id, **summary}), 200
+
+    def get_airline_rating_summary(self, airline_id: int):
+        """
+        GET /airlines/<int:airline_id>/rating-summary
+        Retrieves the rating count, sum, average and histogram over all flights of an airline.
+
+        Args:
+            airline_id (int): The airline ID from the URL.
+
+        Returns:
+            tuple: JSON response with the summary or error message, and HTTP status code.
+        """
+        summary = self.rating_service.get_airline_rating_summary(airline_id)
+        if summary is None:
+            return jsonify({'error': 'Airline not found'}), 404
+
+        return jsonify({'airline_id': airline_id, **summary}), 200
 
     def get_user_ratings(self, user_id: int):
         """
@@ -146,6 +180,8 @@ class RatingController(RatingControllerInterface):
         Query parameters:
             page (int): Page number (default: 1)
             per_page (int): Items per page (default: 10)
+            cursor (str): Opt-in keyset pagination; empty for the first page, then the returned next_cursor
+            count (str): How total is computed: exact (default), cached or estimated
 
         Returns:
             Response: JSON response with paginated list of user ratings.
@@ -159,15 +195,25 @@ class RatingController(RatingControllerInterface):
         if per_page < 1 or per_page > 100:
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
 
-        result = self.rating_service.get_user_ratings(user_id, page, per_page)
-        response_dto = RatingResponseDTO(many=True)
+        try:
+            count_mode = validate_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        cursor = request.args.get('cursor')
+        try:
+            result = self.rating_service.get_user_ratings(user_id, page, per_page, cursor, count_mode)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
 
         return jsonify({
-            'ratings': response_dto.dump(result['ratings']),
+            'ratings': rating_serializer.dump_many(result['ratings']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
-            'pages': result['pages']
+            'pages': result['pages'],
+            'next_cursor': result.get('next_cursor'),
+            'total_mode': result.get('total_mode')
         })
 
     def get_all_ratings(self):
@@ -178,6 +224,8 @@ class RatingController(RatingControllerInterface):
         Query parameters:
             page (int): Page number (default: 1)
             per_page (int): Items per page (default: 10)
+            cursor (str): Opt-in keyset pagination; empty for the first page, then the returned next_cursor
+            count (str): How total is computed: exact (default), cached or estimated
 
         Returns:
             Response: JSON response with paginated list of all ratings.
@@ -191,15 +239,25 @@ class RatingController(RatingControllerInterface):
         if per_page < 1 or per_page > 100:
             return jsonify({'error': 'Per page must be between 1 and 100'}), 400
 
-        result = self.rating_service.get_all_ratings(page, per_page)
-        response_dto = RatingResponseDTO(many=True)
+        try:
+            count_mode = validate_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 400
+
+        cursor = request.args.get('cursor')
+        try:
+            result = self.rating_service.get_all_ratings(page, per_page, cursor, count_mode)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
 
         return jsonify({
-            'ratings': response_dto.dump(result['ratings']),
+            'ratings': rating_serializer.dump_many(result['ratings']),
             'page': result['page'],
             'per_page': result['per_page'],
             'total': result['total'],
-            'pages': result['pages']
+            'pages': result['pages'],
+            'next_cursor': result.get('next_cursor'),
+            'total_mode': result.get('total_mode')
         })
 
     def delete_rating(self, rating_id: int):
@@ -226,4 +284,6 @@ class RatingController(RatingControllerInterface):
         bp.add_url_rule('/ratings', 'get_all_ratings', self.get_all_ratings, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/ratings/<int:rating_id>', 'get_rating', self.get_rating, methods=['GET', 'OPTIONS'])
         bp.add_url_rule('/users/<int:user_id>/ratings', 'get_user_ratings', self.get_user_ratings, methods=['GET', 'OPTIONS'])
-        bp.add_url_rule('/ratings/<int:rating_id>', 'delete_rating', self.delete_rating, methods=['DELETE', 'OPTIONS'])
\ No newline at end of file
+        bp.add_url_rule('/ratings/<int:rating_id>', 'delete_rating', self.delete_rating, methods=['DELETE', 'OPTIONS'])
+        bp.add_url_rule('/flights/<int:flight_id>/rating-summary', 'get_flight_rating_summary', self.get_flight_rating_summary, methods=['GET', 'OPTIONS'])
+        bp.add_url_rule('/airlines/<int:airline_id>/rating-summary', 'get_airline_rating_summary', self.get_airline_rating_summary, methods=['GET', 'OPTIONS'])
\ No newline at end of file
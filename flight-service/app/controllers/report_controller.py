@@ -8,6 +8,7 @@ from app.domain.interfaces.services.report_service_interface import ReportServic
 from app.domain.interfaces.controllers.report_controller_interface import ReportControllerInterface
 from app.controllers.validators.header_validator import validate_admin_id_header
 from app.controllers.validators.report_validator import validate_report_data
+from app.infrastructure.tasks.task_manager import TaskQueueFullError
 from app.utils.logger_service import get_logger, LoggerService
 from datetime import datetime
 import time
@@ -27,14 +28,15 @@ class ReportController(ReportControllerInterface):
     def generate_flight_report(self):
         """
         POST /reports/flights
-        Generate PDF report for flights (ADMINISTRATOR only)
+        Start a PDF report job for flights (ADMINISTRATOR only)
         
         Request body:
         {
             "report_types": ["upcoming", "in_progress", "completed"]
         }
         
-        Response: PDF file (application/pdf)
+        Response: ReportJob JSON - 202 while rendering (poll GET /reports/jobs/<job_id>),
+        200 when an identical report for unchanged data is cached
         """
         start_time = time.time()
         LoggerService.log_request(logger, 'POST', '/reports/flights')
@@ -71,41 +73,85 @@ class ReportController(ReportControllerInterface):
                                      error='Validation failed')
             return jsonify(e.args[0]), 400
         
-        # Generate PDF report
+        # Start (or join) the report job
         try:
-            pdf_bytes = self.report_service.generate_flight_report(report_types)
-            
-            LoggerService.log_business_event(logger, 'REPORT_GENERATED',
-                                           admin_id=admin_id,
-                                           report_types=report_types,
-                                           size_bytes=len(pdf_bytes))
-            
-            # Create filename with timestamp
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"flight_report_{timestamp}.pdf"
-            
+            job = self.report_service.submit_flight_report(report_types)
+        except TaskQueueFullError as e:
             duration_ms = (time.time() - start_time) * 1000
-            LoggerService.log_response(logger, 'POST', '/reports/flights', 200, duration_ms,
-                                     filename=filename)
-            
-            # Return PDF as response
-            return Response(
-                pdf_bytes,
-                mimetype='application/pdf',
-                headers={
-                    'Content-Disposition': f'attachment; filename="{filename}"',
-                    'Content-Type': 'application/pdf'
-                }
-            )
+            LoggerService.log_response(logger, 'POST', '/reports/flights', 503, duration_ms,
+                                     error='Task queue full')
+            return jsonify({'error': 'Report queue is full, try again later', 'details': str(e)}), 503
         except Exception as e:
             duration_ms = (time.time() - start_time) * 1000
-            LoggerService.log_with_context(logger, 'ERROR', 'Failed to generate report',
+            LoggerService.log_with_context(logger, 'ERROR', 'Failed to submit report job',
                                          error=str(e),
                                          admin_id=admin_id)
             LoggerService.log_response(logger, 'POST', '/reports/flights', 500, duration_ms,
                                      error='Report generation failed')
             return jsonify({'error': 'Failed to generate report', 'details': str(e)}), 500
 
+        LoggerService.log_business_event(logger, 'REPORT_REQUESTED',
+                                       admin_id=admin_id,
+                                       report_types=report_types,
+                                       job_id=job['job_id'],
+                                       cached=job['cached'])
+
+        # 200 when the PDF is already cached, 202 while it is being rendered
+        status_code = 200 if job['cached'] else 202
+        duration_ms = (time.time() - start_time) * 1000
+        LoggerService.log_response(logger, 'POST', '/reports/flights', status_code, duration_ms,
+                                 job_id=job['job_id'])
+        return jsonify(job), status_code
+
+    def get_report_job(self, job_id: str):
+        """
+        GET /reports/jobs/<job_id>
+        Get the state of a report job (ADMINISTRATOR only)
+
+        Response: ReportJob JSON; status is pending, processing, completed or failed
+        """
+        try:
+            validate_admin_id_header(request.headers.get('admin-id'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 401
+
+        job = self.report_service.get_report_job(job_id)
+        if job is None:
+            return jsonify({'error': 'Report job not found'}), 404
+        return jsonify(job), 200
+
+    def download_report(self, job_id: str):
+        """
+        GET /reports/jobs/<job_id>/pdf
+        Download the PDF of a completed report job (ADMINISTRATOR only)
+
+        Response: PDF file (application/pdf); 409 while the job is still running
+        """
+        try:
+            validate_admin_id_header(request.headers.get('admin-id'))
+        except ValueError as e:
+            return jsonify(e.args[0]), 401
+
+        pdf_bytes = self.report_service.get_report_pdf(job_id)
+        if pdf_bytes is None:
+            job = self.report_service.get_report_job(job_id)
+            if job is not None and job['status'] in ('pending', 'processing'):
+                return jsonify({'error': 'Report is not ready yet', 'status': job['status']}), 409
+            return jsonify({'error': 'Report not found or expired'}), 404
+
+        # Create filename with timestamp
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        filename = f"flight_report_{timestamp}.pdf"
+
+        return Response(
+            pdf_bytes,
+            mimetype='application/pdf',
+            headers={
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Type': 'application/pdf'
+            }
+        )
+
     def register_routes(self, blueprint: Blueprint):
         """Register all report routes"""
         blueprint.add_url_rule(
@@ -114,6 +160,18 @@ class ReportController(ReportControllerInterface):
             self.generate_flight_report,
             methods=['POST', 'OPTIONS']
         )
+        blueprint.add_url_rule(
+            '/reports/jobs/<string:job_id>',
+            'get_report_job',
+            self.get_report_job,
+            methods=['GET']
+        )
+        blueprint.add_url_rule(
+            '/reports/jobs/<string:job_id>/pdf',
+            'download_report',
+            self.download_report,
+            methods=['GET']
+        )
 
 
 def create_report_controller(report_service: ReportServiceInterface) -> ReportController:
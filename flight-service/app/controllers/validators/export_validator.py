@@ -0,0 +1,28 @@
+"""
+Export query parameter validation utilities for controllers
+"""
+from typing import Optional
+from app.domain.enums.export_format import ExportFormat
+
+
+def validate_export_format(format_str: Optional[str]) -> ExportFormat:
+    """
+    Validates the ?format= query parameter of export endpoints.
+
+    Args:
+        format_str: The format query parameter value (csv or parquet)
+
+    Returns:
+        ExportFormat: The requested format, CSV when not given
+
+    Raises:
+        ValueError: If the value is not a known export format
+    """
+    if not format_str:
+        return ExportFormat.CSV
+
+    try:
+        return ExportFormat(format_str.lower())
+    except ValueError:
+        valid_formats = [export_format.value for export_format in ExportFormat]
+        raise ValueError({'error': f'Invalid export format. Must be one of: {", ".join(valid_formats)}'})
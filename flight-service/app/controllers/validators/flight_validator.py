@@ -1,6 +1,7 @@
 from marshmallow import Schema, fields, validate, validates, ValidationError, validates_schema
 from ...domain.dtos.flight_dto import FlightCreateDTO, FlightUpdateDTO, FlightStatusUpdateDTO
 from typing import Dict, Any, cast, Optional
+from werkzeug.datastructures import MultiDict
 from datetime import datetime, timezone
 from ...domain.enums.flight_status import FlightStatus
 
@@ -124,4 +125,35 @@ def validate_cancel_flight_data(admin_id: int, cancellation_reason: Optional[str
     return {
         'admin_id': admin_id,
         'cancellation_reason': cancellation_reason
-    }
\ No newline at end of file
+    }
+
+def extract_flight_filters(args: MultiDict) -> Dict[str, Any]:
+    """
+    Collect the optional flight list filters from query parameters.
+
+    Shared by GET /flights and the flight export so both accept the same filters.
+
+    Args:
+        args: The request query parameters (request.args)
+
+    Returns:
+        Dict: The filters that were given, empty when none
+    """
+    filters: Dict[str, Any] = {}
+    if args.get('flight_name'):
+        filters['flight_name'] = args.get('flight_name')
+    if args.get('airline_id'):
+        filters['airline_id'] = args.get('airline_id', type=int)
+    if args.get('status'):
+        filters['status'] = args.get('status')
+    if args.get('departure_airport_id'):
+        filters['departure_airport_id'] = args.get('departure_airport_id', type=int)
+    if args.get('arrival_airport_id'):
+        filters['arrival_airport_id'] = args.get('arrival_airport_id', type=int)
+    if args.get('min_price'):
+        filters['min_price'] = args.get('min_price', type=float)
+    if args.get('max_price'):
+        filters['max_price'] = args.get('max_price', type=float)
+    if args.get('departure_date'):
+        filters['departure_date'] = args.get('departure_date')
+    return filters
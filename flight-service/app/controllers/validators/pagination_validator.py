@@ -0,0 +1,28 @@
+"""
+Pagination query parameter validation utilities for controllers
+"""
+from typing import Optional
+from app.domain.enums.count_mode import CountMode
+
+
+def validate_count_mode(count_str: Optional[str]) -> CountMode:
+    """
+    Validates the ?count= query parameter of paginated listings.
+
+    Args:
+        count_str: The count query parameter value (exact, cached or estimated)
+
+    Returns:
+        CountMode: The requested count mode, EXACT when not given
+
+    Raises:
+        ValueError: If the value is not a known count mode
+    """
+    if not count_str:
+        return CountMode.EXACT
+
+    try:
+        return CountMode(count_str.lower())
+    except ValueError:
+        valid_modes = [mode.value for mode in CountMode]
+        raise ValueError({'error': f'Invalid count mode. Must be one of: {", ".join(valid_modes)}'})
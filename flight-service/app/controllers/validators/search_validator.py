@@ -0,0 +1,35 @@
+"""
+Search query parameter validation utilities for controllers
+"""
+from typing import Optional, Tuple
+
+MAX_SEARCH_TERM_LENGTH = 100
+MAX_SEARCH_LIMIT = 50
+
+
+def validate_search_params(term: Optional[str], limit: Optional[int]) -> Tuple[str, int]:
+    """
+    Validates the ?q= and ?limit= query parameters of the search endpoints.
+
+    Args:
+        term: The search term
+        limit: Maximum number of results (default 10)
+
+    Returns:
+        Tuple[str, int]: The stripped search term and the result limit
+
+    Raises:
+        ValueError: If the term is missing or too long, or the limit is out of range
+    """
+    term = (term or '').strip()
+    if not term:
+        raise ValueError({'error': 'Query parameter q is required'})
+    if len(term) > MAX_SEARCH_TERM_LENGTH:
+        raise ValueError({'error': f'Query parameter q must be at most {MAX_SEARCH_TERM_LENGTH} characters'})
+
+    if limit is None:
+        limit = 10
+    if limit < 1 or limit > MAX_SEARCH_LIMIT:
+        raise ValueError({'error': f'Limit must be between 1 and {MAX_SEARCH_LIMIT}'})
+
+    return term, limit
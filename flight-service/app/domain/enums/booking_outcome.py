@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class BookingOutcome(Enum):
+    """Result of an attempt to book a seat on a flight."""
+    CREATED = "CREATED"
+    INVALID_REQUEST = "INVALID_REQUEST"
+    FLIGHT_NOT_FOUND = "FLIGHT_NOT_FOUND"
+    NOT_BOOKABLE = "NOT_BOOKABLE"
+    SOLD_OUT = "SOLD_OUT"
+    DUPLICATE = "DUPLICATE"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CountMode(Enum):
+    """How the total of a paginated listing is computed."""
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ExportFormat(Enum):
+    """File format of a streaming data export."""
+    CSV = "csv"
+    PARQUET = "parquet"
@@ -0,0 +1 @@
+"""Caching interfaces - Domain layer"""
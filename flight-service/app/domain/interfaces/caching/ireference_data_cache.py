@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from app.domain.models.flights import Flight
+
+
+class IReferenceDataCache(ABC):
+    """Airports and airlines kept in memory for validation and response hydration"""
+
+    @abstractmethod
+    def has_airport(self, airport_id: int) -> bool:
+        """Whether the airport exists"""
+
+    @abstractmethod
+    def has_airline(self, airline_id: int) -> bool:
+        """Whether the airline exists"""
+
+    @abstractmethod
+    def hydrate_flights(self, flights: Iterable[Optional[Flight]]) -> None:
+        """Fill in the airline and airports of flights loaded without them"""
+
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """Digest of the cached rows, for tagging responses hydrated from them"""
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Tell every process that airports or airlines changed"""
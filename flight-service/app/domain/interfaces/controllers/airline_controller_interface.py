@@ -15,6 +15,10 @@ class AirlineControllerInterface(ABC):
     def get_all_airlines(self) -> Any:
         pass
 
+    @abstractmethod
+    def search_airlines(self) -> Any:
+        pass
+
     @abstractmethod
     def update_airline(self, airline_id: int) -> Any:
         pass
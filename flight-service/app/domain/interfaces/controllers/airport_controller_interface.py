@@ -15,6 +15,10 @@ class AirportControllerInterface(ABC):
     def get_all_airports(self) -> Any:
         pass
 
+    @abstractmethod
+    def search_airports(self) -> Any:
+        pass
+
     @abstractmethod
     def update_airport(self, airport_id: int) -> Any:
         pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+class ExportControllerInterface(ABC):
+    @abstractmethod
+    def export_flights(self) -> Any:
+        pass
+
+    @abstractmethod
+    def export_bookings(self) -> Any:
+        pass
+
+    @abstractmethod
+    def export_ratings(self) -> Any:
+        pass
@@ -19,6 +19,10 @@ class FlightControllerInterface(ABC):
     def get_all_flights(self) -> Any:
         pass
 
+    @abstractmethod
+    def search_flights(self) -> Any:
+        pass
+
     @abstractmethod
     def update_flight_status(self, flight_id: int) -> Any:
         pass
@@ -25,4 +25,12 @@ class RatingControllerInterface(ABC):
 
     @abstractmethod
     def delete_rating(self, rating_id: int) -> Any:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_flight_rating_summary(self, flight_id: int) -> Any:
+        pass
+
+    @abstractmethod
+    def get_airline_rating_summary(self, airline_id: int) -> Any:
+        pass
@@ -4,4 +4,12 @@ from typing import Any
 class ReportControllerInterface(ABC):
     @abstractmethod
     def generate_flight_report(self) -> Any:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_report_job(self, job_id: str) -> Any:
+        pass
+
+    @abstractmethod
+    def download_report(self, job_id: str) -> Any:
+        pass
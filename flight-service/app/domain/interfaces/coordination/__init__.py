@@ -0,0 +1 @@
+"""Cross-process coordination interfaces - Domain layer"""
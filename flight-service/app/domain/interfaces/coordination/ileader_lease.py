@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class ILeaderLease(ABC):
+    """A lease that at most one process holds at a time"""
+
+    @abstractmethod
+    def try_acquire(self) -> bool:
+        """Take the lease if nobody holds it; returns True if this process now holds it"""
+
+    @abstractmethod
+    def renew(self) -> bool:
+        """Extend a held lease; returns False if it was lost"""
+
+    @abstractmethod
+    def release(self) -> None:
+        """Give up the lease so a standby can take over at once"""
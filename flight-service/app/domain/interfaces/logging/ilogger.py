@@ -24,3 +24,11 @@ class ILogger(ABC):
     @abstractmethod
     def critical(self, message: str, **context) -> None:
         """Log critical message with optional context"""
+    
+    @abstractmethod
+    def log(self, level: str, message: str, **context) -> None:
+        """Log a message at a level given by name ('DEBUG', 'INFO', ...)"""
+    
+    @abstractmethod
+    def is_enabled_for(self, level: str) -> bool:
+        """Whether a message at this level would be emitted; check before building costly messages"""
@@ -0,0 +1 @@
+"""Report storage and rendering interfaces - Domain layer"""
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+from app.domain.types.report_types import ReportBlock
+
+
+class IReportRenderer(ABC):
+    """Interface for turning a report layout into a PDF document"""
+
+    @abstractmethod
+    def render(self, blocks: List[ReportBlock]) -> bytes:
+        """Lay out the blocks in order and return the PDF file as bytes"""
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Release any worker processes"""
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.types.report_types import ReportJob
+
+
+class IReportStore(ABC):
+    """Interface for the storage of report jobs and their rendered PDFs, keyed by job id"""
+
+    @abstractmethod
+    def create_job(self, job: ReportJob) -> bool:
+        """Store a new job unless one with the same id exists; returns False if it already did"""
+
+    @abstractmethod
+    def save_job(self, job: ReportJob) -> None:
+        """Store or overwrite a job"""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[ReportJob]:
+        """Get a job, or None if it never existed or expired"""
+
+    @abstractmethod
+    def delete_job(self, job_id: str) -> None:
+        """Forget a job that could not be started"""
+
+    @abstractmethod
+    def save_pdf(self, job_id: str, pdf_bytes: bytes) -> None:
+        """Store a rendered PDF, expiring after the store's result TTL"""
+
+    @abstractmethod
+    def get_pdf(self, job_id: str) -> Optional[bytes]:
+        """Get a rendered PDF, or None if it is not (or no longer) cached"""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, List, TypedDict
+from sqlalchemy import Row
 from app.domain.models.flights import Airline
 
 
@@ -24,6 +25,15 @@ class IAirlineRepository(ABC):
     def get_airline_by_name(self, name: str) -> Optional[Airline]:
         pass
 
+    @abstractmethod
+    def search_airlines(self, term: str, limit: int = 10) -> List[Airline]:
+        pass
+
+    @abstractmethod
+    def get_reference_rows(self) -> List[Row]:
+        """Every airline's columns, without ORM instances (reference data cache)"""
+        pass
+
     @abstractmethod
     def get_all_airlines(self, page: int = 1, per_page: int = 10) -> AirlinePaginationResult:
         pass
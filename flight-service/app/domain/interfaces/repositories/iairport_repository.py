@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List, TypedDict
+from sqlalchemy import Row
 from app.domain.models.flights import Airport
 
 class AirportPaginationResult(TypedDict):
@@ -23,6 +24,15 @@ class IAirportRepository(ABC):
     def get_airport_by_code(self, airport_code: str) -> Optional[Airport]:
         pass
 
+    @abstractmethod
+    def search_airports(self, term: str, limit: int = 10) -> List[Airport]:
+        pass
+
+    @abstractmethod
+    def get_reference_rows(self) -> List[Row]:
+        """Every airport's columns, without ORM instances (reference data cache)"""
+        pass
+
     @abstractmethod
     def get_all_airports(self, page: int = 1, per_page: int = 10) -> AirportPaginationResult:
         pass
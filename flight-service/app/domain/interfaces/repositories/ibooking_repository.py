@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, TypedDict
+from typing import Dict, Iterator, Optional, List, Tuple, TypedDict, NotRequired
+from datetime import datetime
+from sqlalchemy import Row
 from app.domain.models.flights import Booking
+from app.domain.enums.count_mode import CountMode
+from app.domain.enums.booking_outcome import BookingOutcome
 
 
 class BookingPaginationResult(TypedDict):
@@ -9,6 +13,8 @@ class BookingPaginationResult(TypedDict):
     per_page: int
     total: int
     pages: int
+    next_cursor: NotRequired[Optional[str]]
+    total_mode: NotRequired[str]
 
 
 class IBookingRepository(ABC):
@@ -16,16 +22,27 @@ class IBookingRepository(ABC):
     def save_booking(self, booking: Booking) -> Booking:
         pass
 
+    @abstractmethod
+    def reserve_seat(self, user_id: int, flight_id: int, now: datetime) -> Tuple[BookingOutcome, Optional[Booking]]:
+        """Atomically check seat availability and book one seat (now is naive UTC)"""
+
+    @abstractmethod
+    def get_booked_flight_arrival_time(self, user_id: int, flight_id: int) -> Optional[datetime]:
+        """Arrival time of the flight if the user has booked it, None otherwise"""
+        pass
+
     @abstractmethod
     def get_booking_by_id(self, booking_id: int) -> Optional[Booking]:
         pass
 
     @abstractmethod
-    def get_bookings_by_user(self, user_id: int, page: int = 1, per_page: int = 10) -> BookingPaginationResult:
+    def get_bookings_by_user(self, user_id: int, page: int = 1, per_page: int = 10,
+                             cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> BookingPaginationResult:
         pass
 
     @abstractmethod
-    def get_all_bookings(self, page: int = 1, per_page: int = 10) -> BookingPaginationResult:
+    def get_all_bookings(self, page: int = 1, per_page: int = 10,
+                         cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> BookingPaginationResult:
         pass
 
     @abstractmethod
@@ -38,4 +55,9 @@ class IBookingRepository(ABC):
 
     @abstractmethod
     def delete_booking(self, booking_id: int) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_bookings_for_export(self, filters: Optional[Dict] = None, batch_size: int = 5000) -> Iterator[List[Row]]:
+        """Stream flat booking rows, optionally filtered by user_id and flight_id, in batches"""
+        pass
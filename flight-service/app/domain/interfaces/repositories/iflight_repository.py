@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List, TypedDict
+from typing import Iterator, Optional, Dict, List, TypedDict, NotRequired
 from datetime import datetime
+from sqlalchemy import Row
 from app.domain.models.flights import Flight
-from ...types.repository_types import FlightUpdateData
+from app.domain.models.enums import FlightStatus
+from app.domain.enums.count_mode import CountMode
+from ...types.repository_types import FlightUpdateData, FlightTransition
 
 class FlightPaginationResult(TypedDict):
     flights: List[Flight]
@@ -10,6 +13,8 @@ class FlightPaginationResult(TypedDict):
     per_page: int
     total: int
     pages: int
+    next_cursor: NotRequired[Optional[str]]
+    total_mode: NotRequired[str]
 
 
 class IFlightRepository(ABC):
@@ -22,8 +27,13 @@ class IFlightRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all_flights(self, page: int = 1, per_page: int = 10, filters: Optional[Dict] = None) -> FlightPaginationResult:
-        pass
+    def search_flights(self, term: str, limit: int = 10, filters: Optional[Dict] = None) -> List[Flight]:
+        """Fuzzy flight name search ranked by trigram similarity"""
+
+    @abstractmethod
+    def get_all_flights(self, page: int = 1, per_page: int = 10, filters: Optional[Dict] = None,
+                        cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
+        """Page by offset, or by keyset when a cursor is given ('' for the first page)"""
 
     @abstractmethod
     def update_flight(self, flight: Flight) -> Optional[Flight]:
@@ -50,6 +60,13 @@ class IFlightRepository(ABC):
     def get_flights_by_status(self, status: str, page: int = 1, per_page: int = 10) -> FlightPaginationResult:
         """Get flights filtered by status"""
     
+    @abstractmethod
+    def get_flights_by_statuses(self, statuses: List[FlightStatus], page: int = 1, per_page: int = 10,
+                                filters: Optional[Dict] = None, departure_after: Optional[datetime] = None,
+                                order_by: str = 'departure_time', descending: bool = False,
+                                count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
+        """Get one ordered page of flights in any of the given statuses (departure_time > departure_after if given)"""
+    
     @abstractmethod
     def get_flights_to_start(self, current_time: datetime) -> List[Flight]:
         """Get approved flights that should start (departure_time <= current_time)"""
@@ -57,7 +74,27 @@ class IFlightRepository(ABC):
     @abstractmethod
     def get_flights_to_complete(self, current_time: datetime) -> List[Flight]:
         """Get in-progress flights that should complete (arrival_time <= current_time)"""
+
+    @abstractmethod
+    def start_due_flights(self, current_time: datetime, batch_size: int = 1000) -> List[FlightTransition]:
+        """Move up to batch_size due APPROVED flights to IN_PROGRESS in one statement and return them"""
+
+    @abstractmethod
+    def complete_due_flights(self, current_time: datetime, batch_size: int = 1000) -> List[FlightTransition]:
+        """Move up to batch_size due IN_PROGRESS flights to COMPLETED in one statement and return them"""
+
+    @abstractmethod
+    def has_due_transitions(self, current_time: datetime) -> bool:
+        """Whether an APPROVED flight has departed or an IN_PROGRESS flight has arrived by current_time"""
+
+    @abstractmethod
+    def get_transition_deadlines(self, current_time: datetime, until: datetime, limit: int = 10000) -> List[datetime]:
+        """Upcoming departure times of APPROVED and arrival times of IN_PROGRESS flights in (current_time, until], earliest first"""
     
     @abstractmethod
     def get_flight_price(self, flight_id: int) -> Optional[float]:
         """Get the price of a flight"""
+
+    @abstractmethod
+    def iter_flights_for_export(self, filters: Optional[Dict] = None, batch_size: int = 5000) -> Iterator[List[Row]]:
+        """Stream flat flight rows (with airline name and airport codes) matching the listing filters, in batches"""
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, TypedDict
+from typing import Dict, Iterator, Optional, List, TypedDict, NotRequired
+from sqlalchemy import Row
 from app.domain.models.flights import Rating
+from app.domain.enums.count_mode import CountMode
+from app.domain.types.rating_types import RatingSummary
 
 
 class RatingPaginationResult(TypedDict):
@@ -9,6 +12,8 @@ class RatingPaginationResult(TypedDict):
     per_page: int
     total: int
     pages: int
+    next_cursor: NotRequired[Optional[str]]
+    total_mode: NotRequired[str]
 
 
 class IRatingRepository(ABC):
@@ -16,18 +21,40 @@ class IRatingRepository(ABC):
     def save_rating(self, rating: Rating) -> Rating:
         pass
 
+    @abstractmethod
+    def create_rating(self, rating: Rating) -> Optional[Rating]:
+        """Insert a new rating; None if the user already rated the flight (unique_user_flight_rating)"""
+        pass
+
     @abstractmethod
     def get_rating_by_id(self, rating_id: int) -> Optional[Rating]:
         pass
 
     @abstractmethod
-    def get_ratings_by_user(self, user_id: int, page: int = 1, per_page: int = 10) -> RatingPaginationResult:
+    def get_ratings_by_user(self, user_id: int, page: int = 1, per_page: int = 10,
+                            cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
         pass
 
     @abstractmethod
-    def get_all_ratings(self, page: int = 1, per_page: int = 10) -> RatingPaginationResult:
+    def get_all_ratings(self, page: int = 1, per_page: int = 10,
+                        cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
         pass
 
     @abstractmethod
     def delete_rating(self, rating_id: int) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_ratings_for_export(self, filters: Optional[Dict] = None, batch_size: int = 5000) -> Iterator[List[Row]]:
+        """Stream flat rating rows, optionally filtered by user_id and flight_id, in batches"""
+        pass
+
+    @abstractmethod
+    def get_flight_rating_summary(self, flight_id: int) -> Optional[RatingSummary]:
+        """Maintained rating aggregate of a flight; None if the flight does not exist"""
+        pass
+
+    @abstractmethod
+    def get_airline_rating_summary(self, airline_id: int) -> Optional[RatingSummary]:
+        """Maintained rating aggregate of an airline; None if the airline does not exist"""
+        pass
@@ -1,37 +1,71 @@
 from abc import ABC, abstractmethod
-from typing import List
-from app.domain.models.flights import Flight
+from typing import Any, Dict, List, Optional
+from sqlalchemy import Row
+from app.domain.types.report_types import ReportSectionSummary
 
 
 class IReportRepository(ABC):
     """Interface for report data repository"""
 
     @abstractmethod
-    def get_upcoming_flights(self) -> List[Flight]:
+    def get_upcoming_flights(self) -> List[Row]:
         """
         Get all upcoming flights (APPROVED status, not yet departed).
         
         Returns:
-            List of Flight objects with eager-loaded relationships (airline, airports)
+            Rows of flight_name, airline_name, departure_code, arrival_code,
+            departure_time, arrival_time, flight_duration, flight_distance_km,
+            price, total_seats, created_by
         """
         pass
 
     @abstractmethod
-    def get_in_progress_flights(self) -> List[Flight]:
+    def get_in_progress_flights(self) -> List[Row]:
         """
         Get all in-progress flights (IN_PROGRESS status).
         
         Returns:
-            List of Flight objects with eager-loaded relationships (airline, airports)
+            Rows of flight_name, airline_name, departure_code, arrival_code,
+            departure_time, arrival_time, actual_start_time, flight_duration,
+            flight_distance_km, price
         """
         pass
 
     @abstractmethod
-    def get_completed_flights(self) -> List[Flight]:
+    def get_completed_flights(self, limit: Optional[int] = None) -> List[Row]:
         """
-        Get all completed and cancelled flights (COMPLETED or CANCELLED status).
+        Get completed and cancelled flights (COMPLETED or CANCELLED status), most recently updated first.
         
+        Args:
+            limit: Maximum number of rows (None for all)
+
+        Returns:
+            Rows of flight_name, airline_name, departure_code, arrival_code,
+            departure_time, arrival_time, price, status, updated_at
+        """
+        pass
+
+    @abstractmethod
+    def get_report_summary(self) -> Dict[str, ReportSectionSummary]:
+        """
+        Get count, revenue and seats of every report section in one aggregate query.
+
+        Returns:
+            Dict keyed by 'upcoming', 'in_progress', 'completed' and 'cancelled'
+        """
+        pass
+
+    @abstractmethod
+    def get_report_fingerprint(self, report_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a cheap fingerprint of the data behind each report section.
+
+        Args:
+            report_types: Report sections ('upcoming', 'in_progress', 'completed')
+
         Returns:
-            List of Flight objects with eager-loaded relationships (airline, airports)
+            Dict of section -> {'count': rows in the section, 'updated_at': latest
+            updated_at ISO timestamp}, plus 'reference_versions': the airlines and
+            airports table versions; it changes whenever the printed rows do
         """
         pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable
+
+
+class ITableVersionRepository(ABC):
+    """Interface for the per-table change counters backing conditional GETs"""
+
+    @abstractmethod
+    def get_versions(self, tables: Iterable[str]) -> Dict[str, int]:
+        """
+        Get the current change counter of each table.
+
+        Args:
+            tables: Table names
+
+        Returns:
+            Version per table name; tables never written since the counters were created are 0
+        """
+        pass
@@ -0,0 +1 @@
+"""Flight scheduler interfaces - Domain layer"""
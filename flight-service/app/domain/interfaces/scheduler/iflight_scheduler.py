@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from app.domain.models.flights import Flight
+
+
+class IFlightScheduler(ABC):
+    """Automatic flight status transitions, re-armed when a flight's schedule changes"""
+
+    @abstractmethod
+    def reschedule(self, flight: Flight) -> None:
+        """Tell the scheduler a flight was approved, rescheduled or cancelled"""
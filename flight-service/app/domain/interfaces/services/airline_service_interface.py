@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from app.domain.models.flights import Airline
 from app.domain.dtos.airline_dto import AirlineCreateDTO, AirlineUpdateDTO
 from app.domain.interfaces.repositories.iairline_repository import AirlinePaginationResult
@@ -14,6 +14,10 @@ class AirlineServiceInterface(ABC):
     def get_airline(self, airline_id: int) -> Optional[Airline]:
         """Retrieve an airline by ID."""
 
+    @abstractmethod
+    def search_airlines(self, term: str, limit: int = 10) -> List[Airline]:
+        """Fuzzy search airlines by name, best matches first."""
+
     @abstractmethod
     def get_all_airlines(self, page: int, per_page: int) -> AirlinePaginationResult:
         """Retrieve all airlines with pagination."""
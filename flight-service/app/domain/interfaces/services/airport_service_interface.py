@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from app.domain.dtos.airport_dto import AirportCreateDTO, AirportUpdateDTO
 from app.domain.models.flights import Airport
 from app.domain.interfaces.repositories.iairport_repository import AirportPaginationResult
@@ -14,6 +14,10 @@ class AirportServiceInterface(ABC):
     def get_airport(self, airport_id: int) -> Optional[Airport]:
         """Retrieve an airport by ID."""
 
+    @abstractmethod
+    def search_airports(self, term: str, limit: int = 10) -> List[Airport]:
+        """Fuzzy search airports by name, best matches first."""
+
     @abstractmethod
     def get_all_airports(self, page: int = 1, per_page: int = 10) -> AirportPaginationResult:
         """Retrieve all airports with pagination."""
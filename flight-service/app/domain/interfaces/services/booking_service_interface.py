@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.domain.models.flights import Booking
 from app.domain.dtos.booking_dto import BookingCreateDTO, BookingDTO
 from app.domain.interfaces.repositories.ibooking_repository import BookingPaginationResult
+from app.domain.enums.count_mode import CountMode
+from app.domain.enums.booking_outcome import BookingOutcome
 from ...types.task_types import TaskStatus
 
 class BookingServiceInterface(ABC):
@@ -11,11 +13,14 @@ class BookingServiceInterface(ABC):
         """Retrieve a booking by ID."""
 
     @abstractmethod
-    def get_user_bookings(self, user_id: int, page: int, per_page: int) -> BookingPaginationResult:
+    def get_user_bookings(self, user_id: int, page: int, per_page: int,
+                          cursor: Optional[str] = None,
+                          count_mode: CountMode = CountMode.EXACT) -> BookingPaginationResult:
         """Retrieve all bookings for a user with pagination."""
 
     @abstractmethod
-    def get_all_bookings(self, page: int, per_page: int) -> BookingPaginationResult:
+    def get_all_bookings(self, page: int, per_page: int, cursor: Optional[str] = None,
+                         count_mode: CountMode = CountMode.EXACT) -> BookingPaginationResult:
         """Retrieve all bookings with pagination."""
 
     @abstractmethod
@@ -27,7 +32,7 @@ class BookingServiceInterface(ABC):
         """Delete a booking by ID."""
 
     @abstractmethod
-    def create_booking(self, user_id: int, booking_data: BookingCreateDTO) -> Optional[BookingDTO]:
+    def create_booking(self, user_id: int, booking_data: BookingCreateDTO) -> Tuple[BookingOutcome, Optional[BookingDTO]]:
         """
         Creates a booking and returns the booking details as a BookingDTO.
         
@@ -36,7 +41,8 @@ class BookingServiceInterface(ABC):
             booking_data (BookingCreateDTO): Validated booking creation data.
         
         Returns:
-            Optional[BookingDTO]: BookingDTO with booking details if successful, None otherwise.
+            Tuple[BookingOutcome, Optional[BookingDTO]]: The outcome (CREATED, SOLD_OUT, DUPLICATE, ...)
+            and the BookingDTO with booking details when CREATED, None otherwise.
         """
 
     @abstractmethod
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, Optional
+from app.domain.enums.export_format import ExportFormat
+
+
+class ExportServiceInterface(ABC):
+    """Interface for streaming data exports"""
+
+    @abstractmethod
+    def is_format_available(self, export_format: ExportFormat) -> bool:
+        """Whether the format can be written in this deployment (Parquet needs pyarrow)"""
+        pass
+
+    @abstractmethod
+    def export_flights(self, export_format: ExportFormat, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        """
+        Stream flights matching the GET /flights filters as an encoded file.
+
+        Args:
+            export_format: CSV or Parquet
+            filters: The same optional filters as get_all_flights
+
+        Returns:
+            Iterator of file chunks, produced one database batch at a time
+        """
+        pass
+
+    @abstractmethod
+    def export_bookings(self, export_format: ExportFormat, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        """
+        Stream bookings as an encoded file.
+
+        Args:
+            export_format: CSV or Parquet
+            filters: Optional user_id / flight_id filters
+
+        Returns:
+            Iterator of file chunks, produced one database batch at a time
+        """
+        pass
+
+    @abstractmethod
+    def export_ratings(self, export_format: ExportFormat, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        """
+        Stream ratings as an encoded file.
+
+        Args:
+            export_format: CSV or Parquet
+            filters: Optional user_id / flight_id filters
+
+        Returns:
+            Iterator of file chunks, produced one database batch at a time
+        """
+        pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from app.domain.models.flights import Flight
 from app.domain.dtos.flight_dto import DeleteFlightDTO, FlightCreateDTO, FlightUpdateDTO, FlightStatusUpdateDTO, FlightUpdateDTO
 from app.domain.interfaces.repositories.iflight_repository import FlightPaginationResult
+from app.domain.enums.count_mode import CountMode
 
 class FlightServiceInterface(ABC):
     @abstractmethod
@@ -18,8 +19,13 @@ class FlightServiceInterface(ABC):
         """Retrieve a flight by ID."""
 
     @abstractmethod
-    def get_all_flights(self, page: int, per_page: int, filters: Optional[Dict] = None) -> FlightPaginationResult:
-        """Retrieve all flights with pagination and filters."""
+    def search_flights(self, term: str, limit: int = 10, filters: Optional[Dict] = None) -> List[Flight]:
+        """Fuzzy search flights by name, best matches first."""
+
+    @abstractmethod
+    def get_all_flights(self, page: int, per_page: int, filters: Optional[Dict] = None,
+                        cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
+        """Retrieve all flights with offset or cursor pagination and filters."""
 
     @abstractmethod
     def update_flight_status(self, flight_id: int, data: FlightStatusUpdateDTO, admin_id: int) -> Optional[Flight]:
@@ -34,7 +40,8 @@ class FlightServiceInterface(ABC):
         """Get available seats for a flight."""
     
     @abstractmethod
-    def get_flights_by_tab(self, tab: str, page: int, per_page: int, filters: Optional[Dict] = None) -> FlightPaginationResult:
+    def get_flights_by_tab(self, tab: str, page: int, per_page: int, filters: Optional[Dict] = None,
+                           count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
         """Get flights by tab (upcoming, in-progress, completed/cancelled)."""
     
     @abstractmethod
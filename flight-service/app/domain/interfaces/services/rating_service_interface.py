@@ -3,6 +3,8 @@ from typing import Optional
 from app.domain.models.flights import Rating
 from app.domain.dtos.rating_dto import RatingCreateDTO, RatingUpdateDTO
 from app.domain.interfaces.repositories.irating_repository import RatingPaginationResult
+from app.domain.enums.count_mode import CountMode
+from app.domain.types.rating_types import RatingSummary
 
 class RatingServiceInterface(ABC):
     @abstractmethod
@@ -18,13 +20,24 @@ class RatingServiceInterface(ABC):
         """Retrieve a rating by ID."""
 
     @abstractmethod
-    def get_user_ratings(self, user_id: int, page: int, per_page: int) -> RatingPaginationResult:
+    def get_user_ratings(self, user_id: int, page: int, per_page: int,
+                         cursor: Optional[str] = None,
+                         count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
         """Retrieve all ratings for a user with pagination."""
 
     @abstractmethod
-    def get_all_ratings(self, page: int, per_page: int) -> RatingPaginationResult:
+    def get_all_ratings(self, page: int, per_page: int, cursor: Optional[str] = None,
+                        count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
         """Retrieve all ratings with pagination."""
 
     @abstractmethod
     def delete_rating(self, rating_id: int) -> bool:
         """Delete a rating by ID."""
+
+    @abstractmethod
+    def get_flight_rating_summary(self, flight_id: int) -> Optional[RatingSummary]:
+        """Retrieve the rating aggregate of a flight; None if the flight does not exist."""
+
+    @abstractmethod
+    def get_airline_rating_summary(self, airline_id: int) -> Optional[RatingSummary]:
+        """Retrieve the rating aggregate of an airline; None if the airline does not exist."""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
+from app.domain.types.report_types import ReportJob
 
 
 class ReportServiceInterface(ABC):
@@ -17,3 +18,37 @@ class ReportServiceInterface(ABC):
             PDF file as bytes
         """
         pass
+
+    @abstractmethod
+    def submit_flight_report(self, report_types: List[str]) -> ReportJob:
+        """
+        Start a background job rendering the report, or return the cached or
+        already running job for the same report types and data.
+
+        Args:
+            report_types: List of report types to include ('upcoming', 'in_progress', 'completed')
+
+        Returns:
+            ReportJob with the job id to poll
+        """
+        pass
+
+    @abstractmethod
+    def get_report_job(self, job_id: str) -> Optional[ReportJob]:
+        """
+        Get the state of a report job.
+
+        Returns:
+            ReportJob, or None if the job is unknown or expired
+        """
+        pass
+
+    @abstractmethod
+    def get_report_pdf(self, job_id: str) -> Optional[bytes]:
+        """
+        Get the rendered PDF of a completed report job.
+
+        Returns:
+            PDF file as bytes, or None if it is not ready or expired
+        """
+        pass
@@ -0,0 +1 @@
+"""Task queue interfaces - Domain layer"""
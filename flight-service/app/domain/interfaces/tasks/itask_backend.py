@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from app.domain.types.task_types import TaskStatus
+
+
+class ITaskBackend(ABC):
+    """Interface for the storage behind the background task queue and its results"""
+
+    # Durable backends share tasks across processes and survive restarts, so task
+    # functions must be registered by name and arguments must be JSON serializable
+    durable: bool = False
+
+    @property
+    @abstractmethod
+    def capacity(self) -> int:
+        """Maximum number of queued tasks"""
+
+    @abstractmethod
+    def enqueue(self, task: Dict[str, Any]) -> bool:
+        """Queue a task by its priority; returns False when the queue is full"""
+
+    @abstractmethod
+    def dequeue(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Block up to timeout seconds for the next task and reserve it until ack or its visibility timeout"""
+
+    @abstractmethod
+    def ack(self, task_id: str) -> None:
+        """Mark a reserved task as done so it is not redelivered"""
+
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """Put reserved tasks whose visibility timeout passed back on the queue; returns how many"""
+
+    @abstractmethod
+    def depth(self) -> int:
+        """Number of queued (not yet reserved) tasks"""
+
+    @abstractmethod
+    def save_status(self, task_id: str, status: TaskStatus) -> None:
+        """Store a task status, expiring after the backend's result TTL"""
+
+    @abstractmethod
+    def get_status(self, task_id: str) -> Optional[TaskStatus]:
+        """Get a stored task status, None if unknown or expired"""
+
+    @abstractmethod
+    def delete_status(self, task_id: str) -> None:
+        """Forget a task status"""
+
+    @abstractmethod
+    def cleanup(self) -> int:
+        """Evict expired task statuses; returns how many were removed"""
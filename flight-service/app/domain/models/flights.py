@@ -84,6 +84,11 @@ class Booking(db.Model):
     flight_id: Mapped[int] = db.Column(db.Integer, db.ForeignKey('flights.flight_id', ondelete='CASCADE'))
     purchased_at: Mapped[datetime] = db.Column(db.DateTime, default=db.func.current_timestamp())
 
+    # One booking per user per flight
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'flight_id', name='unique_user_flight_booking'),
+    )
+
     def __init__(self, user_id: int, flight_id: int, **kwargs):
         super().__init__(**kwargs)
         self.user_id = user_id
@@ -114,4 +119,43 @@ class Rating(db.Model):
         self.rating = rating
 
     # Relationship
-    flight = db.relationship('Flight', backref='ratings')
\ No newline at end of file
+    flight = db.relationship('Flight', backref='ratings')
+
+class FlightRatingSummary(db.Model):
+    """Per-flight rating aggregate, maintained by the ratings_summary database triggers (read-only here)"""
+    __tablename__ = 'flight_rating_summaries'
+
+    flight_id: Mapped[int] = db.Column(db.Integer, db.ForeignKey('flights.flight_id', ondelete='CASCADE'), primary_key=True)
+    airline_id: Mapped[Optional[int]] = db.Column(db.Integer, db.ForeignKey('airlines.id', ondelete='CASCADE'))
+    rating_count: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_1: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_2: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_3: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_4: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_5: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = db.Column(db.DateTime, default=db.func.current_timestamp())
+
+
+class AirlineRatingSummary(db.Model):
+    """Per-airline rating aggregate, maintained by the ratings_summary database triggers (read-only here)"""
+    __tablename__ = 'airline_rating_summaries'
+
+    airline_id: Mapped[int] = db.Column(db.Integer, db.ForeignKey('airlines.id', ondelete='CASCADE'), primary_key=True)
+    rating_count: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_1: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_2: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_3: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_4: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    rating_5: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = db.Column(db.DateTime, default=db.func.current_timestamp())
+
+
+class TableVersion(db.Model):
+    """One slot of a table's change counter, bumped by the *_version database triggers (read-only here)"""
+    __tablename__ = 'table_versions'
+
+    table_name: Mapped[str] = db.Column(db.String(63), primary_key=True)
+    slot: Mapped[int] = db.Column(db.SmallInteger, primary_key=True)
+    version: Mapped[int] = db.Column(db.BigInteger, nullable=False, default=0)
@@ -1,5 +1,7 @@
 from .task_types import TaskStatus, TaskResult
 from .websocket_types import FlightNotificationData
-from .repository_types import FlightUpdateData
+from .repository_types import FlightUpdateData, FlightTransition
+from .report_types import ReportJob, ReportSectionSummary
+from .rating_types import RatingSummary
 
-__all__ = ['TaskStatus', 'TaskResult', 'FlightNotificationData', 'FlightUpdateData']
+__all__ = ['TaskStatus', 'TaskResult', 'FlightNotificationData', 'FlightUpdateData', 'FlightTransition', 'ReportJob', 'ReportSectionSummary', 'RatingSummary']
@@ -0,0 +1,9 @@
+from typing import Dict, Optional, TypedDict
+
+
+class RatingSummary(TypedDict):
+    """Rating aggregate of a flight or an airline"""
+    count: int
+    sum: int
+    average: Optional[float]  # None while there are no ratings
+    histogram: Dict[str, int]  # '1'..'5' -> number of ratings with that value
@@ -0,0 +1,29 @@
+from typing import Any, List, Literal, Optional, Tuple, TypedDict
+
+
+ReportJobStatusType = Literal['pending', 'processing', 'completed', 'failed']
+
+ReportBlockKind = Literal['title', 'section', 'text', 'spacer', 'table']
+
+# One element of a report layout: ('title' | 'section' | 'text', markup), ('spacer', height in inches)
+# or ('table', rows with the header first). Plain data, so it pickles cheaply to render processes.
+ReportBlock = Tuple[ReportBlockKind, Any]
+
+
+class ReportSectionSummary(TypedDict):
+    """Aggregates of one report section"""
+    count: int
+    revenue: float  # sum of price * total_seats
+    seats: int
+
+
+class ReportJob(TypedDict, total=False):
+    """Type definition for a report generation job; job_id is the report's cache key"""
+    job_id: str
+    status: ReportJobStatusType
+    report_types: List[str]
+    created_at: str
+    completed_at: Optional[str]
+    size_bytes: Optional[int]
+    error: Optional[str]
+    cached: bool
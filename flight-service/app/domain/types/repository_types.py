@@ -15,3 +15,11 @@ class FlightUpdateData(TypedDict, total=False):
     price: Decimal
     total_seats: int
     rejection_reason: str
+
+
+class FlightTransition(TypedDict):
+    """Row returned for each flight moved by a bulk status transition"""
+    flight_id: int
+    flight_name: str
+    departure_time: datetime
+    arrival_time: datetime
@@ -1,7 +1,7 @@
 from typing import TypedDict, Optional, Literal
 
 
-TaskStatusType = Literal['pending', 'processing', 'completed', 'failed', 'not_found']
+TaskStatusType = Literal['pending', 'processing', 'completed', 'failed', 'timed_out', 'not_found']
 
 
 class TaskStatus(TypedDict, total=False):
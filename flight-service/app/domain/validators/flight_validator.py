@@ -1,4 +1,5 @@
 from typing import Dict, Optional
+from datetime import date
 from ..models.enums import FlightStatus
 
 
@@ -25,6 +26,12 @@ class FlightValidator:
         if ('min_price' in cleaned and 'max_price' in cleaned and 
             cleaned['min_price'] > cleaned['max_price']):
             cleaned['min_price'], cleaned['max_price'] = cleaned['max_price'], cleaned['min_price']
+
+        if 'departure_date' in cleaned and not isinstance(cleaned['departure_date'], date):
+            try:
+                cleaned['departure_date'] = date.fromisoformat(str(cleaned['departure_date']))
+            except ValueError:
+                del cleaned['departure_date']
         
         return cleaned
 
@@ -0,0 +1,19 @@
+from .conditional_get import (
+    FLIGHT_LIST_TABLES,
+    FLIGHT_TABLES,
+    REFERENCE_DATA,
+    ConditionalGet,
+    conditional_get,
+    exact_count_requested
+)
+from .reference_data import ReferenceDataCache
+
+__all__ = [
+    'FLIGHT_LIST_TABLES',
+    'FLIGHT_TABLES',
+    'REFERENCE_DATA',
+    'ConditionalGet',
+    'conditional_get',
+    'exact_count_requested',
+    'ReferenceDataCache'
+]
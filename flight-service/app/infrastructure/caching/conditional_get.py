@@ -0,0 +1,119 @@
+"""
+Conditional GET - Infrastructure Layer
+Strong ETags for read endpoints, derived from the change counters of the
+tables a response is built from (maintained by the *_version database
+triggers) rather than from the response body, so a client revalidating
+with If-None-Match gets a 304 before anything is queried, hydrated or
+serialized.
+
+The versions are read before the view runs: a write landing in between
+can only make the body newer than its ETag, which costs the client one
+extra refetch, never a stale 304. Responses whose airlines and airports
+come from the reference data cache list REFERENCE_DATA instead of those
+tables, and are tagged with the cached rows' fingerprint: a process still
+serving the previous names must not label them with the new versions.
+"""
+import hashlib
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+from flask import Flask, Response, current_app, make_response, request
+
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
+from app.domain.interfaces.repositories.itable_version_repository import ITableVersionRepository
+
+# Airlines and airports as hydrated into flights (by the reference data cache when there is one)
+REFERENCE_DATA = 'reference_data'
+REFERENCE_TABLES = ('airlines', 'airports')
+
+# Flight listings embed airline and airport names and per-flight booked seats
+FLIGHT_LIST_TABLES = ('flights', 'bookings', REFERENCE_DATA)
+FLIGHT_TABLES = ('flights', REFERENCE_DATA)
+
+EXTENSION_KEY = 'conditional_get'
+
+
+class ConditionalGet:
+    """Computes request ETags from table versions"""
+
+    def __init__(self, version_repository: ITableVersionRepository, representation: str = '',
+                 reference_max_age: int = 60, reference_data: Optional[IReferenceDataCache] = None):
+        """
+        Args:
+            version_repository: Source of the per-table change counters
+            representation: Folded into every ETag (e.g. the app version), so a
+                deploy that changes a response's JSON invalidates the old tags
+            reference_max_age: Seconds clients may reuse reference data
+                (airports, airlines) before revalidating
+            reference_data: The cache flights are hydrated from, if any
+        """
+        self.version_repository = version_repository
+        self.representation = representation
+        self.reference_max_age = reference_max_age
+        self.reference_data = reference_data
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions[EXTENSION_KEY] = self
+
+    def etag(self, tables: Iterable[str]) -> str:
+        """ETag of the current request's response given the tables it reads"""
+        tables = set(tables)
+        hydrated = REFERENCE_DATA in tables and self.reference_data is not None
+        if REFERENCE_DATA in tables:
+            tables.discard(REFERENCE_DATA)
+            if not hydrated:
+                tables.update(REFERENCE_TABLES)
+        versions = sorted(self.version_repository.get_versions(tables).items())
+        if hydrated:
+            versions.append((REFERENCE_DATA, self.reference_data.fingerprint()))
+        key = repr((self.representation, request.path, sorted(request.args.items(multi=True)), versions))
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def cache_control(self, reference_data: bool) -> str:
+        # no-cache still lets clients keep the body, but they revalidate before every use
+        return f'public, max-age={self.reference_max_age}' if reference_data else 'no-cache'
+
+
+def exact_count_requested() -> bool:
+    """Cached and estimated totals change without a version bump, so only exact listings are tagged"""
+    return request.args.get('count', 'exact').lower() in ('', 'exact')
+
+
+def conditional_get(tables: Iterable[str], reference_data: bool = False,
+                    when: Optional[Callable[[], bool]] = None):
+    """
+    Tag a GET view's 200 responses with an ETag computed from tables and
+    answer a matching If-None-Match with 304 without calling the view.
+
+    Args:
+        tables: Tables the response is built from
+        reference_data: Rarely changing data clients may reuse for a while
+            without revalidating; everything else must be revalidated
+        when: Optional predicate; the view runs untagged when it returns False
+
+    Views run as is when the app has no ConditionalGet (e.g. a database
+    without the version triggers).
+    """
+    tables = tuple(tables)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            conditional = current_app.extensions.get(EXTENSION_KEY)
+            if conditional is None or request.method != 'GET' or (when is not None and not when()):
+                return view(*args, **kwargs)
+
+            etag = conditional.etag(tables)
+            if request.if_none_match.contains_weak(etag):
+                not_modified = Response(status=304)
+                not_modified.set_etag(etag)
+                not_modified.headers['Cache-Control'] = conditional.cache_control(reference_data)
+                return not_modified
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = conditional.cache_control(reference_data)
+            return response
+        return wrapper
+    return decorator
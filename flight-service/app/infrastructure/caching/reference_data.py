@@ -0,0 +1,196 @@
+"""
+Reference data cache - Infrastructure Layer
+Airports and airlines rarely change but are read on almost every flight
+request: to validate new and updated flights, and nested (name, code) in
+every flight response. Each process keeps both tables in memory, checks
+flight references against them and attaches them to loaded flights, so
+flight queries no longer join airlines and airports twice.
+
+AirportService and AirlineService bump a Redis version key after each
+committed write. Every process compares it with the version its snapshot
+was loaded under at most once per check_interval and reloads when it
+moved. Snapshots are also reloaded after max_age seconds, which bounds
+staleness when Redis is unavailable or a table is changed outside the
+services.
+"""
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import Row
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
+from app.domain.interfaces.repositories.iairline_repository import IAirlineRepository
+from app.domain.interfaces.repositories.iairport_repository import IAirportRepository
+from app.domain.models.flights import Airline, Airport, Flight
+from app.utils.logger_service import get_logger, LoggerService
+
+logger = get_logger(__name__)
+
+
+class _Snapshot:
+    """Immutable rows of both tables by id; replaced whole on reload, so readers never lock"""
+
+    __slots__ = ('airports', 'airlines', 'version', 'generation', 'loaded_at', 'fingerprint')
+
+    def __init__(self, airports: Dict[int, Row], airlines: Dict[int, Row], version: Optional[str],
+                 generation: int, loaded_at: float):
+        self.airports = airports
+        self.airlines = airlines
+        self.version = version
+        self.generation = generation
+        self.loaded_at = loaded_at
+        # Same in every process holding the same rows, unlike version (None without Redis) or loaded_at
+        content = repr((sorted(tuple(row) for row in airports.values()), sorted(tuple(row) for row in airlines.values())))
+        self.fingerprint = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class ReferenceDataCache(IReferenceDataCache):
+    """Versioned per-process copy of the airports and airlines tables"""
+
+    def __init__(self, airport_repository: IAirportRepository, airline_repository: IAirlineRepository,
+                 redis_client: Optional[Any] = None, version_key: str = 'flight-service:reference-data:version',
+                 check_interval: float = 1.0, max_age: float = 300.0):
+        """
+        Args:
+            airport_repository: Source of the airport rows
+            airline_repository: Source of the airline rows
+            redis_client: Shares the version across processes (None: each process only sees its own writes)
+            version_key: Redis key incremented on every airport or airline write
+            check_interval: Seconds between version checks
+            max_age: Seconds after which a snapshot is reloaded whatever the version
+        """
+        self.airport_repository = airport_repository
+        self.airline_repository = airline_repository
+        self.redis_client = redis_client
+        self.version_key = version_key
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._checked_at = float('-inf')
+        # Bumped by local invalidations, so one racing a reload still forces the next
+        self._generation = 1
+        self._snapshot = _Snapshot({}, {}, None, 0, float('-inf'))
+
+    def load(self) -> None:
+        """Load both tables now (at startup), instead of on first use"""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._reload(self._read_version())
+
+    def has_airport(self, airport_id: int) -> bool:
+        if airport_id in self._current().airports:
+            return True
+        return self._confirm(self.airport_repository.get_airport_by_id(airport_id))
+
+    def has_airline(self, airline_id: int) -> bool:
+        if airline_id in self._current().airlines:
+            return True
+        return self._confirm(self.airline_repository.get_airline_by_id(airline_id))
+
+    def hydrate_flights(self, flights: Iterable[Optional[Flight]]) -> None:
+        """
+        Attach airline and airports as if they had been loaded with the flights.
+
+        Every call builds its own detached instances, shared by its flights:
+        ORM instances belong to one session and thread, so the cache only
+        shares immutable rows. Ids missing from the snapshot stay unloaded
+        and load lazily from the database.
+        """
+        snapshot = self._current()
+        airlines: Dict[int, Optional[Airline]] = {}
+        airports: Dict[int, Optional[Airport]] = {}
+        for flight in flights:
+            if flight is None:
+                continue
+            self._attach(flight, 'airline', 'airline_id', snapshot.airlines, airlines, self._airline)
+            self._attach(flight, 'departure_airport', 'departure_airport_id', snapshot.airports, airports, self._airport)
+            self._attach(flight, 'arrival_airport', 'arrival_airport_id', snapshot.airports, airports, self._airport)
+
+    def fingerprint(self) -> str:
+        return self._current().fingerprint
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._checked_at = float('-inf')
+        if self.redis_client is None:
+            return
+        try:
+            self.redis_client.incr(self.version_key)
+        except Exception as e:
+            LoggerService.log_with_context(logger, 'WARNING',
+                                          'Could not publish reference data change, other processes reload within max_age',
+                                          error=str(e), max_age=self.max_age)
+
+    def _current(self) -> _Snapshot:
+        now = time.monotonic()
+        # Other threads keep serving the current snapshot while one checks or reloads
+        if now - self._checked_at >= self.check_interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked_at = now
+                version = self._read_version()
+                snapshot = self._snapshot
+                if (version != snapshot.version or snapshot.generation != self._generation
+                        or now - snapshot.loaded_at >= self.max_age):
+                    self._reload(version)
+            finally:
+                self._lock.release()
+        return self._snapshot
+
+    def _read_version(self) -> Optional[str]:
+        if self.redis_client is None:
+            return None
+        try:
+            return self.redis_client.get(self.version_key)
+        except Exception as e:
+            LoggerService.log_with_context(logger, 'WARNING', 'Could not read reference data version', error=str(e))
+            return self._snapshot.version
+
+    def _reload(self, version: Optional[str]) -> None:
+        # Read the version and generation first: a write committed meanwhile triggers another reload
+        generation = self._generation
+        try:
+            airports = {row.id: row for row in self.airport_repository.get_reference_rows()}
+            airlines = {row.id: row for row in self.airline_repository.get_reference_rows()}
+        except Exception as e:
+            LoggerService.log_with_context(logger, 'WARNING', 'Could not load reference data, keeping the previous snapshot',
+                                          error=str(e))
+            return
+        self._snapshot = _Snapshot(airports, airlines, version, generation, time.monotonic())
+        LoggerService.log_with_context(logger, 'DEBUG', 'Reference data loaded',
+                                      airports=len(airports), airlines=len(airlines), version=version)
+
+    def _confirm(self, found: Optional[Any]) -> bool:
+        """A reference missing from the snapshot was checked in the database; if it exists the snapshot is behind"""
+        if found is None:
+            return False
+        self._generation += 1
+        self._checked_at = float('-inf')
+        return True
+
+    @staticmethod
+    def _attach(flight: Flight, relationship: str, column: str, rows: Dict[int, Row],
+                built: Dict[int, Any], build: Callable[[Row], Any]) -> None:
+        if relationship in flight.__dict__:
+            return
+        key = getattr(flight, column)
+        if key not in built:
+            row = rows.get(key)
+            built[key] = build(row) if row is not None else None
+        if built[key] is not None:
+            set_committed_value(flight, relationship, built[key])
+
+    @staticmethod
+    def _airport(row: Row) -> Airport:
+        airport = Airport(name=row.name, code=row.code, id=row.id, created_at=row.created_at)
+        make_transient_to_detached(airport)
+        return airport
+
+    @staticmethod
+    def _airline(row: Row) -> Airline:
+        airline = Airline(name=row.name, id=row.id, created_at=row.created_at)
+        make_transient_to_detached(airline)
+        return airline
@@ -0,0 +1,6 @@
+from .leader_elector import LeaderElector
+from .local_lease import LocalLease
+from .postgres_lease import PostgresAdvisoryLease
+from .redis_lease import RedisLeaderLease
+
+__all__ = ['LeaderElector', 'LocalLease', 'PostgresAdvisoryLease', 'RedisLeaderLease']
@@ -0,0 +1,123 @@
+"""
+Leader election - runs singleton background work in exactly one process
+"""
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.domain.interfaces.coordination.ileader_lease import ILeaderLease
+from app.utils.logger_service import get_logger, LoggerService
+
+logger = get_logger(__name__)
+
+
+class LeaderElector:
+    """
+    Campaigns for a lease and runs the registered callbacks on leadership changes.
+
+    Every gunicorn worker and replica runs an elector; the one holding the
+    lease is the leader and the others stand by, retrying every
+    renew_interval seconds so one of them takes over when the leader dies or
+    loses the lease. renew_interval must stay well below the lease TTL.
+    """
+
+    def __init__(self, lease: ILeaderLease, name: str, renew_interval: float = 5):
+        self.lease = lease
+        self.name = name
+        self.renew_interval = renew_interval
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+        self.running = threading.Event()
+        self.elector_thread: Optional[threading.Thread] = None
+        self._callbacks: List[Tuple[Callable[[], None], Callable[[], None]]] = []
+        self._is_leader = False
+        self._leader_since: Optional[datetime] = None
+        self._transitions = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def register(self, on_elected: Callable[[], None], on_demoted: Callable[[], None]) -> None:
+        """Run on_elected when this process becomes leader and on_demoted when it stops being one"""
+        self._callbacks.append((on_elected, on_demoted))
+
+    def start(self):
+        """Start campaigning for leadership"""
+        if not self.running.is_set():
+            self.running.set()
+            self.elector_thread = threading.Thread(target=self._run, name=f"leader-{self.name}", daemon=True)
+            self.elector_thread.start()
+
+    def stop(self):
+        """Step down and stop campaigning"""
+        self.running.clear()
+        if self.elector_thread and self.elector_thread.is_alive():
+            self.elector_thread.join(timeout=self.renew_interval + 5)
+
+    def _run(self):
+        while self.running.is_set():
+            self._campaign()
+            self._sleep(self.renew_interval)
+        if self._is_leader:
+            self._demote('stopped')
+            try:
+                self.lease.release()
+            except Exception as e:
+                LoggerService.log_error(logger, e, {'operation': 'release_leadership', 'role': self.name})
+
+    def _campaign(self):
+        try:
+            held = self.lease.renew() if self._is_leader else self.lease.try_acquire()
+            self._last_error = None
+        except Exception as e:
+            self._last_error = str(e)
+            LoggerService.log_error(logger, e, {'operation': 'leader_election', 'role': self.name})
+            held = False
+
+        if held and not self._is_leader:
+            self._elect()
+        elif not held and self._is_leader:
+            self._demote('lease lost')
+
+    def _elect(self):
+        self._is_leader = True
+        self._leader_since = datetime.now(timezone.utc)
+        self._transitions += 1
+        LoggerService.log_business_event(logger, 'LEADER_ELECTED', role=self.name, identity=self.identity)
+        for on_elected, _ in self._callbacks:
+            try:
+                on_elected()
+            except Exception as e:
+                LoggerService.log_error(logger, e, {'operation': 'on_elected', 'role': self.name})
+
+    def _demote(self, reason: str):
+        self._is_leader = False
+        self._leader_since = None
+        self._transitions += 1
+        LoggerService.log_business_event(logger, 'LEADER_DEMOTED', role=self.name,
+                                         identity=self.identity, reason=reason)
+        for _, on_demoted in reversed(self._callbacks):
+            try:
+                on_demoted()
+            except Exception as e:
+                LoggerService.log_error(logger, e, {'operation': 'on_demoted', 'role': self.name})
+
+    def _sleep(self, seconds: float):
+        deadline = time.monotonic() + seconds
+        while self.running.is_set() and time.monotonic() < deadline:
+            time.sleep(min(1.0, seconds))
+
+    def get_status(self) -> Dict[str, Any]:
+        """Leadership state of this process for the readiness endpoint"""
+        return {
+            'role': self.name,
+            'leader': self._is_leader,
+            'identity': self.identity,
+            'lease': type(self.lease).__name__,
+            'leader_since': self._leader_since.isoformat() if self._leader_since else None,
+            'transitions': self._transitions,
+            'last_error': self._last_error
+        }
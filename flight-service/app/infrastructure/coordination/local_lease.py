@@ -0,0 +1,17 @@
+"""
+Process-local lease - the fallback when neither Redis nor PostgreSQL is available
+"""
+from app.domain.interfaces.coordination.ileader_lease import ILeaderLease
+
+
+class LocalLease(ILeaderLease):
+    """Always held; only correct for a single process (e.g. the development server)"""
+
+    def try_acquire(self) -> bool:
+        return True
+
+    def renew(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
@@ -0,0 +1,71 @@
+"""
+PostgreSQL advisory lock lease - held by a dedicated session for as long as it is alive
+"""
+import zlib
+from typing import Optional
+from app.domain.interfaces.coordination.ileader_lease import ILeaderLease
+
+
+class PostgresAdvisoryLease(ILeaderLease):
+    """
+    Session-level pg_try_advisory_lock on a connection taken out of the pool.
+
+    The server drops the lock when the session ends, so a crashed owner is
+    replaced as soon as PostgreSQL notices the connection is gone.
+    """
+
+    def __init__(self, app, name: str):
+        self.app = app
+        # Advisory locks are keyed by a bigint; derive a stable one from the name
+        self.lock_id = zlib.crc32(name.encode())
+        self._connection: Optional[object] = None
+
+    def try_acquire(self) -> bool:
+        if self._connection is None:
+            self._connection = self._connect()
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", (self.lock_id,))
+                return bool(cursor.fetchone()[0])
+        except Exception:
+            self._close()
+            raise
+
+    def renew(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except Exception:
+            # The session (and with it the lock) is gone
+            self._close()
+            return False
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", (self.lock_id,))
+        finally:
+            self._close()
+
+    def _connect(self):
+        from app import db
+        from app.infrastructure.database import DIRECT_BIND
+        with self.app.app_context():
+            # Bypasses PgBouncer when it is configured: the session must stay on one server connection
+            pooled = db.engines.get(DIRECT_BIND, db.engine).raw_connection()
+        pooled.detach()
+        connection = pooled.dbapi_connection
+        connection.autocommit = True
+        return connection
+
+    def _close(self):
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
@@ -0,0 +1,47 @@
+"""
+Redis lease - a key holding the owner's token with a TTL that the owner keeps renewing
+"""
+import uuid
+import redis
+from app.domain.interfaces.coordination.ileader_lease import ILeaderLease
+
+# KEYS: lease key; ARGV: token, ttl ms
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS: lease key; ARGV: token
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLeaderLease(ILeaderLease):
+    """
+    Lease that expires ttl seconds after its last renewal, so a crashed owner
+    is replaced within ttl. Renew and release only touch the key while it
+    still holds this process's token.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, ttl: float = 15):
+        self.redis = client
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.token = str(uuid.uuid4())
+        self._renew = client.register_script(_RENEW_SCRIPT)
+        self._release = client.register_script(_RELEASE_SCRIPT)
+
+    def try_acquire(self) -> bool:
+        return bool(self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    def renew(self) -> bool:
+        return bool(self._renew(keys=[self.key], args=[self.token, self.ttl_ms]))
+
+    def release(self) -> None:
+        self._release(keys=[self.key], args=[self.token])
@@ -0,0 +1,20 @@
+from .pool_config import DIRECT_BIND, PoolConfig
+from .replica_routing import (
+    REPLICA_BIND,
+    ReadYourWrites,
+    ReplicaLagMonitor,
+    ReplicaRouter,
+    read_only,
+    read_primary
+)
+
+__all__ = [
+    'DIRECT_BIND',
+    'PoolConfig',
+    'REPLICA_BIND',
+    'ReadYourWrites',
+    'ReplicaLagMonitor',
+    'ReplicaRouter',
+    'read_only',
+    'read_primary'
+]
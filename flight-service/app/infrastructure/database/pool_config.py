@@ -0,0 +1,120 @@
+"""
+Database connection pool configuration - Infrastructure Layer
+Explicit SQLAlchemy pool sizing, pre-ping, recycling and per-connection
+statement / lock timeouts, read from the environment:
+
+    DB_POOL_SIZE (10)               connections kept open per process
+    DB_MAX_OVERFLOW (10)            extra connections opened under load, closed when returned
+    DB_POOL_TIMEOUT (30)            seconds a checkout waits before failing
+    DB_POOL_RECYCLE (1800)          seconds before a connection is replaced
+    DB_POOL_PRE_PING (true)         test connections on checkout, replacing dead ones
+    DB_STATEMENT_TIMEOUT_MS (30000) statement_timeout, 0 to disable
+    DB_LOCK_TIMEOUT_MS (5000)       lock_timeout, 0 to disable
+    DB_PGBOUNCER (false)            connecting through PgBouncer in transaction pooling mode
+
+Behind PgBouncer's transaction pooling a client's transactions may run on
+different server connections, so session state cannot be relied on:
+the timeouts are sent with SET LOCAL at the start of each transaction
+instead of as startup options (which PgBouncer rejects), and LISTEN and
+session advisory locks need a connection that bypasses the pooler
+(DIRECT_BIND, configured from DB2_DIRECT_URL). psycopg2 interpolates
+parameters client side and never creates server-side prepared
+statements, so no driver setting is needed for those.
+"""
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from app.infrastructure.metrics import InstrumentedQueuePool
+
+# Flask-SQLAlchemy bind for session-level features (LISTEN, advisory locks)
+DIRECT_BIND = 'direct'
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class PoolConfig:
+    """Engine options for one PostgreSQL database"""
+
+    def __init__(self, size: int = 10, max_overflow: int = 10, timeout: float = 30, recycle: int = 1800,
+                 pre_ping: bool = True, statement_timeout_ms: int = 30000, lock_timeout_ms: int = 5000,
+                 pgbouncer: bool = False):
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.statement_timeout_ms = statement_timeout_ms
+        self.lock_timeout_ms = lock_timeout_ms
+        self.pgbouncer = pgbouncer
+
+    @classmethod
+    def from_env(cls) -> 'PoolConfig':
+        return cls(
+            size=int(os.environ.get('DB_POOL_SIZE', 10)),
+            max_overflow=int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+            timeout=float(os.environ.get('DB_POOL_TIMEOUT', 30)),
+            recycle=int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+            pre_ping=_env_bool('DB_POOL_PRE_PING', True),
+            statement_timeout_ms=int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 30000)),
+            lock_timeout_ms=int(os.environ.get('DB_LOCK_TIMEOUT_MS', 5000)),
+            pgbouncer=_env_bool('DB_PGBOUNCER', False)
+        )
+
+    def engine_options(self, url: str, connect_timeout: Optional[int] = None) -> Dict[str, Any]:
+        """
+        create_engine() keyword arguments for url (none for non-PostgreSQL databases)
+
+        Args:
+            url: Database URL
+            connect_timeout: Seconds to wait for a new connection (libpq waits indefinitely by default)
+        """
+        if not url.startswith('postgresql'):
+            return {}
+        options: Dict[str, Any] = {
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': self.size,
+            'max_overflow': self.max_overflow,
+            'pool_timeout': self.timeout,
+            'pool_recycle': self.recycle,
+            'pool_pre_ping': self.pre_ping,
+        }
+        connect_args = {} if self.pgbouncer else self._startup_options()
+        if connect_timeout is not None:
+            connect_args['connect_timeout'] = connect_timeout
+        if connect_args:
+            options['connect_args'] = connect_args
+        return options
+
+    def direct_engine_options(self) -> Dict[str, Any]:
+        """Options for the DIRECT_BIND engine: its connections are detached for good, so nothing is pooled"""
+        return {'poolclass': NullPool, 'connect_args': self._startup_options()}
+
+    def instrument(self, engine: Engine) -> None:
+        """Apply the timeouts per transaction when session settings cannot stick (PgBouncer)"""
+        if not self.pgbouncer or engine.dialect.name != 'postgresql' or not self._timeouts():
+            return
+        settings = ', '.join(f"set_config('{name}', '{value}ms', true)" for name, value in self._timeouts().items())
+        statement = f"SELECT {settings}"
+
+        @event.listens_for(engine, 'begin')
+        def set_local_timeouts(conn):
+            conn.exec_driver_sql(statement)
+
+    def _timeouts(self) -> Dict[str, int]:
+        timeouts = {'statement_timeout': self.statement_timeout_ms, 'lock_timeout': self.lock_timeout_ms}
+        return {name: value for name, value in timeouts.items() if value > 0}
+
+    def _startup_options(self) -> Dict[str, str]:
+        timeouts = self._timeouts()
+        if not timeouts:
+            return {}
+        return {'options': ' '.join(f"-c {name}={value}" for name, value in timeouts.items())}
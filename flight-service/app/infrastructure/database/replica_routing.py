@@ -0,0 +1,233 @@
+"""
+Read replica routing - Infrastructure Layer
+Repository methods marked @read_only run on the read replica
+(REPLICA_BIND, configured from DB2_REPLICA_URL) when that is safe:
+
+- only while serving GET/HEAD requests: a write request reads what it is
+  about to change from the primary, and background work outside requests
+  (which may read what its request just wrote) only when the method opts in
+- never once the session has written, so a request reads its own writes
+- never for a caller (user-id / admin-id header) who wrote within the
+  read-your-writes window, whichever process handled the write
+- never while the replica lags past the threshold or cannot be reached
+
+The choice is made once per transaction and can only fall back to the
+primary afterwards, so a response never pairs newer replica rows with
+older primary ones (the ETags rely on this: table versions are read first).
+"""
+import threading
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from flask import Flask, current_app, has_app_context, has_request_context, request
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app import db
+from app.infrastructure.metrics import READ_ROUTING, REPLICA_LAG
+from app.utils.logger_service import get_logger, LoggerService
+
+logger = get_logger(__name__)
+
+REPLICA_BIND = 'replica'
+EXTENSION_KEY = 'replica_router'
+
+# Replay lag in seconds; a replica that has replayed everything it received counts as current
+# even when the primary has been idle, and a database that is not a standby has no lag at all
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+# None outside @read_only methods, else whether background work may use the replica too
+_read_only: ContextVar[Optional[bool]] = ContextVar('read_only', default=None)
+
+
+def read_only(method: Optional[Callable] = None, *, background: bool = False):
+    """
+    Let the statements of a repository method go to the replica (see ReplicaRouter).
+
+    Use as @read_only, or @read_only(background=True) for reads that tolerate
+    the replica's lag when run outside a request (e.g. report rendering).
+    Generator methods are not supported: their statements run after the call returns.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            token = _read_only.set(background)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                _read_only.reset(token)
+        return wrapper
+    return decorator(method) if method is not None else decorator
+
+
+def read_primary(method: Callable) -> Callable:
+    """Keep a method's statements on the primary, even when called from a @read_only one"""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(None)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+    return wrapper
+
+
+def _caller() -> Optional[str]:
+    return request.headers.get('user-id') or request.headers.get('admin-id')
+
+
+class ReplicaLagMonitor:
+    """Replica health, probed at most once per check_interval by whichever thread asks first"""
+
+    def __init__(self, max_lag: float = 5.0, check_interval: float = 1.0):
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at = float('-inf')
+        self._usable = False
+
+    def usable(self, engine: Engine) -> bool:
+        now = time.monotonic()
+        # Other threads keep the previous answer while one probes
+        if now - self._checked_at >= self.check_interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked_at = now
+                self._usable = self._probe(engine)
+            finally:
+                self._lock.release()
+        return self._usable
+
+    def _probe(self, engine: Engine) -> bool:
+        try:
+            with engine.connect() as conn:
+                lag = float(conn.execute(LAG_QUERY).scalar())
+        except Exception as e:
+            if self._usable:
+                LoggerService.log_with_context(logger, 'WARNING', 'Read replica unreachable, reading from the primary',
+                                              error=str(e))
+            return False
+
+        REPLICA_LAG.set(lag)
+        usable = lag <= self.max_lag
+        if self._usable and not usable:
+            LoggerService.log_with_context(logger, 'WARNING', 'Read replica lagging, reading from the primary',
+                                          lag_seconds=round(lag, 3), max_lag_seconds=self.max_lag)
+        return usable
+
+
+class ReadYourWrites:
+    """Callers who wrote within the last window seconds, shared through Redis when it is available"""
+
+    MAX_LOCAL_CALLERS = 10000
+
+    def __init__(self, window: float = 5.0, redis_client: Optional[Any] = None, key_prefix: str = 'flight-service:ryw:'):
+        self.window = window
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._local: Dict[str, float] = {}
+
+    def record(self, caller: str) -> None:
+        if self.redis_client is not None:
+            try:
+                self.redis_client.set(self.key_prefix + caller, 1, px=int(self.window * 1000))
+                return
+            except Exception as e:
+                LoggerService.log_with_context(logger, 'WARNING', 'Could not record write for read-your-writes',
+                                              error=str(e))
+        if len(self._local) >= self.MAX_LOCAL_CALLERS:
+            now = time.monotonic()
+            self._local = {key: until for key, until in self._local.items() if until > now}
+        self._local[caller] = time.monotonic() + self.window
+
+    def is_recent(self, caller: str) -> bool:
+        if self.redis_client is not None:
+            try:
+                if self.redis_client.exists(self.key_prefix + caller):
+                    return True
+            except Exception:
+                # Without the shared record, play it safe
+                return True
+        return self._local.get(caller, 0) > time.monotonic()
+
+
+class ReplicaRouter:
+    """Decides per transaction whether @read_only statements may use the replica"""
+
+    def __init__(self, lag_monitor: ReplicaLagMonitor, read_your_writes: ReadYourWrites):
+        self.lag_monitor = lag_monitor
+        self.read_your_writes = read_your_writes
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions[EXTENSION_KEY] = self
+
+    def use_replica(self, session: Session) -> bool:
+        decision = session.info.get('use_replica')
+        if decision is None:
+            decision, reason = self._decide(session)
+            session.info['use_replica'] = decision
+            READ_ROUTING.labels('replica' if decision else 'primary', reason).inc()
+        return decision
+
+    def _decide(self, session: Session):
+        if session.info.get('wrote'):
+            return False, 'session_wrote'
+        if has_request_context():
+            if request.method not in ('GET', 'HEAD'):
+                return False, 'write_request'
+            caller = _caller()
+            if caller and self.read_your_writes.is_recent(caller):
+                return False, 'read_your_writes'
+        elif not _read_only.get():
+            return False, 'background'
+        if not self.lag_monitor.usable(db.engines[REPLICA_BIND]):
+            return False, 'replica_unavailable'
+        return True, 'read_only'
+
+    def record_write(self, session: Session) -> None:
+        session.info['use_replica'] = False
+        if session.info.get('wrote'):
+            return
+        session.info['wrote'] = True
+        if has_request_context():
+            caller = _caller()
+            if caller:
+                self.read_your_writes.record(caller)
+
+
+# Installed on db.session: the router is looked up per statement, so nothing changes without a replica
+
+@event.listens_for(db.session, 'do_orm_execute')
+def _route_statement(state: ORMExecuteState) -> None:
+    router = current_app.extensions.get(EXTENSION_KEY) if has_app_context() else None
+    if router is None or 'bind' in state.bind_arguments:
+        return
+    session = state.session
+    if state.is_insert or state.is_update or state.is_delete:
+        router.record_write(session)
+    # Pending changes are autoflushed after this hook, and the flush records the write
+    elif _read_only.get() is not None and not (session.new or session.dirty or session.deleted) \
+            and router.use_replica(session):
+        state.bind_arguments['bind'] = db.engines[REPLICA_BIND]
+
+
+@event.listens_for(db.session, 'after_flush')
+def _record_flush(session: Session, flush_context: Any) -> None:
+    router = current_app.extensions.get(EXTENSION_KEY) if has_app_context() else None
+    if router is not None:
+        router.record_write(session)
+
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def _forget_route(session: Session) -> None:
+    # Decide again in the next transaction; 'wrote' keeps a session that wrote on the primary
+    session.info.pop('use_replica', None)
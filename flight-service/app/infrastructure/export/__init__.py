@@ -0,0 +1,3 @@
+from .tabular_writers import ExportColumn, parquet_available, write_csv, write_parquet
+
+__all__ = ['ExportColumn', 'parquet_available', 'write_csv', 'write_parquet']
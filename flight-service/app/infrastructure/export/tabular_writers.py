@@ -0,0 +1,126 @@
+"""
+Streaming CSV / Parquet writers for data exports
+
+Both writers take an iterator of row batches and yield encoded chunks as
+they go, so an export of any size holds one batch (and, for Parquet, one
+row group) in memory at a time. Parquet needs the optional pyarrow package.
+"""
+import csv
+import io
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, NamedTuple, Sequence
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+class ExportColumn(NamedTuple):
+    """An exported column; type is one of int, float, str, bool, datetime"""
+    name: str
+    type: str
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def _plain(value: Any, column_type: str) -> Any:
+    """Convert a database value to the plain Python value of its export column type"""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, timedelta):
+        # Durations are exported in minutes, matching the API
+        return int(value.total_seconds() // 60)
+    if isinstance(value, Decimal) or column_type == 'float':
+        return float(value)
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def write_csv(columns: Sequence[ExportColumn], batches: Iterable[Sequence[Sequence[Any]]]) -> Iterator[bytes]:
+    """Yield a UTF-8 CSV document with a header row, one chunk per batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.name for column in columns])
+
+    for batch in batches:
+        for row in batch:
+            writer.writerow([_csv_value(_plain(value, column.type)) for value, column in zip(row, columns)])
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+
+    remainder = buffer.getvalue()
+    if remainder:
+        # Header of an export without rows
+        yield remainder.encode('utf-8')
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands over what was written since the last drain; tell() keeps the full offset"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(columns: Sequence[ExportColumn]):
+    types = {
+        'int': pyarrow.int64(),
+        'float': pyarrow.float64(),
+        'str': pyarrow.string(),
+        'bool': pyarrow.bool_(),
+        'datetime': pyarrow.timestamp('us')
+    }
+    return pyarrow.schema([(column.name, types[column.type]) for column in columns])
+
+
+def write_parquet(columns: Sequence[ExportColumn], batches: Iterable[Sequence[Sequence[Any]]]) -> Iterator[bytes]:
+    """Yield a Parquet file with one row group per batch; the footer comes with the last chunk"""
+    if pyarrow is None:
+        raise RuntimeError("Parquet export requires the pyarrow package")
+
+    schema = _arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression='snappy')
+    try:
+        for batch in batches:
+            arrays = [
+                pyarrow.array([_plain(row[index], column.type) for row in batch], type=schema.field(index).type)
+                for index, column in enumerate(columns)
+            ]
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
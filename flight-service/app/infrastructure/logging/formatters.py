@@ -28,7 +28,8 @@ class ColoredConsoleFormatter(ILogFormatter, logging.Formatter):
     }
     
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        # Records are formatted on the log listener thread, so stamp them with their creation time
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace('+00:00', 'Z')
         level_color = self.LEVEL_COLORS.get(record.levelname, LogColors.RESET)
         
         parts = [
@@ -1,17 +1,30 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict
 from app.domain.interfaces.logging.ilogger import ILogger
 from app.infrastructure.logging.logger_impl import StructuredLogger
 from app.infrastructure.logging.formatters import ColoredConsoleFormatter, PlainTextFormatter
 
 
+class _InProcessQueueHandler(QueueHandler):
+    """Hands records to the listener as they are; formatting happens on the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so nothing has to be pickled or pre-rendered
+        # (the default prepare formats the message and drops exc_info on the request thread)
+        return record
+
+
 class LogManager:
     """Manages logger initialization and configuration (Singleton)"""
     
     _instance: Optional['LogManager'] = None
     _initialized = False
     _loggers: Dict[str, ILogger] = {}
+    _listener: Optional[QueueListener] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -30,20 +43,36 @@ class LogManager:
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        # Request threads only enqueue records; one listener thread formats and writes them
+        handlers = []
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(ColoredConsoleFormatter())
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         if log_file:
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(numeric_level)
             file_handler.setFormatter(PlainTextFormatter())
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(_InProcessQueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.shutdown)
         
         self._initialized = True
         root_logger.info("Logging system initialized")
     
+    def shutdown(self) -> None:
+        """Write out every queued record and stop the listener thread"""
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+    
     def get_logger(self, name: str) -> ILogger:
         """Get or create a logger instance"""
         if name not in self._loggers:
@@ -1,11 +1,16 @@
 from app.domain.interfaces.logging.ilogger import ILogger
 
+# Every strategy checks the level before building its message, so disabled
+# levels (DEBUG in production) cost no string formatting.
+
 
 class RequestLogStrategy:
     """Strategy for logging HTTP requests"""
     
     @staticmethod
     def log(logger: ILogger, method: str, endpoint: str, **context) -> None:
+        if not logger.is_enabled_for('INFO'):
+            return
         logger.info(
             f"Incoming request: {method} {endpoint}",
             method=method,
@@ -20,8 +25,11 @@ class ResponseLogStrategy:
     @staticmethod
     def log(logger: ILogger, method: str, endpoint: str, status_code: int, 
             duration_ms: float, **context) -> None:
-        level_method = 'info' if status_code < 400 else 'warning' if status_code < 500 else 'error'
-        getattr(logger, level_method)(
+        level = 'INFO' if status_code < 400 else 'WARNING' if status_code < 500 else 'ERROR'
+        if not logger.is_enabled_for(level):
+            return
+        logger.log(
+            level,
             f"Response: {method} {endpoint} - {status_code} ({duration_ms:.2f}ms)",
             method=method,
             endpoint=endpoint,
@@ -36,6 +44,8 @@ class BusinessEventLogStrategy:
     
     @staticmethod
     def log(logger: ILogger, event: str, **context) -> None:
+        if not logger.is_enabled_for('INFO'):
+            return
         logger.info(
             f"Business event: {event}",
             event=event,
@@ -48,6 +58,8 @@ class DatabaseOperationLogStrategy:
     
     @staticmethod
     def log(logger: ILogger, operation: str, table: str, **context) -> None:
+        if not logger.is_enabled_for('DEBUG'):
+            return
         logger.debug(
             f"Database operation: {operation} on {table}",
             operation=operation,
@@ -61,6 +73,8 @@ class ServiceCallLogStrategy:
     
     @staticmethod
     def log(logger: ILogger, service: str, method: str, **context) -> None:
+        if not logger.is_enabled_for('DEBUG'):
+            return
         logger.debug(
             f"Service call: {service}.{method}",
             service=service,
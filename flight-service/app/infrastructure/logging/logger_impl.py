@@ -1,40 +1,73 @@
 import logging
 import traceback
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 from app.domain.interfaces.logging.ilogger import ILogger
 
+LEVELS: Dict[str, int] = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+
+class LazyValue:
+    """A context value computed only if the record is actually emitted"""
+
+    __slots__ = ('_compute',)
+
+    def __init__(self, compute: Callable[[], Any]):
+        self._compute = compute
+
+    def __call__(self) -> Any:
+        return self._compute()
+
+
+def lazy(compute: Callable[[], Any]) -> LazyValue:
+    """Defer a costly context value: LoggerService.log_with_context(logger, 'DEBUG', '...', rows=lazy(lambda: ...))"""
+    return LazyValue(compute)
+
 
 class StructuredLogger(ILogger):
     """Concrete implementation of ILogger with structured logging support"""
-    
+
     def __init__(self, name: str):
         self._logger = logging.getLogger(name)
-    
+
     def debug(self, message: str, **context) -> None:
-        self._log('DEBUG', message, **context)
-    
+        self._log(logging.DEBUG, message, **context)
+
     def info(self, message: str, **context) -> None:
-        self._log('INFO', message, **context)
-    
+        self._log(logging.INFO, message, **context)
+
     def warning(self, message: str, **context) -> None:
-        self._log('WARNING', message, **context)
-    
+        self._log(logging.WARNING, message, **context)
+
     def error(self, message: str, exception: Optional[Exception] = None, **context) -> None:
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         if exception:
             context.update({
                 'error_type': type(exception).__name__,
                 'error_message': str(exception),
                 'traceback': traceback.format_exc()
             })
-        self._log('ERROR', message, exc_info=exception, **context)
-    
+        self._log(logging.ERROR, message, exc_info=exception, **context)
+
     def critical(self, message: str, **context) -> None:
-        self._log('CRITICAL', message, **context)
-    
-    def _log(self, level: str, message: str, exc_info: Optional[Exception] = None, **context) -> None:
-        log_method = getattr(self._logger, level.lower())
-        extra = {'context': context} if context else {}
-        if exc_info:
-            log_method(message, exc_info=exc_info, extra=extra)
-        else:
-            log_method(message, extra=extra)
+        self._log(logging.CRITICAL, message, **context)
+
+    def log(self, level: str, message: str, **context) -> None:
+        self._log(LEVELS.get(level) or LEVELS.get(level.upper(), logging.INFO), message, **context)
+
+    def is_enabled_for(self, level: str) -> bool:
+        return self._logger.isEnabledFor(LEVELS.get(level) or LEVELS.get(level.upper(), logging.INFO))
+
+    def _log(self, levelno: int, message: str, exc_info: Optional[Exception] = None, **context) -> None:
+        # Level check first: a disabled record costs one cached lookup and nothing is formatted
+        if not self._logger.isEnabledFor(levelno):
+            return
+        if context:
+            context = {key: value() if isinstance(value, LazyValue) else value for key, value in context.items()}
+        self._logger.log(levelno, message, exc_info=exc_info, extra={'context': context} if context else None)
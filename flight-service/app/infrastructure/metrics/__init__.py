@@ -0,0 +1,14 @@
+from .request_metrics import RequestMetrics
+from .query_metrics import QueryInstrumentation, QueryStats, query_budget
+from .pool_metrics import InstrumentedQueuePool
+from .replica_metrics import READ_ROUTING, REPLICA_LAG
+
+__all__ = [
+    'RequestMetrics',
+    'QueryInstrumentation',
+    'QueryStats',
+    'query_budget',
+    'InstrumentedQueuePool',
+    'READ_ROUTING',
+    'REPLICA_LAG'
+]
@@ -0,0 +1,14 @@
+"""
+Read replica metrics - Infrastructure Layer
+Where read-only transactions were routed (and why), and the replica's
+replay lag as last probed by this process.
+"""
+from prometheus_client import Counter, Gauge
+
+READ_ROUTING = Counter(
+    'db_read_routing_total', 'Read-only transactions by database and routing reason',
+    ['target', 'reason']
+)
+REPLICA_LAG = Gauge(
+    'db_replica_lag_seconds', 'Read replica replay lag at the last probe', multiprocess_mode='livemax'
+)
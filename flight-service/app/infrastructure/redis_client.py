@@ -0,0 +1,48 @@
+"""
+Shared Redis client for flight-service infrastructure (task queue, ...)
+"""
+import os
+from typing import Optional
+import redis
+from app.utils.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def init_redis() -> Optional[redis.Redis]:
+    """
+    Connect to REDIS_URL once per process.
+
+    Returns None when REDIS_URL is not set or Redis is unreachable, so callers
+    can fall back to their in-process implementations.
+    """
+    global _redis_client
+    if _redis_client is not None:
+        return _redis_client
+
+    REDIS_URL = os.getenv("REDIS_URL", None)
+    if REDIS_URL is None:
+        logger.info("REDIS_URL is not set, using in-process fallbacks")
+        return None
+
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", default="10"))
+
+    client = redis.Redis.from_url(
+        REDIS_URL,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        decode_responses=True
+    )
+    try:
+        client.ping()
+    except redis.RedisError as e:
+        logger.warning(f"Redis is unreachable, using in-process fallbacks: {str(e)}")
+        return None
+
+    _redis_client = client
+    return _redis_client
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    return _redis_client
@@ -0,0 +1,5 @@
+from .memory_store import InMemoryReportStore
+from .redis_store import RedisReportStore
+from .pdf_renderer import PdfReportRenderer
+
+__all__ = ['InMemoryReportStore', 'RedisReportStore', 'PdfReportRenderer']
@@ -0,0 +1,69 @@
+"""
+In-process report store - jobs and PDFs live in this worker process only
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.domain.interfaces.reports.ireport_store import IReportStore
+from app.domain.types.report_types import ReportJob
+
+
+class InMemoryReportStore(IReportStore):
+    """TTL dicts of jobs and PDFs (at most max_pdfs, least recently used evicted); the fallback without Redis"""
+
+    def __init__(self, result_ttl: int = 300, job_ttl: int = 900, max_pdfs: int = 20):
+        self.result_ttl = result_ttl
+        self.job_ttl = job_ttl
+        self.max_pdfs = max_pdfs
+        self._jobs: dict[str, Tuple[float, ReportJob]] = {}
+        self._pdfs: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create_job(self, job: ReportJob) -> bool:
+        with self._lock:
+            entry = self._jobs.get(job['job_id'])
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._jobs[job['job_id']] = (time.monotonic() + self._ttl_for(job), job)
+            return True
+
+    def save_job(self, job: ReportJob) -> None:
+        with self._lock:
+            self._jobs[job['job_id']] = (time.monotonic() + self._ttl_for(job), job)
+
+    def get_job(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._jobs[job_id]
+                return None
+            return entry[1]
+
+    def delete_job(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def save_pdf(self, job_id: str, pdf_bytes: bytes) -> None:
+        with self._lock:
+            self._pdfs[job_id] = (time.monotonic() + self.result_ttl, pdf_bytes)
+            self._pdfs.move_to_end(job_id)
+            while len(self._pdfs) > self.max_pdfs:
+                self._pdfs.popitem(last=False)
+
+    def get_pdf(self, job_id: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._pdfs.get(job_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._pdfs[job_id]
+                return None
+            self._pdfs.move_to_end(job_id)
+            return entry[1]
+
+    def _ttl_for(self, job: ReportJob) -> int:
+        # A finished job lives as long as its PDF; an unfinished one until it is presumed lost
+        return self.result_ttl if job.get('status') == 'completed' else self.job_ttl
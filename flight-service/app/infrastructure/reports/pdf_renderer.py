@@ -0,0 +1,211 @@
+"""
+Chunked, multi-process PDF rendering for flight reports
+
+reportlab lays a Table out in one CPU-bound pass whose cost grows faster
+than its row count (each page split re-measures the rest of the table), and
+it holds the GIL the whole time. The renderer therefore splits tables into
+fixed-size row chunks, cuts the layout into parts at chunk boundaries, lays
+the parts out in a pool of worker processes and merges the partial PDFs in
+order with pypdf. Every chunk repeats the table header and starts on a new
+page.
+
+Paragraph and table styles are built once per process and reused for every
+part that process renders. Without the optional pypdf package, or for
+layouts that fit in one chunk, the report is rendered in-process as a
+single document. A pool broken by a dying worker (e.g. OOM-killed) is
+replaced, and the report retried once on the new pool.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO
+from threading import Lock
+from types import SimpleNamespace
+from typing import List, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from app.domain.interfaces.reports.ireport_renderer import IReportRenderer
+from app.domain.types.report_types import ReportBlock
+from app.utils.logger_service import get_logger, LoggerService
+
+try:
+    import pypdf
+except ImportError:  # pragma: no cover - optional dependency
+    pypdf = None
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _styles() -> SimpleNamespace:
+    """Report styles, built once per process"""
+    sample = getSampleStyleSheet()
+    return SimpleNamespace(
+        title=ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a237e'),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        section=ParagraphStyle(
+            'SectionHeader',
+            parent=sample['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#283593'),
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        ),
+        text=sample['Normal'],
+        table=TableStyle([
+            # Header styling
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3f51b5')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('TOPPADDING', (0, 0), (-1, 0), 12),
+
+            # Data rows styling
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+
+            # Alternating row colors
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.lightgrey]),
+        ])
+    )
+
+
+def _flowable(block: ReportBlock):
+    kind, value = block
+    styles = _styles()
+    if kind == 'table':
+        table = Table(value, repeatRows=1)
+        table.setStyle(styles.table)
+        return table
+    if kind == 'spacer':
+        return Spacer(1, value * inch)
+    return Paragraph(value, getattr(styles, kind))
+
+
+def render_part(blocks: List[ReportBlock]) -> bytes:
+    """Lay out one part of a report as a standalone PDF (runs in the worker processes)"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=landscape(A4),
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.5*inch
+    )
+    doc.build([_flowable(block) for block in blocks])
+    return buffer.getvalue()
+
+
+def split_parts(blocks: List[ReportBlock], chunk_rows: int) -> List[List[ReportBlock]]:
+    """Cut the layout into parts so that no part holds more than chunk_rows table rows"""
+    parts: List[List[ReportBlock]] = [[]]
+    for kind, value in blocks:
+        if kind != 'table' or len(value) - 1 <= chunk_rows:
+            parts[-1].append((kind, value))
+            continue
+
+        header, rows = value[0], value[1:]
+        for offset in range(0, len(rows), chunk_rows):
+            if offset:
+                parts.append([])
+            parts[-1].append(('table', [header] + rows[offset:offset + chunk_rows]))
+    return parts
+
+
+def merge_pdfs(pdfs: List[bytes]) -> bytes:
+    writer = pypdf.PdfWriter()
+    for pdf in pdfs:
+        writer.append(pypdf.PdfReader(BytesIO(pdf)))
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class PdfReportRenderer(IReportRenderer):
+    """Renders report layouts, fanning large ones out to a process pool"""
+
+    def __init__(self, max_workers: int = 2, chunk_rows: int = 1000):
+        self.max_workers = max_workers
+        self.chunk_rows = chunk_rows
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = Lock()
+
+    def render(self, blocks: List[ReportBlock]) -> bytes:
+        parts = split_parts(blocks, self.chunk_rows) if pypdf is not None else [blocks]
+        if len(parts) == 1:
+            return render_part(parts[0])
+
+        if self.max_workers > 1:
+            pdfs = self._render_in_pool(parts)
+        else:
+            # Chunking alone already keeps each table's layout cost linear
+            pdfs = [render_part(part) for part in parts]
+
+        LoggerService.log_with_context(logger, 'DEBUG', 'Merging report parts',
+                                      parts=len(parts), workers=self.max_workers)
+        return merge_pdfs(pdfs)
+
+    def _render_in_pool(self, parts: List[List[ReportBlock]]) -> List[bytes]:
+        try:
+            return self._map(parts)
+        except BrokenProcessPool as e:
+            LoggerService.log_with_context(logger, 'WARNING', 'Report worker pool broke, retrying on a new pool',
+                                          error=str(e), parts=len(parts))
+            return self._map(parts)
+
+    def _map(self, parts: List[List[ReportBlock]]) -> List[bytes]:
+        pool = self._get_pool()
+        try:
+            return list(pool.map(render_part, parts))
+        except BrokenProcessPool:
+            # A broken executor never recovers; the next call starts a fresh one
+            self._discard_pool(pool)
+            raise
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            # Another report may already have replaced it
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Started on the first large report; spawned, not forked, since gevent and worker threads run here"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
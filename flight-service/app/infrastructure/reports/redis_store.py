@@ -0,0 +1,49 @@
+"""
+Redis report store - jobs and PDFs shared by every flight-service worker
+
+Keys (all under the configured prefix):
+    job:<id>    STRING JSON ReportJob with a TTL
+    pdf:<id>    STRING base64 PDF with a TTL (the shared client decodes responses as text)
+"""
+import base64
+import json
+from typing import Optional
+import redis
+from app.domain.interfaces.reports.ireport_store import IReportStore
+from app.domain.types.report_types import ReportJob
+
+
+class RedisReportStore(IReportStore):
+    """Report jobs and PDFs in Redis; create_job is an atomic SET NX so identical jobs start once"""
+
+    def __init__(self, client: redis.Redis, prefix: str = 'reports:', result_ttl: int = 300, job_ttl: int = 900):
+        self.redis = client
+        self.result_ttl = result_ttl
+        self.job_ttl = job_ttl
+        self.job_prefix = f"{prefix}job:"
+        self.pdf_prefix = f"{prefix}pdf:"
+
+    def create_job(self, job: ReportJob) -> bool:
+        return bool(self.redis.set(f"{self.job_prefix}{job['job_id']}", json.dumps(job),
+                                   nx=True, ex=self._ttl_for(job)))
+
+    def save_job(self, job: ReportJob) -> None:
+        self.redis.set(f"{self.job_prefix}{job['job_id']}", json.dumps(job), ex=self._ttl_for(job))
+
+    def get_job(self, job_id: str) -> Optional[ReportJob]:
+        raw = self.redis.get(f"{self.job_prefix}{job_id}")
+        return json.loads(raw) if raw is not None else None
+
+    def delete_job(self, job_id: str) -> None:
+        self.redis.delete(f"{self.job_prefix}{job_id}")
+
+    def save_pdf(self, job_id: str, pdf_bytes: bytes) -> None:
+        self.redis.set(f"{self.pdf_prefix}{job_id}", base64.b64encode(pdf_bytes).decode('ascii'), ex=self.result_ttl)
+
+    def get_pdf(self, job_id: str) -> Optional[bytes]:
+        raw = self.redis.get(f"{self.pdf_prefix}{job_id}")
+        return base64.b64decode(raw) if raw is not None else None
+
+    def _ttl_for(self, job: ReportJob) -> int:
+        # A finished job lives as long as its PDF; an unfinished one until it is presumed lost
+        return self.result_ttl if job.get('status') == 'completed' else self.job_ttl
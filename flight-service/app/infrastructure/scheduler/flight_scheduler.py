@@ -2,13 +2,18 @@
 Flight Scheduler Service - Handles automatic flight status transitions
 Following Clean Architecture principles
 """
+import heapq
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, List, Optional
 from ...domain.interfaces.repositories.iflight_repository import IFlightRepository
+from ...domain.interfaces.scheduler.iflight_scheduler import IFlightScheduler
 from ...domain.models.enums import FlightStatus
+from ...domain.models.flights import Flight
+from ...domain.types.repository_types import FlightTransition
 from ...domain.types.websocket_types import FlightNotificationData
+from .schedule_listener import ScheduleListener
 from app.utils.logger_service import get_logger, LoggerService
 
 logger = get_logger(__name__)
@@ -16,134 +21,219 @@ logger = get_logger(__name__)
 flight_scheduler: Optional[FlightScheduler] = None
 
 
-class FlightScheduler:
+class FlightScheduler(IFlightScheduler):
     """
-    Service that monitors flights and automatically transitions their status
-    based on scheduled times
+    Service that automatically transitions flight status at the scheduled times.
+
+    Instead of polling, the scheduler keeps a min-heap of upcoming departure
+    and arrival deadlines and sleeps until the earliest one. The heap is
+    loaded from the database for a refresh_interval horizon and re-armed as
+    flights change: in-process through reschedule() (called by FlightService),
+    across processes through PostgreSQL LISTEN/NOTIFY, and for arrivals from
+    the rows of each start transition. Deadlines are never removed from the
+    heap; one left behind by a cancellation just wakes a transition that
+    finds nothing due.
     """
     
-    def __init__(self, flight_repository: IFlightRepository, socket_manager, app=None):
+    def __init__(self, flight_repository: IFlightRepository, socket_manager, app=None, batch_size: int = 1000,
+                 refresh_interval: float = 900, listen_for_changes: bool = False):
         self.flight_repository = flight_repository
         self.socket_manager = socket_manager
         self.app = app  # Store Flask app for context
         self.running = threading.Event()
         self.scheduler_thread: Optional[threading.Thread] = None
-        self.check_interval = 10  # Check every 10 seconds
+        self.retry_interval = 10  # Seconds to wait after a failed tick
+        self.locked_retry_interval = 1  # Seconds before retrying due flights skipped while their rows were locked
+        self.batch_size = batch_size  # Flights moved per UPDATE statement
+        self.refresh_interval = refresh_interval  # Horizon of deadlines loaded from the database
+        self.max_deadlines = 10000
+        self.listen_for_changes = listen_for_changes
+        self.schedule_listener: Optional[ScheduleListener] = None
+        self._deadlines: List[float] = []  # Min-heap of UTC timestamps
+        self._deadlines_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._refresh_at = 0.0
     
     def start(self):
         """Start the flight scheduler"""
         if not self.running.is_set():
             self.running.set()
+            # Sweep and reload on (re)start; deadlines held from an earlier term may be stale
+            self._refresh_at = 0.0
             self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
             self.scheduler_thread.start()
+            if self.listen_for_changes and self.app:
+                self.schedule_listener = ScheduleListener(self.app, self.schedule)
+                self.schedule_listener.start()
             logger.info("Flight scheduler started")
     
     def stop(self):
         """Stop the flight scheduler"""
         self.running.clear()
+        self._wake.set()
+        if self.schedule_listener:
+            self.schedule_listener.stop()
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=5)
         logger.info("Flight scheduler stopped")
+
+    def reschedule(self, flight: Flight) -> None:
+        """Re-arm the timer for a flight that was approved, rescheduled or cancelled"""
+        if flight.status == FlightStatus.APPROVED:
+            self.schedule(flight.departure_time)
+        elif flight.status == FlightStatus.IN_PROGRESS:
+            self.schedule(flight.arrival_time)
+
+    def schedule(self, deadline: datetime) -> None:
+        """Add a transition deadline (naive datetimes are UTC) and wake the scheduler to re-arm"""
+        with self._deadlines_lock:
+            heapq.heappush(self._deadlines, self._timestamp(deadline))
+        self._wake.set()
+
+    @staticmethod
+    def _timestamp(value: datetime) -> float:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
     
     def _run_scheduler(self):
-        """Main scheduler loop"""
+        """Main scheduler loop: sleep until the next deadline or a re-arm"""
         while self.running.is_set():
+            self._wake.clear()
             try:
-                self._check_and_update_flights()
-                time.sleep(self.check_interval)
+                self._tick()
+                timeout = self._seconds_until_next_deadline()
             except Exception as e:
-                logger.error(f"Scheduler error: {str(e)}")
-                time.sleep(self.check_interval)
-    
-    def _check_and_update_flights(self):
-        """Check flights and update their status based on current time"""
+                LoggerService.log_error(logger, e, {'operation': 'check_flights'})
+                # Sweep again on the retry so deadlines popped by the failed tick are not lost
+                self._refresh_at = 0.0
+                timeout = self.retry_interval
+            self._wake.wait(timeout)
+
+    def _tick(self):
+        """Run the transitions if a deadline passed, and reload the deadline horizon when it runs out"""
         if not self.app:
             logger.warning("No Flask app context available, skipping flight checks")
             return
-            
-        try:
-            # Push application context for database access
-            with self.app.app_context():
-                current_time = datetime.now(timezone.utc)
-                
-                # Start approved flights that have reached their departure time
-                self._start_flights(current_time)
-                
-                # Complete flights that have reached their arrival time
-                self._complete_flights(current_time)
-            
-        except Exception as e:
-            LoggerService.log_error(logger, e, {'operation': 'check_flights'})
+
+        now = time.time()
+        refresh = now >= self._refresh_at
+        with self._deadlines_lock:
+            due = 0
+            while self._deadlines and self._deadlines[0] <= now:
+                heapq.heappop(self._deadlines)
+                due += 1
+
+        if due or refresh:
+            # A refresh also sweeps, which catches up on anything missed while the service was down
+            self._check_and_update_flights()
+        if refresh:
+            self._load_deadlines(now)
+
+    def _seconds_until_next_deadline(self) -> float:
+        with self._deadlines_lock:
+            next_at = min(self._deadlines[0], self._refresh_at) if self._deadlines else self._refresh_at
+        return max(0.0, next_at - time.time())
+
+    def _load_deadlines(self, now: float):
+        """Merge the deadlines of the next refresh_interval seconds into the heap"""
+        current_time = datetime.fromtimestamp(now, timezone.utc)
+        until = datetime.fromtimestamp(now + self.refresh_interval, timezone.utc)
+        with self.app.app_context():
+            deadlines = self.flight_repository.get_transition_deadlines(current_time, until, self.max_deadlines)
+
+        refresh_at = now + self.refresh_interval
+        if len(deadlines) == self.max_deadlines:
+            # Horizon cut short by the limit; load the rest once these are used up
+            refresh_at = self._timestamp(deadlines[-1])
+
+        loaded = {self._timestamp(deadline) for deadline in deadlines}
+        with self._deadlines_lock:
+            # Merging keeps deadlines pushed by reschedule() while the query ran
+            self._deadlines = sorted(loaded.union(self._deadlines))
+        self._refresh_at = refresh_at
+        LoggerService.log_with_context(logger, 'DEBUG', 'Loaded flight transition deadlines',
+                                     count=len(loaded), refresh_at=until.isoformat())
     
-    def _start_flights(self, current_time: datetime):
-        """Start flights that have reached their departure time"""
-        try:
-            # Get approved flights that should have started
-            flights = self.flight_repository.get_flights_to_start(current_time)
-            
-            LoggerService.log_with_context(logger, 'DEBUG', 
-                                         f'Checking flights to start at {current_time.isoformat()}',
-                                         count=len(flights))
-            
-            for flight in flights:
-                try:
-                    flight.status = FlightStatus.IN_PROGRESS
-                    flight.actual_start_time = current_time
-                    self.flight_repository.update_flight(flight)
-                    
-                    LoggerService.log_business_event(logger, 'FLIGHT_AUTO_STARTED',
-                                                   flight_id=flight.flight_id,
-                                                   flight_name=flight.flight_name)
-                    
-                    # Notify via WebSocket
-                    flight_data: FlightNotificationData = {
-                        'flight_id': flight.flight_id,
-                        'flight_name': flight.flight_name,
-                        'status': 'IN_PROGRESS',
-                        'departure_time': flight.departure_time.isoformat()
-                    }
-                    self.socket_manager.notify_flight_started(flight_data)
-                except Exception as e:
-                    LoggerService.log_error(logger, e, {'operation': 'start_flight', 'flight_id': flight.flight_id})
-        except Exception as e:
-            LoggerService.log_error(logger, e, {'operation': '_start_flights'})
+    def _check_and_update_flights(self):
+        """Check flights and update their status based on current time"""
+        # Push application context for database access
+        with self.app.app_context():
+            current_time = datetime.now(timezone.utc)
+
+            # Start approved flights that have reached their departure time
+            self._start_flights(current_time)
+
+            # Complete flights that have reached their arrival time
+            self._complete_flights(current_time)
+
+            # Batches skip rows locked by bookings or admin updates, which fire no
+            # schedule notification: retry soon rather than at the next refresh
+            if self.flight_repository.has_due_transitions(current_time):
+                with self._deadlines_lock:
+                    heapq.heappush(self._deadlines, time.time() + self.locked_retry_interval)
     
-    def _complete_flights(self, current_time: datetime):
+    def _start_flights(self, current_time: datetime) -> int:
+        """Start flights that have reached their departure time and arm their arrivals"""
+        started = self._transition(self.flight_repository.start_due_flights, current_time,
+                                   'IN_PROGRESS', 'FLIGHT_AUTO_STARTED',
+                                   self.socket_manager.notify_flight_started)
+        if started:
+            arrivals = [self._timestamp(row['arrival_time']) for row in started]
+            with self._deadlines_lock:
+                for arrival in arrivals:
+                    heapq.heappush(self._deadlines, arrival)
+        return len(started)
+
+    def _complete_flights(self, current_time: datetime) -> int:
         """Complete flights that have reached their arrival time"""
-        try:
-            # Get in-progress flights that should have completed
-            flights = self.flight_repository.get_flights_to_complete(current_time)
-            
-            LoggerService.log_with_context(logger, 'DEBUG',
-                                         f'Checking flights to complete at {current_time.isoformat()}',
-                                         count=len(flights))
-            
-            for flight in flights:
+        return len(self._transition(self.flight_repository.complete_due_flights, current_time,
+                                    'COMPLETED', 'FLIGHT_AUTO_COMPLETED',
+                                    self.socket_manager.notify_flight_completed))
+
+    def _transition(self, transition_batch: Callable[[datetime, int], List[FlightTransition]],
+                    current_time: datetime, status: str, event: str,
+                    notify: Callable[[FlightNotificationData], None]) -> List[FlightTransition]:
+        """
+        Apply a bulk transition batch by batch until no due flights are left.
+
+        Each batch is one UPDATE ... RETURNING in its own short transaction, so
+        a backlog never holds locks on every due flight at once; notifications
+        are sent from the returned rows without loading the flights.
+        """
+        moved_rows: List[FlightTransition] = []
+        while True:
+            moved = transition_batch(current_time, self.batch_size)
+            for row in moved:
+                LoggerService.log_business_event(logger, event,
+                                               flight_id=row['flight_id'],
+                                               flight_name=row['flight_name'])
                 try:
-                    flight.status = FlightStatus.COMPLETED
-                    self.flight_repository.update_flight(flight)
-                    
-                    LoggerService.log_business_event(logger, 'FLIGHT_AUTO_COMPLETED',
-                                                   flight_id=flight.flight_id,
-                                                   flight_name=flight.flight_name)
-                    
-                    # Notify via WebSocket
                     flight_data: FlightNotificationData = {
-                        'flight_id': flight.flight_id,
-                        'flight_name': flight.flight_name,
-                        'status': 'COMPLETED',
-                        'departure_time': flight.departure_time.isoformat()
+                        'flight_id': row['flight_id'],
+                        'flight_name': row['flight_name'],
+                        'status': status,
+                        'departure_time': row['departure_time'].isoformat()
                     }
-                    self.socket_manager.notify_flight_completed(flight_data)
+                    notify(flight_data)
                 except Exception as e:
-                    LoggerService.log_error(logger, e, {'operation': 'complete_flight', 'flight_id': flight.flight_id})
-        except Exception as e:
-            LoggerService.log_error(logger, e, {'operation': '_complete_flights'})
+                    LoggerService.log_error(logger, e, {'operation': 'notify_flight', 'flight_id': row['flight_id']})
+            moved_rows.extend(moved)
+            # A short batch means no unlocked due rows are left; stop() also ends the loop between batches
+            if len(moved) < self.batch_size or not self.running.is_set():
+                break
+
+        LoggerService.log_with_context(logger, 'DEBUG',
+                                     f'{event} at {current_time.isoformat()}',
+                                     count=len(moved_rows))
+        return moved_rows
 
 
-def init_flight_scheduler(flight_repository: IFlightRepository, socket_manager, app=None):
+def init_flight_scheduler(flight_repository: IFlightRepository, socket_manager, app=None, batch_size: int = 1000,
+                          refresh_interval: float = 900, listen_for_changes: bool = False):
     """Initialize and start the flight scheduler"""
     global flight_scheduler
-    flight_scheduler = FlightScheduler(flight_repository, socket_manager, app)
+    flight_scheduler = FlightScheduler(flight_repository, socket_manager, app, batch_size,
+                                       refresh_interval, listen_for_changes)
     flight_scheduler.start()
     return flight_scheduler
@@ -0,0 +1,89 @@
+"""
+PostgreSQL LISTEN/NOTIFY listener for flight schedule changes
+
+The flights_schedule_notify trigger sends a notification on the
+flight_schedule channel whenever a flight becomes (or stays) APPROVED, so
+every flight-service process re-arms its scheduler no matter which process
+or tool approved or rescheduled the flight.
+"""
+import json
+import select
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+from app.utils.logger_service import get_logger, LoggerService
+
+logger = get_logger(__name__)
+
+SCHEDULE_CHANNEL = 'flight_schedule'
+
+
+class ScheduleListener:
+    """Forwards departure times from flight_schedule notifications to a callback"""
+
+    def __init__(self, app, on_deadline: Callable[[datetime], None], channel: str = SCHEDULE_CHANNEL,
+                 reconnect_delay: float = 5):
+        self.app = app
+        self.on_deadline = on_deadline
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.running = threading.Event()
+        self.listener_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start listening on a dedicated connection"""
+        if not self.running.is_set():
+            self.running.set()
+            self.listener_thread = threading.Thread(target=self._run, name="schedule-listener", daemon=True)
+            self.listener_thread.start()
+
+    def stop(self):
+        self.running.clear()
+        if self.listener_thread and self.listener_thread.is_alive():
+            self.listener_thread.join(timeout=5)
+
+    def _run(self):
+        while self.running.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                logger.info(f"Listening for flight schedule changes on '{self.channel}'")
+                self._listen(connection)
+            except Exception as e:
+                LoggerService.log_error(logger, e, {'operation': 'schedule_listener'})
+                time.sleep(self.reconnect_delay)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _connect(self):
+        """A psycopg2 connection taken out of the pool for good, in autocommit mode"""
+        from app import db
+        from app.infrastructure.database import DIRECT_BIND
+        with self.app.app_context():
+            # Bypasses PgBouncer when it is configured: the session must stay on one server connection
+            pooled = db.engines.get(DIRECT_BIND, db.engine).raw_connection()
+        pooled.detach()
+        connection = pooled.dbapi_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return connection
+
+    def _listen(self, connection):
+        while self.running.is_set():
+            # The timeout only lets the loop notice stop()
+            if select.select([connection], [], [], 1)[0] == []:
+                continue
+            connection.poll()
+            while connection.notifies:
+                self._handle(connection.notifies.pop(0).payload)
+
+    def _handle(self, payload: str):
+        try:
+            departure_time = datetime.fromisoformat(json.loads(payload)['departure_time'])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed flight schedule notification: {payload!r}")
+            return
+        self.on_deadline(departure_time)
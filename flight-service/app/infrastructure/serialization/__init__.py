@@ -0,0 +1,4 @@
+from .compiled_serializer import CompiledSerializer
+from .orjson_provider import OrjsonJSONProvider, orjson
+
+__all__ = ['CompiledSerializer', 'OrjsonJSONProvider', 'orjson']
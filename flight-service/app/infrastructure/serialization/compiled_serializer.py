@@ -0,0 +1,101 @@
+"""
+Precompiled response serialization - Infrastructure Layer
+Dumps ORM objects (or SQLAlchemy rows labelled like the DTO fields) to the
+same dicts as a marshmallow response DTO, without marshmallow's per-value
+field dispatch.
+
+The DTO schema stays the source of truth: its fields are read once, at
+import time, into one attrgetter fetching every attribute in a single call
+plus a converter per field reproducing what that marshmallow field emits.
+Field types without an exact converter are rejected when compiling, so a
+new DTO field cannot silently change the JSON contract.
+"""
+import datetime
+import decimal
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from marshmallow import Schema, fields
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _decimal_string(value: Any) -> str:
+    # fields.Decimal(as_string=True) formats Decimal(str(value)) in fixed-point notation
+    if type(value) is not decimal.Decimal:
+        value = decimal.Decimal(str(value))
+    return format(value, 'f')
+
+
+def _converter(field: fields.Field) -> Converter:
+    """The conversion a marshmallow field applies to a non-None value (None: emitted as is)"""
+    field_type = type(field)
+    if field_type is fields.Nested:
+        nested = CompiledSerializer(field.schema)
+        return nested.dump_many if field.many else nested.dump
+    if field_type in (fields.Integer, fields.Int) and not field.as_string:
+        return None
+    if field_type in (fields.String, fields.Str):
+        return str
+    if field_type is fields.DateTime and field.format in (None, 'iso'):
+        return datetime.datetime.isoformat
+    if field_type is fields.Decimal and field.as_string and field.places is None:
+        return _decimal_string
+    if field_type in (fields.Boolean, fields.Bool):
+        return bool
+    raise TypeError(f"No compiled converter for {field_type.__name__} fields")
+
+
+class CompiledSerializer:
+    """Serializer compiled from a marshmallow response DTO"""
+
+    __slots__ = ('_keys', '_get_loaded', '_get', '_field_getters', '_converters', '_single')
+
+    def __init__(self, schema: Union[Schema, Type[Schema]]):
+        if isinstance(schema, type):
+            schema = schema()
+        # dump_fields already honours the schema's only/exclude
+        dump_fields: List[Tuple[str, fields.Field]] = list(schema.dump_fields.items())
+        attributes = [field.attribute or name for name, field in dump_fields]
+        self._keys = tuple(field.data_key or name for name, field in dump_fields)
+        self._get_loaded = itemgetter(*attributes)
+        self._get = attrgetter(*attributes)
+        self._field_getters = tuple(attrgetter(attribute) for attribute in attributes)
+        self._converters = tuple(_converter(field) for _, field in dump_fields)
+        # The getters return a bare value rather than a tuple for a single attribute
+        self._single = len(dump_fields) == 1
+
+    def dump(self, obj: Any) -> Optional[Dict[str, Any]]:
+        if obj is None:
+            return None
+        try:
+            # Loaded ORM attributes sit in the instance dict; reading it skips the instrumented descriptors
+            values = self._get_loaded(obj.__dict__)
+        except (AttributeError, KeyError):
+            # Rows, expired or unloaded attributes: plain attribute access (may lazy load, as marshmallow would)
+            try:
+                values = self._get(obj)
+            except AttributeError:
+                return self._dump_present(obj)
+        if self._single:
+            values = (values,)
+        return {
+            key: value if convert is None or value is None else convert(value)
+            for key, convert, value in zip(self._keys, self._converters, values)
+        }
+
+    def _dump_present(self, obj: Any) -> Dict[str, Any]:
+        """Like marshmallow, leave out the fields the object has no attribute for
+        (e.g. available_seats, set only on flights fetched for listings)"""
+        data = {}
+        for key, get, convert in zip(self._keys, self._field_getters, self._converters):
+            try:
+                value = get(obj)
+            except AttributeError:
+                continue
+            data[key] = value if convert is None or value is None else convert(value)
+        return data
+
+    def dump_many(self, objs: Iterable[Any]) -> List[Dict[str, Any]]:
+        dump = self.dump
+        return [dump(obj) for obj in objs]
@@ -0,0 +1,39 @@
+"""
+orjson-backed Flask JSON provider - Infrastructure Layer
+Drop-in for Flask's DefaultJSONProvider with the same output contract:
+sorted keys, RFC 822 dates for raw datetime values, Decimal as string,
+compact outside debug. orjson writes UTF-8 instead of \\u escapes.
+"""
+from typing import Any, Union
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    # Raw datetimes go through Flask's default hook, keeping its HTTP-date format
+    _OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Serializes jsonify() and response dicts with orjson"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=_OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        option = _OPTIONS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option) + b'\n',
+            mimetype=self.mimetype
+        )
@@ -1,3 +1,5 @@
-from .task_manager import BackgroundTaskManager
+from .task_manager import BackgroundTaskManager, TaskPriority, TaskQueueFullError
+from .memory_backend import InMemoryTaskBackend
+from .redis_backend import RedisTaskBackend
 
-__all__ = ['BackgroundTaskManager']
+__all__ = ['BackgroundTaskManager', 'TaskPriority', 'TaskQueueFullError', 'InMemoryTaskBackend', 'RedisTaskBackend']
@@ -0,0 +1,80 @@
+"""
+In-process task backend - tasks and results live in this worker process only
+"""
+import itertools
+import threading
+import time
+from queue import Empty, Full, PriorityQueue
+from typing import Any, Dict, Optional, Tuple
+from app.domain.interfaces.tasks.itask_backend import ITaskBackend
+from app.domain.types.task_types import TaskStatus
+
+
+class InMemoryTaskBackend(ITaskBackend):
+    """Bounded priority queue and a TTL dict of results; the fallback when Redis is not configured"""
+
+    durable = False
+
+    def __init__(self, max_queue_size: int = 1000, result_ttl: int = 3600):
+        self._capacity = max_queue_size
+        self.result_ttl = result_ttl
+        self.task_queue: PriorityQueue = PriorityQueue(maxsize=max_queue_size)
+        # Tie-breaker keeping FIFO order within a priority
+        self._sequence = itertools.count()
+        self._statuses: Dict[str, Tuple[float, TaskStatus]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def enqueue(self, task: Dict[str, Any]) -> bool:
+        try:
+            self.task_queue.put_nowait((task['priority'], next(self._sequence), task))
+            return True
+        except Full:
+            return False
+
+    def dequeue(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            _, _, task = self.task_queue.get(timeout=timeout)
+        except Empty:
+            return None
+        self.task_queue.task_done()
+        return task
+
+    def ack(self, task_id: str) -> None:
+        # Tasks are not redelivered in-process, so there is nothing to release
+        pass
+
+    def requeue_expired(self) -> int:
+        return 0
+
+    def depth(self) -> int:
+        return self.task_queue.qsize()
+
+    def save_status(self, task_id: str, status: TaskStatus) -> None:
+        with self._lock:
+            self._statuses[task_id] = (time.monotonic() + self.result_ttl, status)
+
+    def get_status(self, task_id: str) -> Optional[TaskStatus]:
+        with self._lock:
+            entry = self._statuses.get(task_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._statuses[task_id]
+                return None
+            return entry[1]
+
+    def delete_status(self, task_id: str) -> None:
+        with self._lock:
+            self._statuses.pop(task_id, None)
+
+    def cleanup(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            expired = [task_id for task_id, (expires_at, _) in self._statuses.items() if expires_at <= now]
+            for task_id in expired:
+                del self._statuses[task_id]
+        return len(expired)
@@ -0,0 +1,144 @@
+"""
+Redis task backend - a queue and result store shared by every flight-service worker
+
+Keys (all under the configured prefix):
+    queue       ZSET task id -> priority * 1e13 + enqueue time in ms (FIFO within a priority)
+    processing  ZSET task id -> visibility deadline in ms
+    payload     HASH task id -> JSON task
+    attempts    HASH task id -> redelivery count
+    signal      LIST wake-up tokens for idle workers
+    status:<id> STRING JSON TaskStatus with a TTL
+
+A task is reserved atomically (moved from queue to processing) and only removed
+on ack; a worker that dies mid-task leaves it in processing until its
+visibility timeout passes and requeue_expired puts it back (at-least-once).
+"""
+import json
+import time
+from typing import Any, Dict, Optional
+import redis
+from app.domain.interfaces.tasks.itask_backend import ITaskBackend
+from app.domain.types.task_types import TaskStatus
+
+PRIORITY_WEIGHT = 10 ** 13
+
+# KEYS: queue, processing, payload, attempts; ARGV: visibility deadline ms
+_CLAIM_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return nil
+end
+local id = popped[1]
+redis.call('ZADD', KEYS[2], ARGV[1], id)
+return {id, redis.call('HGET', KEYS[3], id), redis.call('HGET', KEYS[4], id)}
+"""
+
+# KEYS: processing, queue, payload, attempts, signal; ARGV: now ms
+_REQUEUE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, id in ipairs(ids) do
+    redis.call('ZREM', KEYS[1], id)
+    local payload = redis.call('HGET', KEYS[3], id)
+    if payload then
+        redis.call('HINCRBY', KEYS[4], id, 1)
+        redis.call('ZADD', KEYS[2], cjson.decode(payload)['score'], id)
+        redis.call('RPUSH', KEYS[5], 1)
+    end
+end
+return #ids
+"""
+
+
+class RedisTaskBackend(ITaskBackend):
+    """Durable, multi-process task backend with visibility timeouts and redelivery"""
+
+    durable = True
+
+    def __init__(self, client: redis.Redis, prefix: str = 'tasks:', max_queue_size: int = 1000,
+                 result_ttl: int = 3600, visibility_timeout: int = 300):
+        self.redis = client
+        self._capacity = max_queue_size
+        self.result_ttl = result_ttl
+        self.visibility_timeout = visibility_timeout
+        self.queue_key = f"{prefix}queue"
+        self.processing_key = f"{prefix}processing"
+        self.payload_key = f"{prefix}payload"
+        self.attempts_key = f"{prefix}attempts"
+        self.signal_key = f"{prefix}signal"
+        self.status_prefix = f"{prefix}status:"
+        self._claim = client.register_script(_CLAIM_SCRIPT)
+        self._requeue = client.register_script(_REQUEUE_SCRIPT)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def enqueue(self, task: Dict[str, Any]) -> bool:
+        if self.redis.zcard(self.queue_key) >= self._capacity:
+            return False
+
+        score = task['priority'] * PRIORITY_WEIGHT + int(task['enqueued_at'] * 1000)
+        # Kept as a string so the requeue script re-adds the exact score (Lua numbers format to 14 digits)
+        payload = json.dumps({**task, 'score': str(score)})
+
+        pipe = self.redis.pipeline()
+        pipe.hset(self.payload_key, task['id'], payload)
+        pipe.zadd(self.queue_key, {task['id']: score})
+        pipe.rpush(self.signal_key, 1)
+        # Wake-up tokens are only hints; keep the list from growing past the queue size
+        pipe.ltrim(self.signal_key, -self._capacity, -1)
+        pipe.execute()
+        return True
+
+    def dequeue(self, timeout: float) -> Optional[Dict[str, Any]]:
+        task = self._claim_next()
+        if task is None:
+            self.redis.blpop([self.signal_key], timeout=max(1, int(timeout)))
+            task = self._claim_next()
+        return task
+
+    def _claim_next(self) -> Optional[Dict[str, Any]]:
+        deadline_ms = int((time.time() + self.visibility_timeout) * 1000)
+        claimed = self._claim(keys=[self.queue_key, self.processing_key, self.payload_key, self.attempts_key],
+                              args=[deadline_ms])
+        if not claimed:
+            return None
+
+        task_id, payload, attempts = claimed
+        if payload is None:
+            # Payload already acked elsewhere; drop the stale reservation
+            self.redis.zrem(self.processing_key, task_id)
+            return None
+        task = json.loads(payload)
+        task['attempts'] = int(attempts or 0)
+        return task
+
+    def ack(self, task_id: str) -> None:
+        pipe = self.redis.pipeline()
+        pipe.zrem(self.processing_key, task_id)
+        pipe.hdel(self.payload_key, task_id)
+        pipe.hdel(self.attempts_key, task_id)
+        pipe.execute()
+
+    def requeue_expired(self) -> int:
+        return int(self._requeue(
+            keys=[self.processing_key, self.queue_key, self.payload_key, self.attempts_key, self.signal_key],
+            args=[int(time.time() * 1000)]
+        ))
+
+    def depth(self) -> int:
+        return int(self.redis.zcard(self.queue_key))
+
+    def save_status(self, task_id: str, status: TaskStatus) -> None:
+        self.redis.set(f"{self.status_prefix}{task_id}", json.dumps(status, default=str), ex=self.result_ttl)
+
+    def get_status(self, task_id: str) -> Optional[TaskStatus]:
+        raw = self.redis.get(f"{self.status_prefix}{task_id}")
+        return json.loads(raw) if raw is not None else None
+
+    def delete_status(self, task_id: str) -> None:
+        self.redis.delete(f"{self.status_prefix}{task_id}")
+
+    def cleanup(self) -> int:
+        # Statuses expire through their Redis TTL
+        return 0
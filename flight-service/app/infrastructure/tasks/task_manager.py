@@ -3,159 +3,380 @@ Background Task Manager - Infrastructure Layer
 Handles asynchronous processing of long-running tasks
 """
 import threading
-from queue import Queue
+from enum import IntEnum
 import time
-from typing import Callable
+from typing import Any, Callable, Dict, Optional, Union
 from datetime import datetime, timezone
 import uuid
 from ...domain.types.task_types import TaskStatus
+from app.domain.interfaces.tasks.itask_backend import ITaskBackend
+from .memory_backend import InMemoryTaskBackend
 from app.utils.logger_service import get_logger
 
 logger = get_logger(__name__)
 
 
+class TaskPriority(IntEnum):
+    """Task priorities; lower values are dequeued first"""
+    HIGH = 0
+    NORMAL = 5
+    LOW = 10
+
+
+class TaskQueueFullError(RuntimeError):
+    """Raised by submit_task when the queue is full or sheds the task's priority"""
+
+
+class _TimingStats:
+    """Count, total and max of a duration in milliseconds"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3)
+        }
+
+
 class BackgroundTaskManager:
-    """Manages background tasks for asynchronous processing"""
-    
-    def __init__(self, app=None):
+    """
+    Manages background tasks for asynchronous processing.
+
+    A pool of worker threads blocks on a bounded priority queue held by a task
+    backend: in-process by default, or Redis so that tasks and results are
+    shared by every gunicorn worker and survive restarts. When the queue fills
+    past shed_ratio of its capacity, LOW priority tasks are rejected so the
+    remaining room is kept for more important work; a completely full queue
+    rejects everything.
+    """
+
+    def __init__(self, app=None, backend: Optional[ITaskBackend] = None, workers: int = 4,
+                 max_queue_size: int = 1000, default_timeout: Optional[float] = None,
+                 shed_ratio: float = 0.8, max_attempts: int = 3, reap_interval: float = 15,
+                 should_reap: Optional[Callable[[], bool]] = None):
         self.app = app  # Store Flask app for context
-        self.task_queue = Queue()
-        self.task_results = {}
-        self.results_lock = threading.Lock()
-        self.worker_thread = None
+        self.backend = backend or InMemoryTaskBackend(max_queue_size)
+        self.workers = max(1, workers)
+        self.default_timeout = default_timeout
+        self.shed_threshold = int(self.backend.capacity * shed_ratio)
+        self.max_attempts = max_attempts
+        self.reap_interval = reap_interval
+        # With a shared backend only one process (the leader) needs to redeliver and clean up
+        self.should_reap = should_reap
+        self.worker_threads = []
         self.running = threading.Event()
-    
+        self._registry: Dict[str, Callable] = {}
+        self._metrics_lock = threading.Lock()
+        self._counters = {'submitted': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'timed_out': 0}
+        self._wait_stats = _TimingStats()
+        self._run_stats = _TimingStats()
+        self._busy_workers = 0
+
     def start(self):
-        """Start the background worker thread"""
+        """Start the background worker threads and the redelivery / cleanup reaper"""
         if not self.running.is_set():
             self.running.set()
-            self.worker_thread = threading.Thread(target=self._worker, daemon=True)
-            self.worker_thread.start()
-            logger.info("Background task manager started")
-    
+            self.worker_threads = [
+                threading.Thread(target=self._worker, name=f"task-worker-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            self.worker_threads.append(threading.Thread(target=self._reaper, name="task-reaper", daemon=True))
+            for thread in self.worker_threads:
+                thread.start()
+            logger.info(f"Background task manager started with {self.workers} workers "
+                        f"({type(self.backend).__name__})")
+
     def stop(self):
-        """Stop the background worker thread"""
+        """Stop the background worker threads"""
         self.running.clear()
-        if self.worker_thread and self.worker_thread.is_alive():
-            self.worker_thread.join(timeout=5)
+        for thread in self.worker_threads:
+            if thread.is_alive():
+                thread.join(timeout=5)
         logger.info("Background task manager stopped")
-    
+
+    def register_task(self, name: str, func: Callable) -> None:
+        """
+        Register a task function under a stable name.
+
+        Durable backends only carry the name across processes, so every
+        function submitted to them must be registered in each worker.
+        """
+        self._registry[name] = func
+
+    def _task_name(self, func: Union[str, Callable]) -> Optional[str]:
+        if isinstance(func, str):
+            return func
+        for name, registered in self._registry.items():
+            if registered == func:
+                return name
+        return None
+
     def _worker(self):
-        """Worker thread that processes tasks from the queue"""
+        """Worker thread that processes tasks from the queue inside its own app context"""
+        if self.app:
+            with self.app.app_context():
+                self._work_loop()
+        else:
+            self._work_loop()
+
+    def _work_loop(self):
         while self.running.is_set():
             try:
-                if not self.task_queue.empty():
-                    task = self.task_queue.get()
-                    task_id = task['id']
-                    func = task['func']
-                    args = task.get('args', ())
-                    kwargs = task.get('kwargs', {})
-                    
-                    # Update task status to processing
-                    with self.results_lock:
-                        task_result = self.task_results[task_id].copy()
-                        task_result['status'] = 'processing'
-                        task_result['started_at'] = datetime.now(timezone.utc).isoformat()
-                        self.task_results[task_id] = task_result
-                    
-                    try:
-                        if self.app:
-                            with self.app.app_context():
-                                result = func(*args, **kwargs)
-                        else:
-                            result = func(*args, **kwargs)
-                        
-                        with self.results_lock:
-                            task_result = self.task_results[task_id].copy()
-                            task_result['status'] = 'completed'
-                            task_result['result'] = result
-                            task_result['completed_at'] = datetime.now(timezone.utc).isoformat()
-                            self.task_results[task_id] = task_result
-                        logger.info(f"Task {task_id} completed successfully")
-                    except Exception as e:
-                        logger.error(f"Task {task_id} failed: {str(e)}")
-                        with self.results_lock:
-                            task_result = self.task_results[task_id].copy()
-                            task_result['status'] = 'failed'
-                            task_result['error'] = str(e)
-                            task_result['completed_at'] = datetime.now(timezone.utc).isoformat()
-                            self.task_results[task_id] = task_result
-                    
-                else:
-                    time.sleep(0.1)  # Small sleep to prevent busy waiting
+                # Blocking dequeue; the timeout only lets the loop notice stop()
+                task = self.backend.dequeue(timeout=1)
             except Exception as e:
-                logger.error(f"Worker thread error: {str(e)}")
+                logger.error(f"Task backend error: {str(e)}")
                 time.sleep(1)
-    
-    def submit_task(self, func: Callable, *args, **kwargs) -> str:
+                continue
+            if task is None:
+                continue
+
+            try:
+                self._run_task(task)
+            except Exception as e:
+                logger.error(f"Worker thread error: {str(e)}")
+            finally:
+                try:
+                    self.backend.ack(task['id'])
+                except Exception as e:
+                    logger.error(f"Failed to acknowledge task {task['id']}: {str(e)}")
+                if self.app:
+                    # Release per-task resources (e.g. the SQLAlchemy session) held by the worker's context
+                    self.app.do_teardown_appcontext()
+
+    def _reaper(self):
+        """Periodically redeliver tasks whose visibility timeout passed and evict expired results"""
+        while not self._wait_for_stop(self.reap_interval):
+            if self.should_reap is not None and not self.should_reap():
+                continue
+            try:
+                requeued = self.backend.requeue_expired()
+                if requeued:
+                    logger.warning(f"Redelivered {requeued} unacknowledged tasks")
+                self.cleanup_old_results()
+            except Exception as e:
+                logger.error(f"Task reaper error: {str(e)}")
+
+    def _wait_for_stop(self, seconds: float) -> bool:
+        deadline = time.monotonic() + seconds
+        while self.running.is_set() and time.monotonic() < deadline:
+            time.sleep(min(1.0, seconds))
+        return not self.running.is_set()
+
+    def _run_task(self, task: Dict[str, Any]):
+        task_id = task['id']
+        timeout = task['timeout']
+        wait_ms = (time.time() - task['enqueued_at']) * 1000
+        started = time.monotonic()
+
+        with self._metrics_lock:
+            self._wait_stats.add(wait_ms)
+
+        if task.get('attempts', 0) >= self.max_attempts:
+            self._finish(task_id, 'failed', error=f"Task was redelivered {task['attempts']} times without being acknowledged")
+            return
+
+        if timeout is not None and wait_ms >= timeout * 1000:
+            self._finish(task_id, 'timed_out', error=f"Task expired after waiting {wait_ms:.0f} ms in the queue")
+            logger.warning(f"Task {task_id} expired in the queue")
+            return
+
+        func = task.get('func') or self._registry.get(task.get('name'))
+        if func is None:
+            self._finish(task_id, 'failed', error=f"Unknown task '{task.get('name')}'")
+            return
+
+        self._update(task_id, status='processing', started_at=datetime.now(timezone.utc).isoformat())
+        with self._metrics_lock:
+            self._busy_workers += 1
+
+        try:
+            if timeout is None:
+                result = func(*task['args'], **task['kwargs'])
+                outcome = ('completed', result, None)
+            else:
+                outcome = self._run_with_timeout(task_id, func, task, timeout - wait_ms / 1000)
+        except Exception as e:
+            outcome = ('failed', None, str(e))
+        finally:
+            run_ms = (time.monotonic() - started) * 1000
+            with self._metrics_lock:
+                self._busy_workers -= 1
+                self._run_stats.add(run_ms)
+
+        status, result, error = outcome
+        self._finish(task_id, status, result=result, error=error)
+        if status == 'completed':
+            logger.info(f"Task {task_id} completed successfully")
+        else:
+            logger.error(f"Task {task_id} {status}: {error}")
+
+    def _run_with_timeout(self, task_id: str, func: Callable, task: Dict[str, Any], timeout: float):
+        """
+        Run a task on a helper thread and stop waiting for it after timeout seconds.
+
+        Python threads cannot be interrupted, so a timed-out task keeps running
+        in the background, but its worker is freed and its result is discarded.
+        """
+        outcome: Dict[str, Any] = {}
+
+        def target():
+            try:
+                if self.app:
+                    with self.app.app_context():
+                        outcome['result'] = func(*task['args'], **task['kwargs'])
+                else:
+                    outcome['result'] = func(*task['args'], **task['kwargs'])
+            except Exception as e:
+                outcome['error'] = str(e)
+
+        runner = threading.Thread(target=target, name=f"task-{task_id}", daemon=True)
+        runner.start()
+        runner.join(max(timeout, 0))
+
+        if runner.is_alive():
+            return 'timed_out', None, f"Task timed out after {task['timeout']} s"
+        if 'error' in outcome:
+            return 'failed', None, outcome['error']
+        return 'completed', outcome.get('result'), None
+
+    def _update(self, task_id: str, **fields):
+        task_result = dict(self.backend.get_status(task_id) or {})
+        task_result.update(fields)
+        self.backend.save_status(task_id, task_result)
+
+    def _finish(self, task_id: str, status: str, result: Any = None, error: Optional[str] = None):
+        self._update(task_id, status=status, result=result, error=error,
+                     completed_at=datetime.now(timezone.utc).isoformat())
+        with self._metrics_lock:
+            self._counters[status] += 1
+
+    def submit_task(self, func: Union[str, Callable], *args, priority: TaskPriority = TaskPriority.NORMAL,
+                    timeout: Optional[float] = None, **kwargs) -> str:
         """
         Submit a task for background processing
-        
+
         Args:
-            func: The function to execute
+            func: The function to execute, or the name it was registered under
+                  (durable backends require a registered function)
             *args: Positional arguments for the function
+            priority: Queue priority (HIGH tasks are dequeued before NORMAL and LOW)
+            timeout: Seconds from submission until the task is given up on
+                     (defaults to the manager's default_timeout; None waits forever)
             **kwargs: Keyword arguments for the function
-            
+
         Returns:
             str: Task ID for tracking
+
+        Raises:
+            TaskQueueFullError: If the queue is full, or past the shedding
+                threshold for a LOW priority task
+            ValueError: If a durable backend is given an unregistered function
         """
+        name = self._task_name(func)
+        if self.backend.durable and name is None:
+            raise ValueError(f"Task function {func!r} must be registered with register_task")
+
+        depth = self.backend.depth()
+        if priority >= TaskPriority.LOW and depth >= self.shed_threshold:
+            self._reject(f"Task queue is shedding low priority tasks ({depth}/{self.backend.capacity})")
+
         task_id = str(uuid.uuid4())
-        
-        with self.results_lock:
-            self.task_results[task_id] = {
-                'status': 'pending',
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'started_at': None,
-                'completed_at': None,
-                'result': None,
-                'error': None
-            }
-        
         task = {
             'id': task_id,
-            'func': func,
-            'args': args,
-            'kwargs': kwargs
+            'name': name,
+            'args': list(args),
+            'kwargs': kwargs,
+            'priority': int(priority),
+            'timeout': timeout if timeout is not None else self.default_timeout,
+            'enqueued_at': time.time()
         }
-        
-        self.task_queue.put(task)
+        if not self.backend.durable:
+            task['func'] = self._registry.get(func) if isinstance(func, str) else func
+
+        # Store the status first so a worker that picks the task up at once finds it
+        self.backend.save_status(task_id, {
+            'status': 'pending',
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'started_at': None,
+            'completed_at': None,
+            'result': None,
+            'error': None
+        })
+
+        try:
+            queued = self.backend.enqueue(task)
+        except Exception:
+            self.backend.delete_status(task_id)
+            raise
+        if not queued:
+            self.backend.delete_status(task_id)
+            self._reject(f"Task queue is full ({self.backend.capacity})")
+
+        with self._metrics_lock:
+            self._counters['submitted'] += 1
         logger.info(f"Task {task_id} submitted for processing")
         return task_id
-    
+
+    def _reject(self, reason: str):
+        with self._metrics_lock:
+            self._counters['rejected'] += 1
+        logger.warning(reason)
+        raise TaskQueueFullError(reason)
+
     def get_task_status(self, task_id: str) -> TaskStatus:
         """
         Get the status of a task
-        
+
         Args:
             task_id: The task ID
-            
+
         Returns:
             TaskStatus: Task status information
         """
-        with self.results_lock:
-            return self.task_results.get(task_id, {'status': 'not_found'})
-    
-    def cleanup_old_results(self, max_age_seconds: int = 3600):
+        return self.backend.get_status(task_id) or {'status': 'not_found'}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of the pool for sizing and monitoring
+
+        Returns:
+            Dict with worker counts, queue depth and capacity, task counters of
+            this process, and queue wait / run time statistics in milliseconds
         """
-        Clean up old task results
-        
-        Args:
-            max_age_seconds: Maximum age of results to keep (default 1 hour)
+        queue_depth = self.backend.depth()
+        with self._metrics_lock:
+            return {
+                'backend': type(self.backend).__name__,
+                'workers': self.workers,
+                'busy_workers': self._busy_workers,
+                'queue_depth': queue_depth,
+                'queue_capacity': self.backend.capacity,
+                'shed_threshold': self.shed_threshold,
+                **self._counters,
+                'wait_time': self._wait_stats.to_dict(),
+                'run_time': self._run_stats.to_dict()
+            }
+
+    def cleanup_old_results(self) -> int:
+        """
+        Evict task results older than the backend's result TTL.
+        Runs periodically from the reaper thread.
+
+        Returns:
+            int: Number of results removed
         """
-        current_time = datetime.now(timezone.utc)
-        to_remove = []
-        
-        with self.results_lock:
-            for task_id, task_info in self.task_results.items():
-                completed_at = task_info.get('completed_at')
-                if completed_at:
-                    completed_time = datetime.fromisoformat(completed_at)
-                    age = (current_time - completed_time).total_seconds()
-                    if age > max_age_seconds:
-                        to_remove.append(task_id)
-            
-            for task_id in to_remove:
-                del self.task_results[task_id]
-        
-        if to_remove:
-            logger.info(f"Cleaned up {len(to_remove)} old task results")
+        removed = self.backend.cleanup()
+        if removed:
+            logger.info(f"Cleaned up {removed} old task results")
+        return removed
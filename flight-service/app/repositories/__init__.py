@@ -3,11 +3,13 @@ from app.domain.interfaces.repositories.iairline_repository import IAirlineRepos
 from app.domain.interfaces.repositories.iflight_repository import IFlightRepository
 from app.domain.interfaces.repositories.ibooking_repository import IBookingRepository
 from app.domain.interfaces.repositories.irating_repository import IRatingRepository
+from app.domain.interfaces.repositories.itable_version_repository import ITableVersionRepository
 from .airport_repository import SqlAlchemyAirportRepository
 from .airline_repository import SqlAlchemyAirlineRepository
 from .flight_repository import SqlAlchemyFlightRepository
 from .booking_repository import SqlAlchemyBookingRepository
 from .rating_repository import SqlAlchemyRatingRepository
+from .table_version_repository import SqlAlchemyTableVersionRepository
 
 __all__ = [
     'IAirportRepository',
@@ -15,9 +17,11 @@ __all__ = [
     'IFlightRepository',
     'IBookingRepository',
     'IRatingRepository',
+    'ITableVersionRepository',
     'SqlAlchemyAirportRepository',
     'SqlAlchemyAirlineRepository',
     'SqlAlchemyFlightRepository',
     'SqlAlchemyBookingRepository',
-    'SqlAlchemyRatingRepository'
+    'SqlAlchemyRatingRepository',
+    'SqlAlchemyTableVersionRepository'
 ]
\ No newline at end of file
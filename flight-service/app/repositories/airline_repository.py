@@ -1,7 +1,10 @@
-from typing import Optional, Dict
+from typing import List, Optional, Dict
+from sqlalchemy import Row
 from ..domain.models.flights import Airline
 from .. import db
 from app.domain.interfaces.repositories.iairline_repository import IAirlineRepository, AirlinePaginationResult
+from app.infrastructure.database import read_only, read_primary
+from .search import trigram_match, trigram_rank
 
 
 class SqlAlchemyAirlineRepository(IAirlineRepository):
@@ -11,14 +14,33 @@ class SqlAlchemyAirlineRepository(IAirlineRepository):
         db.session.refresh(airline)
         return airline
     
+    @read_only
     def get_airline_by_id(self, airline_id: int) -> Optional[Airline]:
         airline = Airline.query.get(airline_id)
         return airline if airline else None
     
+    @read_only
     def get_airline_by_name(self, name: str) -> Optional[Airline]:
         airline = Airline.query.filter_by(name=name).first()
         return airline if airline else None
 
+    @read_only
+    def search_airlines(self, term: str, limit: int = 10) -> List[Airline]:
+        """Fuzzy airline name search, best matches first"""
+        return (
+            Airline.query
+            .filter(trigram_match(Airline.name, term))
+            .order_by(trigram_rank(Airline.name, term).desc(), Airline.id)
+            .limit(limit)
+            .all()
+        )
+
+    @read_primary
+    def get_reference_rows(self) -> List[Row]:
+        # The cache stores these under the version it read just before, so a lagging replica would pin stale rows
+        return db.session.execute(db.select(Airline.id, Airline.name, Airline.created_at)).all()
+
+    @read_only
     def get_all_airlines(self, page: int = 1, per_page: int = 10) -> AirlinePaginationResult:
         query = Airline.query
         total = query.count()
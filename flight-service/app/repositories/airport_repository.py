@@ -1,7 +1,10 @@
 from typing import List, Optional, Dict
+from sqlalchemy import Row, or_
 from ..domain.models.flights import Airport
 from .. import db
 from app.domain.interfaces.repositories.iairport_repository import IAirportRepository, AirportPaginationResult
+from app.infrastructure.database import read_only, read_primary
+from .search import trigram_match, trigram_rank
 
 
 class SqlAlchemyAirportRepository(IAirportRepository):
@@ -11,14 +14,33 @@ class SqlAlchemyAirportRepository(IAirportRepository):
         db.session.refresh(airport)
         return airport
 
+    @read_only
     def get_airport_by_id(self, airport_id: int) -> Optional[Airport]:
         airport = Airport.query.get(airport_id)
         return airport if airport else None
 
+    @read_only
     def get_airport_by_code(self, airport_code: str) -> Optional[Airport]:
         airport = Airport.query.filter_by(code=airport_code).first()
         return airport
 
+    @read_only
+    def search_airports(self, term: str, limit: int = 10) -> List[Airport]:
+        """Fuzzy airport name search, best matches first; an exact code match ranks first"""
+        return (
+            Airport.query
+            .filter(or_(trigram_match(Airport.name, term), Airport.code == term.upper()))
+            .order_by((Airport.code == term.upper()).desc(), trigram_rank(Airport.name, term).desc(), Airport.id)
+            .limit(limit)
+            .all()
+        )
+
+    @read_primary
+    def get_reference_rows(self) -> List[Row]:
+        # The cache stores these under the version it read just before, so a lagging replica would pin stale rows
+        return db.session.execute(db.select(Airport.id, Airport.name, Airport.code, Airport.created_at)).all()
+
+    @read_only
     def get_all_airports(self, page: int = 1, per_page: int = 10) -> AirportPaginationResult:
         query = Airport.query
         total = query.count()
@@ -1,12 +1,55 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import Row, func
+from sqlalchemy.exc import IntegrityError
 from ..domain.models.flights import Booking, Flight 
 from .. import db
+from app.domain.models.enums import FlightStatus
+from app.domain.enums.booking_outcome import BookingOutcome
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
 from app.domain.interfaces.repositories.ibooking_repository import IBookingRepository, BookingPaginationResult
+from app.domain.enums.count_mode import CountMode
+from .pagination import apply_keyset, split_keyset_page
+from .counting import CountStrategy
+from .reference_loading import flight_loader_options, hydrate_flights
 from app.utils.logger_service import get_logger, LoggerService
+from app.infrastructure.database import read_only
 
 logger = get_logger(__name__)
 
 class SqlAlchemyBookingRepository(IBookingRepository):
+    # Sort key for cursor pagination
+    KEYSET_COLUMNS = (Booking.id,)
+
+    def __init__(self, count_strategy: Optional[CountStrategy] = None,
+                 reference_data: Optional[IReferenceDataCache] = None):
+        self.count_strategy = count_strategy or CountStrategy()
+        # Attaches airlines and airports to the loaded flights instead of joining them in
+        self.reference_data = reference_data
+
+    def _paginate(self, query, page: int, per_page: int, cursor: Optional[str],
+                  count_mode: CountMode, table: Optional[str] = None) -> BookingPaginationResult:
+        """Page by offset, or by keyset on KEYSET_COLUMNS when a cursor is given"""
+        total, total_mode = self.count_strategy.count(query, count_mode, table)
+        next_cursor = None
+        if cursor is None:
+            bookings = query.offset((page - 1) * per_page).limit(per_page).all()
+        else:
+            orms = apply_keyset(query, self.KEYSET_COLUMNS, cursor, per_page).all()
+            bookings, next_cursor = split_keyset_page(orms, self.KEYSET_COLUMNS, per_page)
+        pages = (total + per_page - 1) // per_page
+        hydrate_flights(self.reference_data, (booking.flight for booking in bookings))
+
+        return {
+            'bookings': bookings,
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': pages,
+            'next_cursor': next_cursor,
+            'total_mode': total_mode
+        }
+
     def save_booking(self, booking: Booking) -> Booking:
         LoggerService.log_database_operation(logger, 'INSERT', 'bookings',
                                            user_id=booking.user_id,
@@ -18,62 +61,89 @@ class SqlAlchemyBookingRepository(IBookingRepository):
                                      booking_id=booking.id)
         return booking
     
-    def get_booking_by_id(self, booking_id: int) -> Optional[Booking]:
-        booking = Booking.query.options(
-            db.joinedload(Booking.flight).joinedload(Flight.airline),
-            db.joinedload(Booking.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Booking.flight).joinedload(Flight.arrival_airport)
-        ).get(booking_id)
-        return booking if booking else None
-
-    def get_bookings_by_user(self, user_id: int, page: int = 1, per_page: int = 10) -> BookingPaginationResult:
-        query = Booking.query.filter_by(user_id=user_id).options(
-            db.joinedload(Booking.flight).joinedload(Flight.airline),
-            db.joinedload(Booking.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Booking.flight).joinedload(Flight.arrival_airport)
-        )
+    def reserve_seat(self, user_id: int, flight_id: int, now: datetime) -> Tuple[BookingOutcome, Optional[Booking]]:
+        """
+        Check and book a seat in one transaction.
 
-        total = query.count()
-        orms = query.offset((page - 1) * per_page).limit(per_page).all()
-        bookings = [orm for orm in orms]
-        pages = (total + per_page - 1) // per_page
+        The flight row is locked FOR UPDATE, so concurrent bookings of the same
+        flight serialize on the seat count and cannot oversell it; one booking
+        per user per flight is enforced by unique_user_flight_booking.
+        """
+        try:
+            flight = db.session.execute(
+                db.select(Flight).where(Flight.flight_id == flight_id).with_for_update()
+            ).scalar_one_or_none()
+            if flight is None:
+                db.session.rollback()
+                return BookingOutcome.FLIGHT_NOT_FOUND, None
 
-        return {
-            'bookings': bookings,
-            'page': page,
-            'per_page': per_page,
-            'total': total,
-            'pages': pages
-        }
+            if flight.status != FlightStatus.APPROVED or flight.departure_time <= now:
+                db.session.rollback()
+                return BookingOutcome.NOT_BOOKABLE, None
 
-    def get_all_bookings(self, page: int = 1, per_page: int = 10) -> BookingPaginationResult:
-        query = Booking.query.options(
-            db.joinedload(Booking.flight).joinedload(Flight.airline),
-            db.joinedload(Booking.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Booking.flight).joinedload(Flight.arrival_airport)
-        )
+            booked_seats = db.session.execute(
+                db.select(func.count(Booking.id)).where(Booking.flight_id == flight_id)
+            ).scalar_one()
+            if booked_seats >= flight.total_seats:
+                db.session.rollback()
+                return BookingOutcome.SOLD_OUT, None
 
-        total = query.count()
-        orms = query.offset((page - 1) * per_page).limit(per_page).all()
-        bookings = [orm for orm in orms]
-        pages = (total + per_page - 1) // per_page
+            booking = Booking(user_id=user_id, flight_id=flight_id)
+            db.session.add(booking)
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return BookingOutcome.DUPLICATE, None
+        except Exception:
+            db.session.rollback()
+            raise
 
-        return {
-            'bookings': bookings,
-            'page': page,
-            'per_page': per_page,
-            'total': total,
-            'pages': pages
-        }
+        LoggerService.log_database_operation(logger, 'INSERT', 'bookings',
+                                           booking_id=booking.id,
+                                           user_id=user_id,
+                                           flight_id=flight_id)
+        return BookingOutcome.CREATED, booking
+
+    @read_only
+    def get_booked_flight_arrival_time(self, user_id: int, flight_id: int) -> Optional[datetime]:
+        """One probe of the unique_user_flight_booking index plus a flight primary key lookup"""
+        return db.session.execute(
+            db.select(Flight.arrival_time)
+            .join(Booking, Booking.flight_id == Flight.flight_id)
+            .where(Booking.user_id == user_id, Booking.flight_id == flight_id)
+        ).scalar_one_or_none()
+
+    @read_only
+    def get_booking_by_id(self, booking_id: int) -> Optional[Booking]:
+        booking = Booking.query.options(*flight_loader_options(self.reference_data, via=Booking.flight)).get(booking_id)
+        if not booking:
+            return None
+        hydrate_flights(self.reference_data, [booking.flight])
+        return booking
+
+    @read_only
+    def get_bookings_by_user(self, user_id: int, page: int = 1, per_page: int = 10,
+                             cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> BookingPaginationResult:
+        query = Booking.query.filter_by(user_id=user_id).options(*flight_loader_options(self.reference_data, via=Booking.flight))
+
+        return self._paginate(query, page, per_page, cursor, count_mode)
 
+    @read_only
+    def get_all_bookings(self, page: int = 1, per_page: int = 10,
+                         cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> BookingPaginationResult:
+        query = Booking.query.options(*flight_loader_options(self.reference_data, via=Booking.flight))
+
+        return self._paginate(query, page, per_page, cursor, count_mode, table='bookings')
+
+    @read_only
     def get_bookings_by_flight_id(self, flight_id: int) -> List[Booking]:
         bookings = Booking.query.filter_by(flight_id=flight_id).options(
-            db.joinedload(Booking.flight).joinedload(Flight.airline),
-            db.joinedload(Booking.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Booking.flight).joinedload(Flight.arrival_airport)
+            *flight_loader_options(self.reference_data, via=Booking.flight)
         ).all()
+        hydrate_flights(self.reference_data, (booking.flight for booking in bookings))
         return bookings
     
+    @read_only
     def get_uid_bookings_by_flight_id(self, flight_id: int) -> List[int]:
         """Get list of user IDs who have booked this flight"""
         bookings = Booking.query.filter_by(flight_id=flight_id).all()
@@ -85,4 +155,27 @@ class SqlAlchemyBookingRepository(IBookingRepository):
             return False
         db.session.delete(booking)
         db.session.commit()
-        return True
\ No newline at end of file
+        return True
+
+    def iter_bookings_for_export(self, filters: Optional[Dict] = None, batch_size: int = 5000) -> Iterator[List[Row]]:
+        """Stream flat booking rows (with the flight name) in batches through a server-side cursor"""
+        query = (
+            db.select(
+                Booking.id,
+                Booking.user_id,
+                Booking.flight_id,
+                Flight.flight_name,
+                Flight.departure_time,
+                Booking.purchased_at
+            )
+            .outerjoin(Flight, Booking.flight_id == Flight.flight_id)
+            .order_by(Booking.id)
+        )
+        if filters and filters.get('user_id'):
+            query = query.where(Booking.user_id == filters['user_id'])
+        if filters and filters.get('flight_id'):
+            query = query.where(Booking.flight_id == filters['flight_id'])
+
+        result = db.session.execute(query.execution_options(yield_per=batch_size))
+        for batch in result.partitions():
+            yield batch
@@ -0,0 +1,123 @@
+"""
+Count strategies for paginated repository queries.
+
+EXACT runs COUNT(*) on the filtered query, CACHED reuses an exact count for
+the same filter fingerprint for a few seconds, and ESTIMATED reads the
+planner's row estimate (pg_class.reltuples for whole-table listings, EXPLAIN
+for filtered ones) so grids can show an approximate total without scanning.
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from app import db
+from app.domain.enums.count_mode import CountMode
+from app.utils.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executed with normally processed bind parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+class CountStrategy:
+    """Computes listing totals according to the requested CountMode"""
+
+    def __init__(self, cache_ttl: int = 30, max_entries: int = 1024):
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self._cache: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def count(self, query, mode: CountMode = CountMode.EXACT, table: Optional[str] = None) -> Tuple[int, str]:
+        """
+        Count the rows of a query.
+
+        Args:
+            query: The filtered listing query (ordering and eager loads are ignored)
+            mode: Requested count mode
+            table: Table name when the query is an unfiltered scan of that table,
+                   which allows the cheap pg_class estimate
+
+        Returns:
+            Tuple of (total, mode that actually produced it)
+        """
+        query = query.order_by(None).enable_eagerloads(False)
+
+        if mode == CountMode.CACHED:
+            return self._cached_count(query), CountMode.CACHED.value
+
+        if mode == CountMode.ESTIMATED:
+            estimate = self._estimated_count(query, table)
+            if estimate is not None:
+                return estimate, CountMode.ESTIMATED.value
+
+        return query.count(), CountMode.EXACT.value
+
+    def invalidate(self) -> None:
+        """Drop every cached count"""
+        with self._lock:
+            self._cache.clear()
+
+    def _cached_count(self, query) -> int:
+        key = self._fingerprint(query)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        total = query.count()
+
+        with self._lock:
+            if len(self._cache) >= self.max_entries:
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                if len(self._cache) >= self.max_entries:
+                    self._cache.clear()
+            self._cache[key] = (now + self.cache_ttl, total)
+        return total
+
+    def _estimated_count(self, query, table: Optional[str]) -> Optional[int]:
+        """Planner row estimate, or None when unavailable (non-PostgreSQL, never analyzed, ...)"""
+        if db.session.get_bind().dialect.name != 'postgresql':
+            return None
+
+        try:
+            # Savepoint so a failed estimate does not abort the surrounding transaction
+            with db.session.begin_nested():
+                if table:
+                    reltuples = db.session.execute(
+                        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                        {'table': table}
+                    ).scalar()
+                    # reltuples is -1 until the table has been vacuumed or analyzed
+                    return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+                plan = db.session.execute(_Explain(query.statement)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
+        except Exception as e:
+            logger.warning(f"Falling back to exact count: {str(e)}")
+            return None
+
+    @staticmethod
+    def _fingerprint(query) -> str:
+        compiled = query.statement.compile(compile_kwargs={'render_postcompile': True})
+        raw = f"{compiled}|{sorted(compiled.params.items(), key=lambda item: item[0])!r}"
+        return hashlib.sha1(raw.encode()).hexdigest()
@@ -1,17 +1,96 @@
-from typing import Optional, List, Dict
-from datetime import datetime
-from sqlalchemy import func
-from ..domain.models.flights import Booking, Flight
+from typing import Iterator, Optional, List, Dict
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import Row, func
+from ..domain.models.flights import Airline, Airport, Booking, Flight
 from ..domain.models.enums import FlightStatus
 from .. import db
 from app.domain.interfaces.repositories.iflight_repository import IFlightRepository, FlightPaginationResult
-from app.domain.types.repository_types import FlightUpdateData
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
+from app.domain.types.repository_types import FlightUpdateData, FlightTransition
 from app.utils.logger_service import get_logger, LoggerService
+from app.domain.enums.count_mode import CountMode
+from app.infrastructure.database import read_only
+from .pagination import apply_keyset, split_keyset_page
+from .counting import CountStrategy
+from .search import trigram_match, trigram_rank
+from .reference_loading import flight_loader_options, hydrate_flights
 
 logger = get_logger(__name__)
 
 
 class SqlAlchemyFlightRepository(IFlightRepository):
+    # Sort key for cursor pagination; flight_id breaks ties between equal departure times
+    KEYSET_COLUMNS = (Flight.departure_time, Flight.flight_id)
+
+    def __init__(self, count_strategy: Optional[CountStrategy] = None,
+                 reference_data: Optional[IReferenceDataCache] = None):
+        self.count_strategy = count_strategy or CountStrategy()
+        # Attaches airlines and airports to loaded flights instead of joining them in
+        self.reference_data = reference_data
+
+    @staticmethod
+    def _booked_seats_column():
+        """Correlated COUNT of bookings, evaluated only for the flights on the requested page"""
+        return (
+            db.select(func.count(Booking.id))
+            .where(Booking.flight_id == Flight.flight_id)
+            .correlate(Flight)
+            .scalar_subquery()
+            .label('booked_seats')
+        )
+
+    @staticmethod
+    def _apply_filters(query, filters: Optional[Dict]):
+        """Apply the search filters shared by the flight listing endpoints"""
+        if not filters:
+            return query
+
+        if filters.get('flight_name'):
+            search_filter = f"%{filters['flight_name']}%"
+            query = query.filter(Flight.flight_name.ilike(search_filter))
+
+        if filters.get('airline_id'):
+            query = query.filter_by(airline_id=filters['airline_id'])
+
+        if filters.get('status'):
+            query = query.filter_by(status=filters['status'])
+
+        if filters.get('departure_airport_id'):
+            query = query.filter_by(departure_airport_id=filters['departure_airport_id'])
+
+        if filters.get('arrival_airport_id'):
+            query = query.filter_by(arrival_airport_id=filters['arrival_airport_id'])
+
+        if filters.get('min_price'):
+            query = query.filter(Flight.price >= filters['min_price'])
+
+        if filters.get('max_price'):
+            query = query.filter(Flight.price <= filters['max_price'])
+
+        if filters.get('departure_date'):
+            # Half-open range on the raw column so idx_flights_departure_time stays usable
+            departure_date = filters['departure_date']
+            if not isinstance(departure_date, date):
+                departure_date = date.fromisoformat(str(departure_date))
+            day_start = datetime.combine(departure_date, time.min)
+            query = query.filter(
+                Flight.departure_time >= day_start,
+                Flight.departure_time < day_start + timedelta(days=1)
+            )
+
+        return query
+
+    def _fetch_with_available_seats(self, query) -> List[Flight]:
+        """Fetch flights with available_seats computed in the same statement"""
+        rows = query.add_columns(self._booked_seats_column()).all()
+
+        flights = []
+        for flight, booked_seats in rows:
+            flight.available_seats = flight.total_seats - booked_seats
+            flights.append(flight)
+        hydrate_flights(self.reference_data, flights)
+        return flights
+
     def save_flight(self, flight: Flight) -> Flight:
         LoggerService.log_database_operation(logger, 'INSERT', 'flights',
                                            flight_name=flight.flight_name,
@@ -23,15 +102,13 @@ class SqlAlchemyFlightRepository(IFlightRepository):
                                      flight_id=flight.flight_id)
         return flight
     
+    @read_only
     def get_flight_by_id(self, flight_id: int) -> Optional[Flight]:
         LoggerService.log_database_operation(logger, 'SELECT', 'flights',
                                            flight_id=flight_id)
-        flight = Flight.query.options(
-            db.joinedload(Flight.airline),
-            db.joinedload(Flight.departure_airport),
-            db.joinedload(Flight.arrival_airport)
-        ).get(flight_id)
+        flight = Flight.query.options(*flight_loader_options(self.reference_data)).get(flight_id)
         if flight:
+            hydrate_flights(self.reference_data, [flight])
             LoggerService.log_with_context(logger, 'DEBUG', 'Flight retrieved from database',
                                          flight_id=flight_id,
                                          found=True)
@@ -41,52 +118,31 @@ class SqlAlchemyFlightRepository(IFlightRepository):
                                          found=False)
         return flight
 
-    def get_all_flights(self, page: int = 1, per_page: int = 10, filters: Optional[Dict] = None) -> FlightPaginationResult:
-        query = Flight.query.options(
-            db.joinedload(Flight.airline),
-            db.joinedload(Flight.departure_airport),
-            db.joinedload(Flight.arrival_airport)
-        )
-
-        if filters:
-            if filters.get('flight_name'):
-                search_filter = f"%{filters['flight_name']}%"
-                query = query.filter(Flight.flight_name.ilike(search_filter))
-
-            if filters.get('airline_id'):
-                query = query.filter_by(airline_id=filters['airline_id'])
+    @read_only
+    def search_flights(self, term: str, limit: int = 10, filters: Optional[Dict] = None) -> List[Flight]:
+        """Fuzzy flight name search, best matches first"""
+        query = Flight.query.options(*flight_loader_options(self.reference_data)).filter(trigram_match(Flight.flight_name, term))
 
-            if filters.get('status'):
-                query = query.filter_by(status=filters['status'])
+        query = self._apply_filters(query, filters)
+        query = query.order_by(trigram_rank(Flight.flight_name, term).desc(), Flight.flight_id)
 
-            if filters.get('departure_airport_id'):
-                query = query.filter_by(departure_airport_id=filters['departure_airport_id'])
+        return self._fetch_with_available_seats(query.limit(limit))
 
-            if filters.get('arrival_airport_id'):
-                query = query.filter_by(arrival_airport_id=filters['arrival_airport_id'])
+    @read_only
+    def get_all_flights(self, page: int = 1, per_page: int = 10, filters: Optional[Dict] = None,
+                        cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
+        query = Flight.query.options(*flight_loader_options(self.reference_data))
 
-            if filters.get('min_price'):
-                query = query.filter(Flight.price >= filters['min_price'])
+        query = self._apply_filters(query, filters)
 
-            if filters.get('max_price'):
-                query = query.filter(Flight.price <= filters['max_price'])
-
-            if filters.get('departure_date'):
-                departure_date = filters['departure_date']
-                query = query.filter(
-                    func.date(Flight.departure_time) == departure_date
-                )
-
-        total = query.count()
-        orms = query.offset((page - 1) * per_page).limit(per_page).all()
-        
-        # Calculate available_seats for each flight
-        flights = []
-        for orm in orms:
-            booked_seats = Booking.query.filter_by(flight_id=orm.flight_id).count()
-            orm.available_seats = orm.total_seats - booked_seats
-            flights.append(orm)
-        
+        total, total_mode = self.count_strategy.count(query, count_mode, table=None if filters else 'flights')
+        next_cursor = None
+        if cursor is None:
+            flights = self._fetch_with_available_seats(query.offset((page - 1) * per_page).limit(per_page))
+        else:
+            keyset_query = apply_keyset(query, self.KEYSET_COLUMNS, cursor, per_page)
+            flights, next_cursor = split_keyset_page(self._fetch_with_available_seats(keyset_query),
+                                                     self.KEYSET_COLUMNS, per_page)
         pages = (total + per_page - 1) // per_page
 
         return {
@@ -94,7 +150,9 @@ class SqlAlchemyFlightRepository(IFlightRepository):
             'page': page,
             'per_page': per_page,
             'total': total,
-            'pages': pages
+            'pages': pages,
+            'next_cursor': next_cursor,
+            'total_mode': total_mode
         }
 
     def update_flight(self, flight: Flight) -> Optional[Flight]:
@@ -154,6 +212,7 @@ class SqlAlchemyFlightRepository(IFlightRepository):
         db.session.commit()
         return flight
 
+    @read_only
     def get_available_seats(self, flight_id: int) -> int:
         flight = Flight.query.get(flight_id)
         if not flight:
@@ -169,16 +228,13 @@ class SqlAlchemyFlightRepository(IFlightRepository):
         db.session.commit()
         return True
     
+    @read_only
     def get_flights_by_status(self, status: str, page: int = 1, per_page: int = 10) -> FlightPaginationResult:
         """Get flights filtered by status"""
-        query = Flight.query.options(
-            db.joinedload(Flight.airline),
-            db.joinedload(Flight.departure_airport),
-            db.joinedload(Flight.arrival_airport)
-        ).filter_by(status=FlightStatus[status])
+        query = Flight.query.options(*flight_loader_options(self.reference_data)).filter_by(status=FlightStatus[status])
         
         total = query.count()
-        flights = query.offset((page - 1) * per_page).limit(per_page).all()
+        flights = self._fetch_with_available_seats(query.offset((page - 1) * per_page).limit(per_page))
         pages = (total + per_page - 1) // per_page
         
         return {
@@ -189,6 +245,42 @@ class SqlAlchemyFlightRepository(IFlightRepository):
             'pages': pages
         }
     
+    @read_only
+    def get_flights_by_statuses(self, statuses: List[FlightStatus], page: int = 1, per_page: int = 10,
+                                filters: Optional[Dict] = None, departure_after: Optional[datetime] = None,
+                                order_by: str = 'departure_time', descending: bool = False,
+                                count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
+        """Get one ordered page of flights in any of the given statuses, optionally departing after a time"""
+        query = Flight.query.options(*flight_loader_options(self.reference_data)).filter(Flight.status.in_(statuses))
+
+        # The status set replaces any single-status filter
+        query = self._apply_filters(query, {k: v for k, v in (filters or {}).items() if k != 'status'})
+
+        if departure_after is not None:
+            # departure_time is stored as naive UTC
+            if departure_after.tzinfo is not None:
+                departure_after = departure_after.astimezone(timezone.utc).replace(tzinfo=None)
+            query = query.filter(Flight.departure_time > departure_after)
+
+        sort_column = getattr(Flight, order_by)
+        if descending:
+            query = query.order_by(sort_column.desc(), Flight.flight_id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), Flight.flight_id.asc())
+
+        total, total_mode = self.count_strategy.count(query, count_mode)
+        flights = self._fetch_with_available_seats(query.offset((page - 1) * per_page).limit(per_page))
+        pages = (total + per_page - 1) // per_page if total > 0 else 1
+
+        return {
+            'flights': flights,
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': pages,
+            'total_mode': total_mode
+        }
+    
     def get_flights_to_start(self, current_time: datetime) -> List[Flight]:
         """Get approved flights that should start"""
         return Flight.query.filter(
@@ -203,9 +295,142 @@ class SqlAlchemyFlightRepository(IFlightRepository):
             Flight.arrival_time <= current_time
         ).all()
     
+    def start_due_flights(self, current_time: datetime, batch_size: int = 1000) -> List[FlightTransition]:
+        """Start one batch of approved flights whose departure time has passed"""
+        now = self._naive_utc(current_time)
+        return self._transition_batch(
+            Flight.status == FlightStatus.APPROVED,
+            Flight.departure_time <= now,
+            order_by=Flight.departure_time,
+            values={'status': FlightStatus.IN_PROGRESS, 'actual_start_time': now},
+            batch_size=batch_size
+        )
+
+    def complete_due_flights(self, current_time: datetime, batch_size: int = 1000) -> List[FlightTransition]:
+        """Complete one batch of in-progress flights whose arrival time has passed"""
+        now = self._naive_utc(current_time)
+        return self._transition_batch(
+            Flight.status == FlightStatus.IN_PROGRESS,
+            Flight.arrival_time <= now,
+            order_by=Flight.arrival_time,
+            values={'status': FlightStatus.COMPLETED},
+            batch_size=batch_size
+        )
+
+    def has_due_transitions(self, current_time: datetime) -> bool:
+        """Due flights left behind by the batches (rows that were locked), read from the primary"""
+        now = self._naive_utc(current_time)
+        departures = db.select(Flight.flight_id).where(Flight.status == FlightStatus.APPROVED,
+                                                       Flight.departure_time <= now)
+        arrivals = db.select(Flight.flight_id).where(Flight.status == FlightStatus.IN_PROGRESS,
+                                                     Flight.arrival_time <= now)
+        return bool(db.session.execute(db.select(db.or_(departures.exists(), arrivals.exists()))).scalar())
+
+    def get_transition_deadlines(self, current_time: datetime, until: datetime, limit: int = 10000) -> List[datetime]:
+        """Next scheduler deadlines, read from the status/departure and in-progress arrival indexes"""
+        now, until = self._naive_utc(current_time), self._naive_utc(until)
+        departures = (
+            db.select(Flight.departure_time.label('deadline'))
+            .where(Flight.status == FlightStatus.APPROVED,
+                   Flight.departure_time > now, Flight.departure_time <= until)
+        )
+        arrivals = (
+            db.select(Flight.arrival_time.label('deadline'))
+            .where(Flight.status == FlightStatus.IN_PROGRESS,
+                   Flight.arrival_time > now, Flight.arrival_time <= until)
+        )
+        deadlines = db.union_all(departures, arrivals).subquery()
+        statement = db.select(deadlines.c.deadline).order_by(deadlines.c.deadline).limit(limit)
+        return list(db.session.execute(statement).scalars())
+
+    @staticmethod
+    def _naive_utc(value: datetime) -> datetime:
+        """Flight times are stored as naive UTC"""
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def _transition_batch(self, *criteria, order_by, values: Dict, batch_size: int) -> List[FlightTransition]:
+        """
+        UPDATE ... WHERE flight_id IN (due batch) RETURNING the moved rows, in one transaction.
+
+        SKIP LOCKED lets a concurrent booking or admin update keep its row; the
+        scheduler sees the flight is still due (has_due_transitions) and
+        retries it shortly. The outer criteria re-check the status so a row
+        changed in between is never transitioned twice.
+        """
+        due = (
+            db.select(Flight.flight_id)
+            .where(*criteria)
+            .order_by(order_by)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            db.update(Flight)
+            .where(Flight.flight_id.in_(due.scalar_subquery()), *criteria)
+            .values(**values)
+            .returning(Flight.flight_id, Flight.flight_name, Flight.departure_time, Flight.arrival_time)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            rows = db.session.execute(statement).all()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return [
+            {'flight_id': row.flight_id, 'flight_name': row.flight_name,
+             'departure_time': row.departure_time, 'arrival_time': row.arrival_time}
+            for row in rows
+        ]
+
+    @read_only
     def get_flight_price(self, flight_id: int) -> Optional[float]:
         """Get the price of a flight"""
         flight = Flight.query.get(flight_id)
         if not flight:
             return None
-        return flight.price
\ No newline at end of file
+        return flight.price
+
+    def iter_flights_for_export(self, filters: Optional[Dict] = None, batch_size: int = 5000) -> Iterator[List[Row]]:
+        """
+        Stream flat flight rows matching the get_all_flights filters, batch by batch.
+
+        yield_per fetches through a server-side cursor, so only one batch of
+        rows is held in memory at a time.
+        """
+        departure_airport = db.aliased(Airport)
+        arrival_airport = db.aliased(Airport)
+        # Filters first: filter_by applies to the last joined entity
+        query = self._apply_filters(db.session.query(Flight).select_from(Flight), filters)
+        query = (
+            query.with_entities(
+                Flight.flight_id,
+                Flight.flight_name,
+                Flight.airline_id,
+                Airline.name.label('airline_name'),
+                departure_airport.code.label('departure_airport_code'),
+                arrival_airport.code.label('arrival_airport_code'),
+                Flight.departure_time,
+                Flight.arrival_time,
+                Flight.flight_duration,
+                Flight.flight_distance_km,
+                Flight.price,
+                Flight.total_seats,
+                Flight.status,
+                Flight.created_by,
+                Flight.approved_by,
+                Flight.actual_start_time,
+                Flight.created_at,
+                Flight.updated_at
+            )
+            .outerjoin(Airline, Flight.airline_id == Airline.id)
+            .outerjoin(departure_airport, Flight.departure_airport_id == departure_airport.id)
+            .outerjoin(arrival_airport, Flight.arrival_airport_id == arrival_airport.id)
+            .order_by(Flight.flight_id)
+        )
+        result = db.session.execute(query.statement.execution_options(yield_per=batch_size))
+        for batch in result.partitions():
+            yield batch
@@ -0,0 +1,82 @@
+"""
+Keyset (cursor) pagination helpers shared by the SQLAlchemy repositories.
+
+A cursor is an opaque, URL-safe token holding the sort key values of the last
+row of a page. The next page is read with a row-value comparison on those
+columns, which the database answers with an index range scan instead of
+walking and discarding OFFSET rows.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import tuple_
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by encode_cursor for the given key columns.
+
+    Returns None for an empty cursor (first page) and raises ValueError
+    if the cursor is malformed or does not match the columns.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+    if not isinstance(payload, list) or len(payload) != len(columns):
+        raise ValueError('Invalid cursor')
+
+    return [_decode_value(column, value) for column, value in zip(columns, payload)]
+
+
+def _decode_value(column: Any, value: Any) -> Any:
+    """Convert a cursor value back to its column's Python type, rejecting values of any other type"""
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise ValueError('Invalid cursor')
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError) as e:
+            raise ValueError('Invalid cursor') from e
+    # bool is an int subclass, but JSON true/false is never a valid integer key
+    if isinstance(value, bool) or not isinstance(value, python_type):
+        raise ValueError('Invalid cursor')
+    return value
+
+
+def apply_keyset(query, columns: Sequence[Any], cursor: str, per_page: int):
+    """
+    Order the query by the key columns and position it after the cursor.
+
+    One extra row is fetched so split_keyset_page can tell whether there is
+    a next page without a separate query.
+    """
+    query = query.order_by(*[column.asc() for column in columns])
+    values = decode_cursor(cursor, columns)
+    if values is not None:
+        query = query.filter(tuple_(*columns) > tuple_(*values))
+    return query.limit(per_page + 1)
+
+
+def split_keyset_page(items: List[Any], columns: Sequence[Any], per_page: int) -> Tuple[List[Any], Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page (None on the last page)"""
+    if len(items) <= per_page:
+        return items, None
+    items = items[:per_page]
+    last = items[-1]
+    return items, encode_cursor([getattr(last, column.key) for column in columns])
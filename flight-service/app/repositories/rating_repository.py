@@ -1,62 +1,91 @@
-from typing import Optional
-from ..domain.models.flights import Rating, Flight
+from typing import Dict, Iterator, List, Optional
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from ..domain.models.flights import Airline, AirlineRatingSummary, FlightRatingSummary, Rating, Flight
 from .. import db
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
 from app.domain.interfaces.repositories.irating_repository import IRatingRepository, RatingPaginationResult
+from app.domain.enums.count_mode import CountMode
+from app.domain.types.rating_types import RatingSummary
+from app.infrastructure.database import read_only
+from .pagination import apply_keyset, split_keyset_page
+from .counting import CountStrategy
+from .reference_loading import flight_loader_options, hydrate_flights
 
 class SqlAlchemyRatingRepository(IRatingRepository):
-    def save_rating(self, rating: Rating) -> Rating:
-        db.session.add(rating)
-        db.session.commit()
-        db.session.refresh(rating)
-        return rating
+    # Sort key for cursor pagination
+    KEYSET_COLUMNS = (Rating.id,)
 
-    def get_rating_by_id(self, rating_id: int) -> Optional[Rating]:
-        rating = Rating.query.options(
-            db.joinedload(Rating.flight).joinedload(Flight.airline),
-            db.joinedload(Rating.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Rating.flight).joinedload(Flight.arrival_airport)
-        ).get(rating_id)
-        return rating if rating else None
-
-    def get_ratings_by_user(self, user_id: int, page: int = 1, per_page: int = 10) -> RatingPaginationResult:
-        query = Rating.query.filter_by(user_id=user_id).options(
-            db.joinedload(Rating.flight).joinedload(Flight.airline),
-            db.joinedload(Rating.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Rating.flight).joinedload(Flight.arrival_airport)
-        )
+    def __init__(self, count_strategy: Optional[CountStrategy] = None,
+                 reference_data: Optional[IReferenceDataCache] = None):
+        self.count_strategy = count_strategy or CountStrategy()
+        # Attaches airlines and airports to the loaded flights instead of joining them in
+        self.reference_data = reference_data
 
-        total = query.count()
-        orms = query.offset((page - 1) * per_page).limit(per_page).all()
-        ratings = [orm for orm in orms]
+    def _paginate(self, query, page: int, per_page: int, cursor: Optional[str],
+                  count_mode: CountMode, table: Optional[str] = None) -> RatingPaginationResult:
+        """Page by offset, or by keyset on KEYSET_COLUMNS when a cursor is given"""
+        total, total_mode = self.count_strategy.count(query, count_mode, table)
+        next_cursor = None
+        if cursor is None:
+            ratings = query.offset((page - 1) * per_page).limit(per_page).all()
+        else:
+            orms = apply_keyset(query, self.KEYSET_COLUMNS, cursor, per_page).all()
+            ratings, next_cursor = split_keyset_page(orms, self.KEYSET_COLUMNS, per_page)
         pages = (total + per_page - 1) // per_page
+        hydrate_flights(self.reference_data, (rating.flight for rating in ratings))
 
         return {
             'ratings': ratings,
             'page': page,
             'per_page': per_page,
             'total': total,
-            'pages': pages
+            'pages': pages,
+            'next_cursor': next_cursor,
+            'total_mode': total_mode
         }
 
-    def get_all_ratings(self, page: int = 1, per_page: int = 10) -> RatingPaginationResult:
-        query = Rating.query.options(
-            db.joinedload(Rating.flight).joinedload(Flight.airline),
-            db.joinedload(Rating.flight).joinedload(Flight.departure_airport),
-            db.joinedload(Rating.flight).joinedload(Flight.arrival_airport)
-        )
+    def save_rating(self, rating: Rating) -> Rating:
+        db.session.add(rating)
+        db.session.commit()
+        db.session.refresh(rating)
+        return rating
 
-        total = query.count()
-        orms = query.offset((page - 1) * per_page).limit(per_page).all()
-        ratings = [orm for orm in orms]
-        pages = (total + per_page - 1) // per_page
+    def create_rating(self, rating: Rating) -> Optional[Rating]:
+        """
+        Insert without checking for an earlier rating first: one rating per user
+        per flight is enforced by unique_user_flight_rating, so a duplicate (even
+        a concurrent one) fails the insert and returns None.
+        """
+        try:
+            db.session.add(rating)
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return None
+        return rating
 
-        return {
-            'ratings': ratings,
-            'page': page,
-            'per_page': per_page,
-            'total': total,
-            'pages': pages
-        }
+    @read_only
+    def get_rating_by_id(self, rating_id: int) -> Optional[Rating]:
+        rating = Rating.query.options(*flight_loader_options(self.reference_data, via=Rating.flight)).get(rating_id)
+        if not rating:
+            return None
+        hydrate_flights(self.reference_data, [rating.flight])
+        return rating
+
+    @read_only
+    def get_ratings_by_user(self, user_id: int, page: int = 1, per_page: int = 10,
+                            cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
+        query = Rating.query.filter_by(user_id=user_id).options(*flight_loader_options(self.reference_data, via=Rating.flight))
+
+        return self._paginate(query, page, per_page, cursor, count_mode)
+
+    @read_only
+    def get_all_ratings(self, page: int = 1, per_page: int = 10,
+                        cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
+        query = Rating.query.options(*flight_loader_options(self.reference_data, via=Rating.flight))
+
+        return self._paginate(query, page, per_page, cursor, count_mode, table='ratings')
 
     def delete_rating(self, rating_id: int) -> bool:
         rating = Rating.query.get(rating_id)
@@ -64,4 +93,61 @@ class SqlAlchemyRatingRepository(IRatingRepository):
             return False
         db.session.delete(rating)
         db.session.commit()
-        return True
\ No newline at end of file
+        return True
+
+    def iter_ratings_for_export(self, filters: Optional[Dict] = None, batch_size: int = 5000) -> Iterator[List[Row]]:
+        """Stream flat rating rows (with flight and airline names) in batches through a server-side cursor"""
+        query = (
+            db.select(
+                Rating.id,
+                Rating.user_id,
+                Rating.flight_id,
+                Flight.flight_name,
+                Flight.airline_id,
+                Airline.name.label('airline_name'),
+                Rating.rating,
+                Rating.created_at
+            )
+            .outerjoin(Flight, Rating.flight_id == Flight.flight_id)
+            .outerjoin(Airline, Flight.airline_id == Airline.id)
+            .order_by(Rating.id)
+        )
+        if filters and filters.get('user_id'):
+            query = query.where(Rating.user_id == filters['user_id'])
+        if filters and filters.get('flight_id'):
+            query = query.where(Rating.flight_id == filters['flight_id'])
+
+        result = db.session.execute(query.execution_options(yield_per=batch_size))
+        for batch in result.partitions():
+            yield batch
+
+    @staticmethod
+    def _to_summary(summary) -> RatingSummary:
+        """Shape a summary row; entities without one yet have no ratings"""
+        histogram = {str(value): getattr(summary, f'rating_{value}') if summary else 0 for value in range(1, 6)}
+        count = summary.rating_count if summary else 0
+        total = summary.rating_sum if summary else 0
+        return {
+            'count': count,
+            'sum': total,
+            'average': round(total / count, 2) if count else None,
+            'histogram': histogram
+        }
+
+    @read_only
+    def get_flight_rating_summary(self, flight_id: int) -> Optional[RatingSummary]:
+        row = db.session.execute(
+            db.select(Flight.flight_id, FlightRatingSummary)
+            .outerjoin(FlightRatingSummary, FlightRatingSummary.flight_id == Flight.flight_id)
+            .where(Flight.flight_id == flight_id)
+        ).one_or_none()
+        return self._to_summary(row[1]) if row else None
+
+    @read_only
+    def get_airline_rating_summary(self, airline_id: int) -> Optional[RatingSummary]:
+        row = db.session.execute(
+            db.select(Airline.id, AirlineRatingSummary)
+            .outerjoin(AirlineRatingSummary, AirlineRatingSummary.airline_id == Airline.id)
+            .where(Airline.id == airline_id)
+        ).one_or_none()
+        return self._to_summary(row[1]) if row else None
@@ -0,0 +1,35 @@
+"""
+Loading of flights' airline and airports, shared by the SQLAlchemy repositories.
+
+With a reference data cache the flights are queried on their own and the
+cache attaches their airline and airports afterwards; without one, the
+three tables are joined into the query.
+"""
+from typing import Iterable, List, Optional
+from app import db
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
+from app.domain.models.flights import Flight
+
+
+def flight_loader_options(reference_data: Optional[IReferenceDataCache], via=None) -> List:
+    """
+    Loader options for the flights of a query.
+
+    Args:
+        reference_data: The cache that will hydrate the flights, if any
+        via: Relationship leading to the flight (e.g. Booking.flight), None when querying flights
+    """
+    if via is not None and reference_data is not None:
+        return [db.joinedload(via)]
+    if reference_data is not None:
+        return []
+    references = (Flight.airline, Flight.departure_airport, Flight.arrival_airport)
+    if via is None:
+        return [db.joinedload(reference) for reference in references]
+    return [db.joinedload(via).joinedload(reference) for reference in references]
+
+
+def hydrate_flights(reference_data: Optional[IReferenceDataCache], flights: Iterable[Optional[Flight]]) -> None:
+    """Attach the airline and airports of flights queried with flight_loader_options"""
+    if reference_data is not None:
+        reference_data.hydrate_flights(flights)
@@ -1,11 +1,13 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from sqlalchemy import or_
-from app.domain.models.flights import Flight
+from sqlalchemy import Row
+from app.domain.models.flights import Airline, Airport, Flight, TableVersion
 from app.domain.models.enums import FlightStatus
 from app.domain.interfaces.repositories.ireport_repository import IReportRepository
+from app.domain.types.report_types import ReportSectionSummary
 from app import db
 from app.utils.logger_service import get_logger, LoggerService
+from app.infrastructure.database import read_only
 
 logger = get_logger(__name__)
 
@@ -13,54 +15,149 @@ logger = get_logger(__name__)
 class SqlAlchemyReportRepository(IReportRepository):
     """SQLAlchemy implementation of report repository"""
 
-    def get_upcoming_flights(self) -> List[Flight]:
+    def _flight_rows(self, *columns):
+        """Select only the printed columns, with airline and airport names joined in (no ORM hydration)"""
+        departure_airport = db.aliased(Airport)
+        arrival_airport = db.aliased(Airport)
+        return (
+            db.select(
+                Flight.flight_name,
+                Airline.name.label('airline_name'),
+                departure_airport.code.label('departure_code'),
+                arrival_airport.code.label('arrival_code'),
+                Flight.departure_time,
+                Flight.arrival_time,
+                *columns
+            )
+            .join(Airline, Flight.airline_id == Airline.id)
+            .join(departure_airport, Flight.departure_airport_id == departure_airport.id)
+            .join(arrival_airport, Flight.arrival_airport_id == arrival_airport.id)
+        )
+
+    @read_only(background=True)
+    def get_upcoming_flights(self) -> List[Row]:
         """Get all upcoming flights (APPROVED status, not yet departed)"""
         LoggerService.log_with_context(logger, 'DEBUG', 'Getting upcoming flights')
-        
-        flights = Flight.query.options(
-            db.joinedload(Flight.airline),
-            db.joinedload(Flight.departure_airport),
-            db.joinedload(Flight.arrival_airport)
-        ).filter(
-            Flight.status == FlightStatus.APPROVED,
-            Flight.departure_time > datetime.utcnow()
-        ).order_by(Flight.departure_time.asc()).all()
-        
+
+        flights = db.session.execute(
+            self._flight_rows(
+                Flight.flight_duration,
+                Flight.flight_distance_km,
+                Flight.price,
+                Flight.total_seats,
+                Flight.created_by
+            ).where(
+                Flight.status == FlightStatus.APPROVED,
+                Flight.departure_time > datetime.utcnow()
+            ).order_by(Flight.departure_time.asc())
+        ).all()
+
         LoggerService.log_with_context(logger, 'INFO', 'Retrieved upcoming flights',
                                       count=len(flights))
         return flights
 
-    def get_in_progress_flights(self) -> List[Flight]:
+    @read_only(background=True)
+    def get_in_progress_flights(self) -> List[Row]:
         """Get all in-progress flights (IN_PROGRESS status)"""
         LoggerService.log_with_context(logger, 'DEBUG', 'Getting in-progress flights')
-        
-        flights = Flight.query.options(
-            db.joinedload(Flight.airline),
-            db.joinedload(Flight.departure_airport),
-            db.joinedload(Flight.arrival_airport)
-        ).filter(
-            Flight.status == FlightStatus.IN_PROGRESS
-        ).order_by(Flight.departure_time.asc()).all()
-        
+
+        flights = db.session.execute(
+            self._flight_rows(
+                Flight.actual_start_time,
+                Flight.flight_duration,
+                Flight.flight_distance_km,
+                Flight.price
+            ).where(
+                Flight.status == FlightStatus.IN_PROGRESS
+            ).order_by(Flight.departure_time.asc())
+        ).all()
+
         LoggerService.log_with_context(logger, 'INFO', 'Retrieved in-progress flights',
                                       count=len(flights))
         return flights
 
-    def get_completed_flights(self) -> List[Flight]:
-        """Get all completed and cancelled flights"""
+    @read_only(background=True)
+    def get_completed_flights(self, limit: Optional[int] = None) -> List[Row]:
+        """Get completed and cancelled flights, most recently updated first"""
         LoggerService.log_with_context(logger, 'DEBUG', 'Getting completed/cancelled flights')
-        
-        flights = Flight.query.options(
-            db.joinedload(Flight.airline),
-            db.joinedload(Flight.departure_airport),
-            db.joinedload(Flight.arrival_airport)
-        ).filter(
-            or_(
-                Flight.status == FlightStatus.COMPLETED,
-                Flight.status == FlightStatus.CANCELLED
-            )
-        ).order_by(Flight.updated_at.desc()).all()
-        
+
+        query = self._flight_rows(
+            Flight.price,
+            Flight.status,
+            Flight.updated_at
+        ).where(
+            Flight.status.in_([FlightStatus.COMPLETED, FlightStatus.CANCELLED])
+        ).order_by(Flight.updated_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        flights = db.session.execute(query).all()
+
         LoggerService.log_with_context(logger, 'INFO', 'Retrieved completed/cancelled flights',
                                       count=len(flights))
         return flights
+
+    @read_only(background=True)
+    def get_report_summary(self) -> Dict[str, ReportSectionSummary]:
+        """Counts, revenue and seats per report section in one grouped aggregate query"""
+        section = db.case(
+            (db.and_(Flight.status == FlightStatus.APPROVED, Flight.departure_time > datetime.utcnow()), 'upcoming'),
+            (Flight.status == FlightStatus.IN_PROGRESS, 'in_progress'),
+            (Flight.status == FlightStatus.COMPLETED, 'completed'),
+            (Flight.status == FlightStatus.CANCELLED, 'cancelled')
+        ).label('section')
+
+        rows = db.session.execute(
+            db.select(
+                section,
+                db.func.count(Flight.flight_id),
+                db.func.coalesce(db.func.sum(Flight.price * Flight.total_seats), 0),
+                db.func.coalesce(db.func.sum(Flight.total_seats), 0)
+            ).where(
+                Flight.status.in_([FlightStatus.APPROVED, FlightStatus.IN_PROGRESS,
+                                   FlightStatus.COMPLETED, FlightStatus.CANCELLED])
+            ).group_by(section)
+        ).all()
+
+        summary: Dict[str, ReportSectionSummary] = {
+            name: {'count': 0, 'revenue': 0.0, 'seats': 0}
+            for name in ('upcoming', 'in_progress', 'completed', 'cancelled')
+        }
+        for name, count, revenue, seats in rows:
+            # Approved flights that already departed fall outside every section
+            if name is not None:
+                summary[name] = {'count': count, 'revenue': float(revenue), 'seats': int(seats)}
+        return summary
+
+    @read_only(background=True)
+    def get_report_fingerprint(self, report_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        One aggregate (count, max updated_at) query per section, using the
+        status indexes, plus the airlines and airports table versions: the
+        report prints airline names and airport codes, which change without
+        touching the flights.
+        """
+        sections = {
+            'upcoming': [Flight.status == FlightStatus.APPROVED, Flight.departure_time > datetime.utcnow()],
+            'in_progress': [Flight.status == FlightStatus.IN_PROGRESS],
+            'completed': [Flight.status.in_([FlightStatus.COMPLETED, FlightStatus.CANCELLED])]
+        }
+
+        fingerprint = {}
+        for report_type in report_types:
+            count, updated_at = db.session.execute(
+                db.select(db.func.count(Flight.flight_id), db.func.max(Flight.updated_at))
+                .where(*sections[report_type])
+            ).one()
+            fingerprint[report_type] = {
+                'count': count,
+                'updated_at': updated_at.isoformat() if updated_at else None
+            }
+
+        rows = db.session.execute(
+            db.select(TableVersion.table_name, db.func.sum(TableVersion.version))
+            .where(TableVersion.table_name.in_(('airlines', 'airports')))
+            .group_by(TableVersion.table_name)
+        ).all()
+        fingerprint['reference_versions'] = {'airlines': 0, 'airports': 0}
+        fingerprint['reference_versions'].update((table_name, int(version)) for table_name, version in rows)
+        return fingerprint
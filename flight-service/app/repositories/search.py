@@ -0,0 +1,24 @@
+"""
+Trigram (pg_trgm) fuzzy name search helpers shared by the SQLAlchemy repositories.
+
+The match predicate only uses operators that the gin_trgm_ops indexes created
+in init-docker-scripts/flights_db can answer: % (whole-string similarity),
+<% (the term is similar to some word of the name, so short terms match long
+names) and ILIKE substring matching. Results are ranked by the better of the
+two similarity scores, so typos still surface the intended name first.
+"""
+from sqlalchemy import func, literal, or_
+
+
+def trigram_match(column, term: str):
+    """Predicate: the column is similar to the term or contains it"""
+    return or_(
+        column.op('%', is_comparison=True)(term),
+        literal(term).op('<%', is_comparison=True)(column),
+        column.icontains(term, autoescape=True)
+    )
+
+
+def trigram_rank(column, term: str):
+    """Similarity score in [0, 1] used to order matches, best first"""
+    return func.greatest(func.similarity(column, term), func.word_similarity(term, column))
@@ -0,0 +1,22 @@
+from typing import Dict, Iterable
+from app.domain.models.flights import TableVersion
+from app.domain.interfaces.repositories.itable_version_repository import ITableVersionRepository
+from app.infrastructure.database import read_only
+from app import db
+
+
+class SqlAlchemyTableVersionRepository(ITableVersionRepository):
+    """SQLAlchemy implementation of the table version repository"""
+
+    @read_only
+    def get_versions(self, tables: Iterable[str]) -> Dict[str, int]:
+        """Sum each table's counter slots in one statement"""
+        tables = list(tables)
+        rows = db.session.execute(
+            db.select(TableVersion.table_name, db.func.sum(TableVersion.version))
+            .where(TableVersion.table_name.in_(tables))
+            .group_by(TableVersion.table_name)
+        ).all()
+        versions = dict.fromkeys(tables, 0)
+        versions.update((table_name, int(version)) for table_name, version in rows)
+        return versions
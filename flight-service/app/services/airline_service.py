@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import List, Optional
 from ..domain.models.flights import Airline
 from app.domain.interfaces.repositories.iairline_repository import IAirlineRepository
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
 from app.domain.interfaces.services.airline_service_interface import AirlineServiceInterface
 from app.domain.dtos.airline_dto import AirlineCreateDTO, AirlineUpdateDTO
 from app.domain.interfaces.repositories.iairline_repository import AirlinePaginationResult
@@ -9,8 +10,10 @@ from app.domain.interfaces.repositories.iairline_repository import AirlinePagina
 class AirlineService(AirlineServiceInterface):
     """Service layer for airline operations with business logic validation."""
     
-    def __init__(self, airline_repository: IAirlineRepository):
+    def __init__(self, airline_repository: IAirlineRepository,
+                 reference_data: Optional[IReferenceDataCache] = None):
         self.airline_repository = airline_repository
+        self.reference_data = reference_data
 
     def create_airline(self, data: AirlineCreateDTO) -> Optional[Airline]:
         """Create a new airline."""
@@ -21,9 +24,11 @@ class AirlineService(AirlineServiceInterface):
         
         airline = Airline(name=data.name)
         try:
-            return self.airline_repository.save_airline(airline)
+            saved = self.airline_repository.save_airline(airline)
         except Exception:
             return None
+        self._invalidate_reference_data()
+        return saved
 
     def get_airline(self, airline_id: int) -> Optional[Airline]:
         """Retrieve an airline by ID."""
@@ -36,6 +41,14 @@ class AirlineService(AirlineServiceInterface):
         name = name.strip()
         return self.airline_repository.get_airline_by_name(name)
 
+    def search_airlines(self, term: str, limit: int = 10) -> List[Airline]:
+        """Fuzzy search airlines by name, best matches first."""
+        term = term.strip() if term else ''
+        if not term:
+            return []
+        limit = min(max(limit, 1), 50)
+        return self.airline_repository.search_airlines(term, limit)
+
     def get_all_airlines(self, page: int = 1, per_page: int = 10) -> AirlinePaginationResult:
         """Retrieve all airlines with pagination."""
         if page < 1:
@@ -61,10 +74,21 @@ class AirlineService(AirlineServiceInterface):
             if self.get_airline_by_name(data.name) is not None:
                 return None  # Indicate failure - duplicate or same name
         
-        return self.airline_repository.update_airline(airline_id, update_dict)
+        updated = self.airline_repository.update_airline(airline_id, update_dict)
+        if updated is not None:
+            self._invalidate_reference_data()
+        return updated
 
     def delete_airline(self, airline_id: int) -> bool:
         """Delete an airline by ID."""
         if airline_id <= 0:
             return False
-        return self.airline_repository.delete_airline(airline_id)
+        deleted = self.airline_repository.delete_airline(airline_id)
+        if deleted:
+            self._invalidate_reference_data()
+        return deleted
+
+    def _invalidate_reference_data(self) -> None:
+        """Have every process reload its cached airports and airlines after a committed write"""
+        if self.reference_data is not None:
+            self.reference_data.invalidate()
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import List, Optional
 from ..domain.models.flights import Airport
 from app.domain.interfaces.repositories.iairport_repository import IAirportRepository
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
 from app.domain.interfaces.services.airport_service_interface import AirportServiceInterface
 from app.domain.dtos.airport_dto import AirportCreateDTO, AirportUpdateDTO
 from app.domain.interfaces.repositories.iairport_repository import AirportPaginationResult
@@ -9,8 +10,10 @@ from app.domain.interfaces.repositories.iairport_repository import AirportPagina
 class AirportService(AirportServiceInterface):
     """Service layer for airport operations with business logic validation."""
     
-    def __init__(self, airport_repository: IAirportRepository):
+    def __init__(self, airport_repository: IAirportRepository,
+                 reference_data: Optional[IReferenceDataCache] = None):
         self.airport_repository = airport_repository
+        self.reference_data = reference_data
 
     def create_airport(self, data: AirportCreateDTO) -> Optional[Airport]:
         """Create a new airport."""
@@ -22,7 +25,9 @@ class AirportService(AirportServiceInterface):
             return None  # Indicate failure - duplicate code
         
         airport = Airport(name=data.name, code=data.code)
-        return self.airport_repository.save_airport(airport)
+        saved = self.airport_repository.save_airport(airport)
+        self._invalidate_reference_data()
+        return saved
 
     def get_airport(self, airport_id: int) -> Optional[Airport]:
         """Retrieve an airport by ID."""
@@ -30,6 +35,14 @@ class AirportService(AirportServiceInterface):
             return None
         return self.airport_repository.get_airport_by_id(airport_id)
 
+    def search_airports(self, term: str, limit: int = 10) -> List[Airport]:
+        """Fuzzy search airports by name, best matches first."""
+        term = term.strip() if term else ''
+        if not term:
+            return []
+        limit = min(max(limit, 1), 50)
+        return self.airport_repository.search_airports(term, limit)
+
     def get_all_airports(self, page: int = 1, per_page: int = 10) -> AirportPaginationResult:
         """Retrieve all airports with pagination."""
         return self.airport_repository.get_all_airports(page=page, per_page=per_page)
@@ -50,13 +63,19 @@ class AirportService(AirportServiceInterface):
         if data.code is not None:
             update_dict['code'] = data.code.upper().strip()
         
-        return self.airport_repository.update_airport(airport_id, update_dict)
+        updated = self.airport_repository.update_airport(airport_id, update_dict)
+        if updated is not None:
+            self._invalidate_reference_data()
+        return updated
 
     def delete_airport(self, airport_id: int) -> bool:
         """Delete an airport by ID."""
         if airport_id <= 0:
             return False
-        return self.airport_repository.delete_airport(airport_id)
+        deleted = self.airport_repository.delete_airport(airport_id)
+        if deleted:
+            self._invalidate_reference_data()
+        return deleted
 
     def fetch_airport_info(self, airport_code: str) -> Optional[Airport]:
         """Fetch airport information by code."""
@@ -65,4 +84,9 @@ class AirportService(AirportServiceInterface):
         airport_code = airport_code.upper().strip()
         return self.airport_repository.get_airport_by_code(airport_code)
     
-    
\ No newline at end of file
+    
+
+    def _invalidate_reference_data(self) -> None:
+        """Have every process reload its cached airports and airlines after a committed write"""
+        if self.reference_data is not None:
+            self.reference_data.invalidate()
@@ -0,0 +1,97 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from app.domain.enums.export_format import ExportFormat
+from app.domain.interfaces.services.export_service_interface import ExportServiceInterface
+from app.domain.interfaces.repositories.iflight_repository import IFlightRepository
+from app.domain.interfaces.repositories.ibooking_repository import IBookingRepository
+from app.domain.interfaces.repositories.irating_repository import IRatingRepository
+from app.domain.validators.flight_validator import FlightValidator
+from app.infrastructure.export import ExportColumn, parquet_available, write_csv, write_parquet
+from app.utils.logger_service import get_logger, LoggerService
+
+logger = get_logger(__name__)
+
+# Column order matches the rows the repositories' iter_*_for_export methods select
+FLIGHT_EXPORT_COLUMNS = [
+    ExportColumn('flight_id', 'int'),
+    ExportColumn('flight_name', 'str'),
+    ExportColumn('airline_id', 'int'),
+    ExportColumn('airline_name', 'str'),
+    ExportColumn('departure_airport_code', 'str'),
+    ExportColumn('arrival_airport_code', 'str'),
+    ExportColumn('departure_time', 'datetime'),
+    ExportColumn('arrival_time', 'datetime'),
+    ExportColumn('flight_duration', 'int'),
+    ExportColumn('flight_distance_km', 'int'),
+    ExportColumn('price', 'float'),
+    ExportColumn('total_seats', 'int'),
+    ExportColumn('status', 'str'),
+    ExportColumn('created_by', 'int'),
+    ExportColumn('approved_by', 'int'),
+    ExportColumn('actual_start_time', 'datetime'),
+    ExportColumn('created_at', 'datetime'),
+    ExportColumn('updated_at', 'datetime'),
+]
+
+BOOKING_EXPORT_COLUMNS = [
+    ExportColumn('id', 'int'),
+    ExportColumn('user_id', 'int'),
+    ExportColumn('flight_id', 'int'),
+    ExportColumn('flight_name', 'str'),
+    ExportColumn('departure_time', 'datetime'),
+    ExportColumn('purchased_at', 'datetime'),
+]
+
+RATING_EXPORT_COLUMNS = [
+    ExportColumn('id', 'int'),
+    ExportColumn('user_id', 'int'),
+    ExportColumn('flight_id', 'int'),
+    ExportColumn('flight_name', 'str'),
+    ExportColumn('airline_id', 'int'),
+    ExportColumn('airline_name', 'str'),
+    ExportColumn('rating', 'int'),
+    ExportColumn('created_at', 'datetime'),
+]
+
+
+class ExportService(ExportServiceInterface):
+    """Streams flights, bookings and ratings as CSV or Parquet, one batch at a time"""
+
+    def __init__(self, flight_repository: IFlightRepository, booking_repository: IBookingRepository,
+                 rating_repository: IRatingRepository, batch_size: int = 5000):
+        self.flight_repository = flight_repository
+        self.booking_repository = booking_repository
+        self.rating_repository = rating_repository
+        self.batch_size = batch_size
+
+    def is_format_available(self, export_format: ExportFormat) -> bool:
+        return export_format != ExportFormat.PARQUET or parquet_available()
+
+    def export_flights(self, export_format: ExportFormat, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        filters = FlightValidator.validate_filters(filters)
+        return self._encode('flights', export_format, FLIGHT_EXPORT_COLUMNS,
+                            self.flight_repository.iter_flights_for_export(filters, self.batch_size))
+
+    def export_bookings(self, export_format: ExportFormat, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        return self._encode('bookings', export_format, BOOKING_EXPORT_COLUMNS,
+                            self.booking_repository.iter_bookings_for_export(filters, self.batch_size))
+
+    def export_ratings(self, export_format: ExportFormat, filters: Optional[Dict] = None) -> Iterator[bytes]:
+        return self._encode('ratings', export_format, RATING_EXPORT_COLUMNS,
+                            self.rating_repository.iter_ratings_for_export(filters, self.batch_size))
+
+    def _encode(self, entity: str, export_format: ExportFormat, columns: Sequence[ExportColumn],
+                batches: Iterable[List[Any]]) -> Iterator[bytes]:
+        """Encode the row batches lazily; nothing is queried until the first chunk is requested"""
+        writer = write_parquet if export_format == ExportFormat.PARQUET else write_csv
+        rows = 0
+
+        def counted():
+            nonlocal rows
+            for batch in batches:
+                rows += len(batch)
+                yield batch
+
+        yield from writer(columns, counted())
+        LoggerService.log_with_context(logger, 'INFO', 'Export streamed',
+                                      entity=entity, format=export_format.value, rows=rows)
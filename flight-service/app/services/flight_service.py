@@ -1,13 +1,16 @@
 from typing import Optional, Dict, cast, Tuple, List
 from datetime import datetime, timezone
-from ..domain.models.flights import Flight, Booking
+from ..domain.models.flights import Flight
 from app.domain.interfaces.repositories.iflight_repository import IFlightRepository
 from app.domain.interfaces.repositories.iairport_repository import IAirportRepository
 from app.domain.interfaces.repositories.iairline_repository import IAirlineRepository
 from app.domain.interfaces.services.flight_service_interface import FlightServiceInterface
 from app.domain.interfaces.repositories.iflight_repository import FlightPaginationResult
 from app.domain.interfaces.services.booking_service_interface import BookingServiceInterface
+from app.domain.interfaces.scheduler.iflight_scheduler import IFlightScheduler
+from app.domain.interfaces.caching.ireference_data_cache import IReferenceDataCache
 from ..domain.models.enums import FlightStatus
+from app.domain.enums.count_mode import CountMode
 from ..domain.validators.flight_validator import FlightValidator
 from ..domain.dtos.flight_dto import (
     DeleteFlightDTO,
@@ -30,12 +33,16 @@ class FlightService(FlightServiceInterface):
                  airport_repository: IAirportRepository,
                  airline_repository: IAirlineRepository,
                  booking_service: BookingServiceInterface,
-                 socket_manager = None):
+                 socket_manager = None,
+                 flight_scheduler: Optional[IFlightScheduler] = None,
+                 reference_data: Optional[IReferenceDataCache] = None):
         self.flight_repository = flight_repository
         self.airport_repository = airport_repository
         self.airline_repository = airline_repository
         self.booking_service = booking_service
         self.socket_manager = socket_manager
+        self.flight_scheduler = flight_scheduler
+        self.reference_data = reference_data
 
     def create_flight(self, data: FlightCreateDTO, created_by: int) -> Optional[Flight]:
         """Create a new flight with comprehensive validation."""
@@ -48,17 +55,17 @@ class FlightService(FlightServiceInterface):
                                          'Flight creation failed: same departure and arrival airport',
                                          airport_id=data.departure_airport_id)
             return None
-        if not self.airport_repository.get_airport_by_id(data.departure_airport_id):
+        if not self._airport_exists(data.departure_airport_id):
             LoggerService.log_with_context(logger, 'WARNING',
                                          'Flight creation failed: invalid departure airport',
                                          airport_id=data.departure_airport_id)
             return None
-        if not self.airport_repository.get_airport_by_id(data.arrival_airport_id):
+        if not self._airport_exists(data.arrival_airport_id):
             LoggerService.log_with_context(logger, 'WARNING',
                                          'Flight creation failed: invalid arrival airport',
                                          airport_id=data.arrival_airport_id)
             return None
-        if not self.airline_repository.get_airline_by_id(data.airline_id):
+        if not self._airline_exists(data.airline_id):
             LoggerService.log_with_context(logger, 'WARNING',
                                          'Flight creation failed: invalid airline',
                                          airline_id=data.airline_id)
@@ -129,11 +136,11 @@ class FlightService(FlightServiceInterface):
             logger.warning(f"Cannot update flight {flight_id} with status {flight.status}")
             return None
         
-        if data.departure_airport_id is not None and not self.airport_repository.get_airport_by_id(data.departure_airport_id):
+        if data.departure_airport_id is not None and not self._airport_exists(data.departure_airport_id):
             return None
-        if data.arrival_airport_id is not None and not self.airport_repository.get_airport_by_id(data.arrival_airport_id):
+        if data.arrival_airport_id is not None and not self._airport_exists(data.arrival_airport_id):
             return None
-        if data.airline_id is not None and not self.airline_repository.get_airline_by_id(data.airline_id):
+        if data.airline_id is not None and not self._airline_exists(data.airline_id):
             return None
         
         # Validate departure and arrival airports are different if both provided
@@ -162,6 +169,7 @@ class FlightService(FlightServiceInterface):
 
         try:
             updated_flight = self.flight_repository.update_flight_details(flight_id, update_data)
+            self._reschedule(updated_flight)
             
             # Notify admins via WebSocket if flight was resubmitted
             if was_rejected and updated_flight and self.socket_manager:
@@ -179,13 +187,42 @@ class FlightService(FlightServiceInterface):
             logger.error(f"Error updating flight: {str(e)}")
             return None
 
+    def _airport_exists(self, airport_id: int) -> bool:
+        """Check a flight's airport reference, in memory when the reference data cache is configured"""
+        if self.reference_data is not None:
+            return self.reference_data.has_airport(airport_id)
+        return self.airport_repository.get_airport_by_id(airport_id) is not None
+
+    def _airline_exists(self, airline_id: int) -> bool:
+        """Check a flight's airline reference, in memory when the reference data cache is configured"""
+        if self.reference_data is not None:
+            return self.reference_data.has_airline(airline_id)
+        return self.airline_repository.get_airline_by_id(airline_id) is not None
+
+    def _reschedule(self, flight: Optional[Flight]) -> None:
+        """Re-arm the flight scheduler so a newly due transition happens on time"""
+        if self.flight_scheduler and flight:
+            self.flight_scheduler.reschedule(flight)
+
     def get_flight(self, flight_id: int) -> Optional[Flight]:
         """Retrieve a flight by ID."""
         if flight_id <= 0:
             return None
         return self.flight_repository.get_flight_by_id(flight_id)
 
-    def get_all_flights(self, page: int = 1, per_page: int = 10, filters: Optional[Dict] = None) -> FlightPaginationResult:
+    def search_flights(self, term: str, limit: int = 10, filters: Optional[Dict] = None) -> List[Flight]:
+        """Fuzzy search flights by name (typo tolerant), best matches first."""
+        term = term.strip() if term else ''
+        if not term:
+            return []
+        limit = min(max(limit, 1), 50)
+
+        filters = FlightValidator.validate_filters(filters)
+
+        return self.flight_repository.search_flights(term, limit, filters)
+
+    def get_all_flights(self, page: int = 1, per_page: int = 10, filters: Optional[Dict] = None,
+                        cursor: Optional[str] = None, count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
         """Retrieve all flights with pagination and filters."""
         if page < 1:
             page = 1
@@ -196,7 +233,7 @@ class FlightService(FlightServiceInterface):
         
         filters = FlightValidator.validate_filters(filters)
         
-        return self.flight_repository.get_all_flights(page, per_page, filters)
+        return self.flight_repository.get_all_flights(page, per_page, filters, cursor, count_mode)
 
     def update_flight_status(self, flight_id: int, data: FlightStatusUpdateDTO, admin_id: int) -> Optional[Flight]:
         """Update flight status (approve/reject/cancel) by admin."""
@@ -224,6 +261,7 @@ class FlightService(FlightServiceInterface):
             return None
         
         updated_flight = self.flight_repository.get_flight_by_id(flight_id)
+        self._reschedule(updated_flight)
         
         # Notify manager via WebSocket about status update (approved/rejected)
         if self.socket_manager and updated_flight:
@@ -265,6 +303,7 @@ class FlightService(FlightServiceInterface):
             return None
         
         updated_flight = self.flight_repository.get_flight_by_id(flight_id)
+        self._reschedule(updated_flight)
         
         # Get users who booked this flight for potential refund processing
         user_ids = self.booking_service.get_uid_bookings_by_flight_id(flight_id)
@@ -316,7 +355,8 @@ class FlightService(FlightServiceInterface):
             return 0
         return self.flight_repository.get_available_seats(flight_id)
     
-    def get_flights_by_tab(self, tab: str, page: int, per_page: int, filters: Optional[Dict] = None) -> FlightPaginationResult:
+    def get_flights_by_tab(self, tab: str, page: int, per_page: int, filters: Optional[Dict] = None,
+                           count_mode: CountMode = CountMode.EXACT) -> FlightPaginationResult:
         """
         Get flights by tab with search support:
         - upcoming: PENDING + APPROVED flights that haven't started
@@ -325,95 +365,30 @@ class FlightService(FlightServiceInterface):
         
         Supports filters: flight_name, airline_id
         """
-        current_time = datetime.now(timezone.utc)
-        
         if tab == 'upcoming':
-            # PENDING and APPROVED flights that haven't started yet
-            # Note: Apply search filters if provided
-            if filters is None:
-                filters = {}
-            
-            # Get both PENDING and APPROVED flights
-            pending_filters = {**filters, 'status': FlightStatus.PENDING.value}
-            approved_filters = {**filters, 'status': FlightStatus.APPROVED.value}
-            
-            pending_result = self.flight_repository.get_all_flights(1, 1000, pending_filters)
-            approved_result = self.flight_repository.get_all_flights(1, 1000, approved_filters)
-            
-            # Combine and filter out started flights
-            all_flights = pending_result['flights'] + approved_result['flights']
-            
-            # Filter flights that haven't started yet (handle timezone-naive datetimes)
-            upcoming_flights = []
-            for f in all_flights:
-                departure_time = f.departure_time
-                if departure_time.tzinfo is None:
-                    departure_time = departure_time.replace(tzinfo=timezone.utc)
-                if departure_time > current_time:
-                    upcoming_flights.append(f)
-            
-            # Sort by departure_time
-            upcoming_flights.sort(key=lambda f: f.departure_time)
-            
-            # Paginate
-            total = len(upcoming_flights)
-            start = (page - 1) * per_page
-            end = start + per_page
-            paginated_flights = upcoming_flights[start:end]
-            pages = (total + per_page - 1) // per_page if total > 0 else 1
-            
-            # Calculate available seats
-            for flight in paginated_flights:
-                booked_seats = Booking.query.filter_by(flight_id=flight.flight_id).count()
-                flight.available_seats = flight.total_seats - booked_seats
-            
-            return {
-                'flights': paginated_flights,
-                'page': page,
-                'per_page': per_page,
-                'total': total,
-                'pages': pages
-            }
+            # PENDING and APPROVED flights that haven't started yet, soonest first
+            return self.flight_repository.get_flights_by_statuses(
+                [FlightStatus.PENDING, FlightStatus.APPROVED], page, per_page, filters,
+                departure_after=datetime.now(timezone.utc),
+                order_by='departure_time',
+                count_mode=count_mode
+            )
         elif tab == 'in-progress':
-            # Apply filters to in-progress flights
-            if filters:
-                filters['status'] = FlightStatus.IN_PROGRESS.value
-                return self.flight_repository.get_all_flights(page, per_page, filters)
-            return self.flight_repository.get_flights_by_status('IN_PROGRESS', page, per_page)
+            return self.flight_repository.get_flights_by_statuses(
+                [FlightStatus.IN_PROGRESS], page, per_page, filters,
+                order_by='departure_time',
+                count_mode=count_mode
+            )
         elif tab == 'completed':
-            # Get COMPLETED, CANCELLED, and REJECTED flights with filters
-            completed_filters = {**filters} if filters else {}
-            cancelled_filters = {**filters} if filters else {}
-            rejected_filters = {**filters} if filters else {}
-            
-            completed_filters['status'] = FlightStatus.COMPLETED.value
-            cancelled_filters['status'] = FlightStatus.CANCELLED.value
-            rejected_filters['status'] = FlightStatus.REJECTED.value
-            
-            completed = self.flight_repository.get_all_flights(1, 1000, completed_filters)
-            cancelled = self.flight_repository.get_all_flights(1, 1000, cancelled_filters)
-            rejected = self.flight_repository.get_all_flights(1, 1000, rejected_filters)
-            
-            all_flights = completed['flights'] + cancelled['flights'] + rejected['flights']
-            
-            # Sort by updated_at descending (most recent first)
-            all_flights.sort(key=lambda f: f.updated_at, reverse=True)
-            
-            total = len(all_flights)
-            start = (page - 1) * per_page
-            end = start + per_page
-            paginated_flights = all_flights[start:end]
-            pages = (total + per_page - 1) // per_page if total > 0 else 1
-            
-            return {
-                'flights': paginated_flights,
-                'page': page,
-                'per_page': per_page,
-                'total': total,
-                'pages': pages
-            }
+            # COMPLETED, CANCELLED and REJECTED flights, most recently updated first
+            return self.flight_repository.get_flights_by_statuses(
+                [FlightStatus.COMPLETED, FlightStatus.CANCELLED, FlightStatus.REJECTED], page, per_page, filters,
+                order_by='updated_at',
+                descending=True,
+                count_mode=count_mode
+            )
         else:
-            return self.get_all_flights(page, per_page, filters)
+            return self.get_all_flights(page, per_page, filters, count_mode=count_mode)
     
     def get_flight_remaining_time(self, flight_id: int) -> Optional[Dict]:
         """Get remaining time for in-progress flight."""
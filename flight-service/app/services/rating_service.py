@@ -5,6 +5,8 @@ from app.domain.interfaces.repositories.irating_repository import IRatingReposit
 from app.domain.interfaces.repositories.ibooking_repository import IBookingRepository
 from app.domain.interfaces.services.rating_service_interface import RatingServiceInterface
 from app.domain.dtos.rating_dto import RatingCreateDTO, RatingUpdateDTO
+from app.domain.enums.count_mode import CountMode
+from app.domain.types.rating_types import RatingSummary
 
 
 class RatingService(RatingServiceInterface):
@@ -21,38 +23,18 @@ class RatingService(RatingServiceInterface):
         if data.rating < 1 or data.rating > 5:
             return None
 
-        # Check if user has a booking for this flight
-        user_bookings = self.booking_repository.get_bookings_by_user(user_id, page=1, per_page=1000)
-        has_booking = False
-        for b in user_bookings.get('bookings', []):
-            if b.flight_id == data.flight_id:
-                has_booking = True
-                break
-        if not has_booking:
+        # One indexed lookup answers both: did the user book it, and when does it land
+        arrival_time = self.booking_repository.get_booked_flight_arrival_time(user_id, data.flight_id)
+        if arrival_time is None:
             return None  # User must have booked the flight to rate it
 
-        # Check if rating already exists
-        user_ratings = self.rating_repository.get_ratings_by_user(user_id, page=1, per_page=1000)
-        existing_rating = False
-        for r in user_ratings.get('ratings', []):
-            if r.flight_id == data.flight_id:
-                existing_rating = True
-                break
-        if existing_rating:
-            return None  # User can only rate once per flight
-
         # Can only rate after flight has completed (arrival time passed)
-        from ..domain.models.flights import Flight
-        flight = Flight.query.get(data.flight_id)
-        if not flight or flight.arrival_time > datetime.now():
+        if arrival_time > datetime.now():
             return None  # Can't rate a flight that hasn't completed yet
-        try:
-            rating = Rating(user_id=user_id, flight_id=data.flight_id, rating=data.rating)
-            saved_rating = self.rating_repository.save_rating(rating)
-            
-            return saved_rating
-        except Exception:
-            return None
+
+        # A second rating of the same flight fails unique_user_flight_rating and comes back as None
+        rating = Rating(user_id=user_id, flight_id=data.flight_id, rating=data.rating)
+        return self.rating_repository.create_rating(rating)
 
     def update_rating(self, rating_id: int, user_id: int, data: RatingUpdateDTO) -> Optional[Rating]:
         """Update an existing rating with validation."""
@@ -82,7 +64,9 @@ class RatingService(RatingServiceInterface):
             return None
         return self.rating_repository.get_rating_by_id(rating_id)
 
-    def get_user_ratings(self, user_id: int, page: int = 1, per_page: int = 10) -> RatingPaginationResult:
+    def get_user_ratings(self, user_id: int, page: int = 1, per_page: int = 10,
+                         cursor: Optional[str] = None,
+                         count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
         """Retrieve all ratings for a user with pagination."""
         if user_id <= 0:
             return {'ratings': [], 'page': 1, 'per_page': per_page, 'total': 0, 'pages': 0}
@@ -94,9 +78,10 @@ class RatingService(RatingServiceInterface):
         if per_page > 100:  # Limit max items per page
             per_page = 100
 
-        return self.rating_repository.get_ratings_by_user(user_id, page, per_page)
+        return self.rating_repository.get_ratings_by_user(user_id, page, per_page, cursor, count_mode)
 
-    def get_all_ratings(self, page: int = 1, per_page: int = 10) -> RatingPaginationResult:
+    def get_all_ratings(self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None,
+                        count_mode: CountMode = CountMode.EXACT) -> RatingPaginationResult:
         """Retrieve all ratings with pagination."""
         if page < 1:
             page = 1
@@ -105,11 +90,23 @@ class RatingService(RatingServiceInterface):
         if per_page > 100:  # Limit max items per page
             per_page = 100
 
-        return self.rating_repository.get_all_ratings(page, per_page)
+        return self.rating_repository.get_all_ratings(page, per_page, cursor, count_mode)
 
     def delete_rating(self, rating_id: int) -> bool:
         """Delete a rating by ID with validation."""
         if rating_id <= 0:
             return False
 
-        return self.rating_repository.delete_rating(rating_id)
\ No newline at end of file
+        return self.rating_repository.delete_rating(rating_id)
+
+    def get_flight_rating_summary(self, flight_id: int) -> Optional[RatingSummary]:
+        """Rating count, sum, average and histogram of a flight."""
+        if flight_id <= 0:
+            return None
+        return self.rating_repository.get_flight_rating_summary(flight_id)
+
+    def get_airline_rating_summary(self, airline_id: int) -> Optional[RatingSummary]:
+        """Rating count, sum, average and histogram over all flights of an airline."""
+        if airline_id <= 0:
+            return None
+        return self.rating_repository.get_airline_rating_summary(airline_id)
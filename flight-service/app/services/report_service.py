@@ -1,28 +1,122 @@
-from typing import List
-from io import BytesIO
-from datetime import datetime
-from decimal import Decimal
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+import hashlib
+import json
 
 from app.domain.interfaces.services.report_service_interface import ReportServiceInterface
 from app.domain.interfaces.repositories.ireport_repository import IReportRepository
-from app.domain.models.flights import Flight
+from app.domain.interfaces.reports.ireport_renderer import IReportRenderer
+from app.domain.interfaces.reports.ireport_store import IReportStore
+from app.domain.types.report_types import ReportBlock, ReportJob, ReportSectionSummary
+from app.infrastructure.tasks.task_manager import TaskPriority
 from app.utils.logger_service import get_logger, LoggerService
 
 logger = get_logger(__name__)
 
+# Name the render task is registered under with the background task manager
+RENDER_REPORT_TASK = 'render_flight_report'
+
+# Order the sections are printed in, whatever order they were requested in
+REPORT_SECTIONS = ('upcoming', 'in_progress', 'completed')
+
 
 class ReportService(ReportServiceInterface):
     """Service for generating PDF reports of flight data"""
 
-    def __init__(self, report_repository: IReportRepository):
+    def __init__(self, report_repository: IReportRepository, report_store: IReportStore, task_manager,
+                 report_renderer: IReportRenderer, completed_limit: int = 5000):
         self.report_repository = report_repository
+        self.report_renderer = report_renderer
+        # Rows printed in the completed table; its summary still covers every completed flight
+        self.completed_limit = completed_limit
+        self.report_store = report_store
+        self.task_manager = task_manager
+
+    def submit_flight_report(self, report_types: List[str]) -> ReportJob:
+        """
+        Start (or join) a background job rendering a PDF report.
+
+        The job id is derived from the report types and a fingerprint of the
+        data behind them, so a repeat request for unchanged data returns the
+        cached PDF at once and concurrent identical requests attach to the
+        job that is already running. The types are put in section order
+        first, so listing them in another order is still the same report.
+
+        Args:
+            report_types: List of report types to include ('upcoming', 'in_progress', 'completed')
+
+        Returns:
+            ReportJob; 'cached' is True when the PDF is ready to download
+
+        Raises:
+            TaskQueueFullError: If the task queue cannot take the job
+        """
+        report_types = sorted(set(report_types), key=REPORT_SECTIONS.index)
+        fingerprint = self.report_repository.get_report_fingerprint(report_types)
+        job_id = hashlib.sha256(
+            json.dumps({'report_types': report_types, 'fingerprint': fingerprint}, sort_keys=True).encode()
+        ).hexdigest()
+
+        existing = self.report_store.get_job(job_id)
+        if existing and existing['status'] == 'completed' and self.report_store.get_pdf(job_id) is not None:
+            LoggerService.log_with_context(logger, 'INFO', 'Serving cached report', job_id=job_id)
+            return {**existing, 'cached': True}
+
+        job: ReportJob = {
+            'job_id': job_id,
+            'status': 'pending',
+            'report_types': report_types,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'completed_at': None,
+            'size_bytes': None,
+            'error': None
+        }
+        if not self.report_store.create_job(job):
+            existing = self.report_store.get_job(job_id)
+            if existing and existing['status'] in ('pending', 'processing'):
+                LoggerService.log_with_context(logger, 'INFO', 'Attached to running report job', job_id=job_id)
+                return {**existing, 'cached': False}
+            # A failed job, or a completed one whose PDF expired: render it again
+            self.report_store.save_job(job)
+
+        try:
+            self.task_manager.submit_task(RENDER_REPORT_TASK, job_id, report_types, priority=TaskPriority.LOW)
+        except Exception:
+            self.report_store.delete_job(job_id)
+            raise
+
+        LoggerService.log_business_event(logger, 'REPORT_JOB_SUBMITTED', job_id=job_id, report_types=report_types)
+        return {**job, 'cached': False}
+
+    def render_report_job(self, job_id: str, report_types: List[str]) -> Dict[str, Any]:
+        """Background task: render the report and store the PDF under the job id"""
+        job = self.report_store.get_job(job_id) or {'job_id': job_id, 'report_types': report_types,
+                                                    'created_at': datetime.now(timezone.utc).isoformat()}
+        self.report_store.save_job({**job, 'status': 'processing'})
+
+        try:
+            pdf_bytes = self.generate_flight_report(report_types)
+        except Exception as e:
+            self.report_store.save_job({**job, 'status': 'failed', 'error': str(e),
+                                        'completed_at': datetime.now(timezone.utc).isoformat()})
+            raise
+
+        # PDF first, so a job seen as completed always has its PDF
+        self.report_store.save_pdf(job_id, pdf_bytes)
+        self.report_store.save_job({**job, 'status': 'completed', 'size_bytes': len(pdf_bytes), 'error': None,
+                                    'completed_at': datetime.now(timezone.utc).isoformat()})
+        return {'job_id': job_id, 'size_bytes': len(pdf_bytes)}
+
+    def get_report_job(self, job_id: str) -> Optional[ReportJob]:
+        """Get a report job by id"""
+        job = self.report_store.get_job(job_id)
+        if job is None:
+            return None
+        return {**job, 'cached': job['status'] == 'completed'}
+
+    def get_report_pdf(self, job_id: str) -> Optional[bytes]:
+        """Get the PDF of a completed report job"""
+        return self.report_store.get_pdf(job_id)
 
     def generate_flight_report(self, report_types: List[str]) -> bytes:
         """
@@ -37,62 +131,28 @@ class ReportService(ReportServiceInterface):
         LoggerService.log_service_call(logger, 'ReportService', 'generate_flight_report',
                                       report_types=report_types)
 
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=landscape(A4),
-            rightMargin=0.5*inch,
-            leftMargin=0.5*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.5*inch
-        )
-
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a237e'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        section_style = ParagraphStyle(
-            'SectionHeader',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#283593'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-
         # Report header
-        title = Paragraph("Flight Management System Report", title_style)
-        elements.append(title)
-        
         timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-        timestamp_text = Paragraph(f"<i>Generated on: {timestamp}</i>", styles['Normal'])
-        elements.append(timestamp_text)
-        elements.append(Spacer(1, 0.3*inch))
+        blocks: List[ReportBlock] = [
+            ('title', "Flight Management System Report"),
+            ('text', f"<i>Generated on: {timestamp}</i>"),
+            ('spacer', 0.3)
+        ]
+
+        # Section summaries come from one aggregate query instead of passes over the rows
+        summary = self.report_repository.get_report_summary()
 
         # Generate sections based on requested report types
         for report_type in report_types:
             if report_type == 'upcoming':
-                self._add_upcoming_section(elements, section_style, styles)
+                self._add_upcoming_section(blocks, summary)
             elif report_type == 'in_progress':
-                self._add_in_progress_section(elements, section_style, styles)
+                self._add_in_progress_section(blocks, summary)
             elif report_type == 'completed':
-                self._add_completed_section(elements, section_style, styles)
+                self._add_completed_section(blocks, summary)
 
-        # Build PDF
-        doc.build(elements)
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
+        # Large tables are laid out in row chunks across the renderer's worker processes
+        pdf_bytes = self.report_renderer.render(blocks)
 
         LoggerService.log_with_context(logger, 'INFO', 'PDF report generated successfully',
                                       size_bytes=len(pdf_bytes),
@@ -100,17 +160,15 @@ class ReportService(ReportServiceInterface):
         
         return pdf_bytes
 
-    def _add_upcoming_section(self, elements, section_style, styles):
+    def _add_upcoming_section(self, blocks: List[ReportBlock], summary: Dict[str, ReportSectionSummary]):
         """Add upcoming flights section to the report"""
         flights = self.report_repository.get_upcoming_flights()
         
-        section_header = Paragraph("Upcoming Flights (Approved, Not Yet Departed)", section_style)
-        elements.append(section_header)
+        blocks.append(('section', "Upcoming Flights (Approved, Not Yet Departed)"))
         
         if not flights:
-            no_data = Paragraph("<i>No upcoming flights found.</i>", styles['Normal'])
-            elements.append(no_data)
-            elements.append(Spacer(1, 0.3*inch))
+            blocks.append(('text', "<i>No upcoming flights found.</i>"))
+            blocks.append(('spacer', 0.3))
             return
         
         # Create table data
@@ -120,7 +178,7 @@ class ReportService(ReportServiceInterface):
         ]
         
         for flight in flights:
-            route = f"{flight.departure_airport.code} → {flight.arrival_airport.code}"
+            route = f"{flight.departure_code} → {flight.arrival_code}"
             departure = flight.departure_time.strftime("%Y-%m-%d %H:%M")
             arrival = flight.arrival_time.strftime("%Y-%m-%d %H:%M")
             duration_minutes = int(flight.flight_duration.total_seconds() / 60)
@@ -128,7 +186,7 @@ class ReportService(ReportServiceInterface):
             
             table_data.append([
                 flight.flight_name,
-                flight.airline.name,
+                flight.airline_name,
                 route,
                 departure,
                 arrival,
@@ -139,31 +197,24 @@ class ReportService(ReportServiceInterface):
                 f"User {flight.created_by}"
             ])
         
-        table = self._create_table(table_data)
-        elements.append(table)
+        blocks.append(('table', table_data))
         
         # Summary
-        total_revenue = sum(float(f.price) * f.total_seats for f in flights)
-        summary = Paragraph(
-            f"<b>Summary:</b> {len(flights)} upcoming flight(s), "
-            f"Total potential revenue: ${total_revenue:,.2f}",
-            styles['Normal']
-        )
-        elements.append(Spacer(1, 0.1*inch))
-        elements.append(summary)
-        elements.append(Spacer(1, 0.3*inch))
+        upcoming = summary['upcoming']
+        blocks.append(('spacer', 0.1))
+        blocks.append(('text', f"<b>Summary:</b> {upcoming['count']} upcoming flight(s), "
+                               f"Total potential revenue: ${upcoming['revenue']:,.2f}"))
+        blocks.append(('spacer', 0.3))
 
-    def _add_in_progress_section(self, elements, section_style, styles):
+    def _add_in_progress_section(self, blocks: List[ReportBlock], summary: Dict[str, ReportSectionSummary]):
         """Add in-progress flights section to the report"""
         flights = self.report_repository.get_in_progress_flights()
         
-        section_header = Paragraph("In-Progress Flights (Currently Flying)", section_style)
-        elements.append(section_header)
+        blocks.append(('section', "In-Progress Flights (Currently Flying)"))
         
         if not flights:
-            no_data = Paragraph("<i>No in-progress flights found.</i>", styles['Normal'])
-            elements.append(no_data)
-            elements.append(Spacer(1, 0.3*inch))
+            blocks.append(('text', "<i>No in-progress flights found.</i>"))
+            blocks.append(('spacer', 0.3))
             return
         
         # Create table data
@@ -174,7 +225,7 @@ class ReportService(ReportServiceInterface):
         
         now = datetime.utcnow()
         for flight in flights:
-            route = f"{flight.departure_airport.code} → {flight.arrival_airport.code}"
+            route = f"{flight.departure_code} → {flight.arrival_code}"
             departed = flight.actual_start_time.strftime("%Y-%m-%d %H:%M") if flight.actual_start_time else "N/A"
             arrival = flight.arrival_time.strftime("%Y-%m-%d %H:%M")
             duration_minutes = int(flight.flight_duration.total_seconds() / 60)
@@ -191,7 +242,7 @@ class ReportService(ReportServiceInterface):
             
             table_data.append([
                 flight.flight_name,
-                flight.airline.name,
+                flight.airline_name,
                 route,
                 departed,
                 arrival,
@@ -201,26 +252,22 @@ class ReportService(ReportServiceInterface):
                 status_text
             ])
         
-        table = self._create_table(table_data)
-        elements.append(table)
+        blocks.append(('table', table_data))
         
         # Summary
-        summary = Paragraph(f"<b>Summary:</b> {len(flights)} flight(s) currently in progress", styles['Normal'])
-        elements.append(Spacer(1, 0.1*inch))
-        elements.append(summary)
-        elements.append(Spacer(1, 0.3*inch))
+        blocks.append(('spacer', 0.1))
+        blocks.append(('text', f"<b>Summary:</b> {summary['in_progress']['count']} flight(s) currently in progress"))
+        blocks.append(('spacer', 0.3))
 
-    def _add_completed_section(self, elements, section_style, styles):
+    def _add_completed_section(self, blocks: List[ReportBlock], summary: Dict[str, ReportSectionSummary]):
         """Add completed/cancelled flights section to the report"""
-        flights = self.report_repository.get_completed_flights()
+        flights = self.report_repository.get_completed_flights(self.completed_limit)
         
-        section_header = Paragraph("Completed & Cancelled Flights", section_style)
-        elements.append(section_header)
+        blocks.append(('section', "Completed & Cancelled Flights"))
         
         if not flights:
-            no_data = Paragraph("<i>No completed or cancelled flights found.</i>", styles['Normal'])
-            elements.append(no_data)
-            elements.append(Spacer(1, 0.3*inch))
+            blocks.append(('text', "<i>No completed or cancelled flights found.</i>"))
+            blocks.append(('spacer', 0.3))
             return
         
         # Create table data
@@ -230,7 +277,7 @@ class ReportService(ReportServiceInterface):
         ]
         
         for flight in flights:
-            route = f"{flight.departure_airport.code} → {flight.arrival_airport.code}"
+            route = f"{flight.departure_code} → {flight.arrival_code}"
             departure = flight.departure_time.strftime("%Y-%m-%d %H:%M")
             arrival = flight.arrival_time.strftime("%Y-%m-%d %H:%M")
             price = f"${float(flight.price):.2f}"
@@ -239,7 +286,7 @@ class ReportService(ReportServiceInterface):
             
             table_data.append([
                 flight.flight_name,
-                flight.airline.name,
+                flight.airline_name,
                 route,
                 departure,
                 arrival,
@@ -248,52 +295,14 @@ class ReportService(ReportServiceInterface):
                 updated
             ])
         
-        table = self._create_table(table_data)
-        elements.append(table)
+        blocks.append(('table', table_data))
         
         # Summary
-        completed_count = sum(1 for f in flights if f.status.value == 'COMPLETED')
-        cancelled_count = sum(1 for f in flights if f.status.value == 'CANCELLED')
-        completed_revenue = sum(float(f.price) * f.total_seats for f in flights if f.status.value == 'COMPLETED')
-        
-        summary = Paragraph(
-            f"<b>Summary:</b> {completed_count} completed, {cancelled_count} cancelled | "
-            f"Completed revenue: ${completed_revenue:,.2f}",
-            styles['Normal']
-        )
-        elements.append(Spacer(1, 0.1*inch))
-        elements.append(summary)
-        elements.append(Spacer(1, 0.3*inch))
+        completed, cancelled = summary['completed'], summary['cancelled']
+        total = completed['count'] + cancelled['count']
+        shown = f" (showing the {len(flights)} most recent)" if len(flights) < total else ""
 
-    def _create_table(self, data):
-        """Create a styled table for flight data"""
-        table = Table(data, repeatRows=1)
-        
-        table.setStyle(TableStyle([
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3f51b5')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            
-            # Data rows styling
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.lightgrey]),
-        ]))
-        
-        return table
+        blocks.append(('spacer', 0.1))
+        blocks.append(('text', f"<b>Summary:</b> {completed['count']} completed, {cancelled['count']} cancelled{shown} | "
+                               f"Completed revenue: ${completed['revenue']:,.2f}"))
+        blocks.append(('spacer', 0.3))
@@ -5,6 +5,7 @@ This is a facade/adapter layer that wraps the infrastructure logging implementat
 from typing import Optional
 from app.domain.interfaces.logging.ilogger import ILogger
 from app.infrastructure.logging.log_manager import LogManager
+from app.infrastructure.logging.logger_impl import lazy
 from app.infrastructure.logging.log_strategies import (
     RequestLogStrategy,
     ResponseLogStrategy,
@@ -22,6 +23,11 @@ class LoggerService:
         """Initialize the logging system"""
         LogManager().initialize(level, log_file)
     
+    @staticmethod
+    def shutdown() -> None:
+        """Flush queued records and stop the background log writer"""
+        LogManager().shutdown()
+    
     @staticmethod
     def get_logger(name: str) -> ILogger:
         """Get a logger instance for a module"""
@@ -56,6 +62,8 @@ class LoggerService:
     @staticmethod
     def log_error(logger: ILogger, error: Exception, context: Optional[dict] = None) -> None:
         """Log an error with full context"""
+        if not logger.is_enabled_for('ERROR'):
+            return
         logger.error(
             f"Error occurred: {type(error).__name__}: {str(error)}",
             exception=error,
@@ -64,9 +72,8 @@ class LoggerService:
     
     @staticmethod
     def log_with_context(logger: ILogger, level: str, message: str, **context) -> None:
-        """Log a message with additional context"""
-        log_method = getattr(logger, level.lower(), logger.info)
-        log_method(message, **context)
+        """Log a message with additional context; wrap costly values in lazy() to compute them only when emitted"""
+        logger.log(level, message, **context)
 
 
 def get_logger(name: str) -> ILogger:
@@ -74,4 +81,4 @@ def get_logger(name: str) -> ILogger:
     return LoggerService.get_logger(name)
 
 
-__all__ = ['LoggerService', 'get_logger']
+__all__ = ['LoggerService', 'get_logger', 'lazy']
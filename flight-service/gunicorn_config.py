@@ -3,6 +3,8 @@ Gunicorn configuration file for production deployment.
 This file allows for more advanced configuration options.
 """
 import os
+import shutil
+import tempfile
 import multiprocessing
 
 # Server socket
@@ -18,6 +20,10 @@ max_requests_jitter = 50
 timeout = 120
 keepalive = 5
 
+# Metrics: every worker writes its Prometheus samples here and /metrics aggregates them.
+# Set before the workers are forked, since prometheus_client reads it on import.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'flight-service-metrics'))
+
 # Logging
 accesslog = '-'  # Log to stdout
 errorlog = '-'   # Log to stderr
@@ -43,6 +49,10 @@ tmp_upload_dir = None
 def on_starting(server):
     """Called just before the master process is initialized."""
     server.log.info("Starting Flight Service with Gunicorn + Gevent")
+    # Samples left by a previous run would be added to this one's
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
 
 def on_reload(server):
     """Called to recycle workers during a reload via SIGHUP."""
@@ -83,6 +93,8 @@ def post_request(worker, req, environ, resp):
 def child_exit(server, worker):
     """Called just after a worker has been exited."""
     server.log.info(f"Worker exited (pid: {worker.pid})")
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
 
 def worker_abort(worker):
     """Called when a worker received the SIGABRT signal."""
@@ -0,0 +1,71 @@
+"""
+Per-request logging overhead benchmark.
+
+Replays the log calls one typical API request makes (request and response
+lines, service calls, repository operations, DEBUG and INFO context logs)
+through LoggerService with the configured handlers writing to /dev/null, and
+reports the time spent on the request thread per simulated request.
+
+With the queue pipeline the handlers run on a listener thread, so the time
+needed to drain the queue afterwards is reported separately.
+
+Usage:
+    python logging_benchmark.py [--requests 20000] [--level INFO]
+"""
+import argparse
+import os
+import sys
+import time
+
+from app.utils.logger_service import LoggerService, get_logger
+
+logger = get_logger('benchmark')
+
+
+def one_request(i: int) -> None:
+    LoggerService.log_request(logger, 'GET', '/api/flights', query={'page': 1}, request_id=i)
+    LoggerService.log_service_call(logger, 'FlightService', 'get_all_flights', page=1)
+    LoggerService.log_service_call(logger, 'FlightService', 'hydrate_flights', count=20)
+    for table in ('flights', 'airlines', 'airports'):
+        LoggerService.log_database_operation(logger, 'SELECT', table, rows=20)
+    for step in range(3):
+        LoggerService.log_with_context(logger, 'DEBUG', 'Fetching flights page',
+                                      step=step, filters={'status': 'approved'})
+    LoggerService.log_with_context(logger, 'INFO', 'Retrieved flights', count=20)
+    LoggerService.log_response(logger, 'GET', '/api/flights', 200, 12.5, request_id=i)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--level', default='INFO')
+    args = parser.parse_args()
+
+    # The console handler binds sys.stdout when logging is initialized
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        LoggerService.initialize(level=args.level)
+        for i in range(1000):
+            one_request(i)
+
+        started = time.perf_counter()
+        for i in range(args.requests):
+            one_request(i)
+        request_thread = time.perf_counter() - started
+
+        shutdown = getattr(LoggerService, 'shutdown', None)
+        if shutdown is not None:
+            shutdown()
+        drained = time.perf_counter() - started
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"{args.requests} requests at {args.level}:")
+    print(f"  request thread  {request_thread / args.requests * 1e6:8.1f} us/request")
+    print(f"  until written   {drained / args.requests * 1e6:8.1f} us/request")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
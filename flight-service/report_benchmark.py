@@ -0,0 +1,105 @@
+"""
+Render-time benchmark for PDF flight reports.
+
+Builds a synthetic report with one upcoming-flights table of N rows (no
+database needed) and times three ways of rendering it:
+
+    single    one SimpleDocTemplate holding the whole table (the previous path)
+    chunked   tables split into --chunk-rows chunks, rendered one after another
+              in this process and merged
+    parallel  the same chunks rendered in a pool of --workers processes and merged
+
+The single-document path grows superlinearly, so it is skipped above
+--single-limit rows. The first parallel run also pays for starting the pool;
+it is started once before timing so the numbers show steady-state rendering.
+
+Usage:
+    python report_benchmark.py [--rows 1000,10000,100000] [--workers 4]
+                               [--chunk-rows 1000] [--single-limit 10000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from app.domain.types.report_types import ReportBlock
+from app.infrastructure.reports.pdf_renderer import PdfReportRenderer, pypdf, render_part
+
+HEADER = ['Flight Name', 'Airline', 'Route', 'Departure', 'Arrival', 'Duration\n(min)',
+          'Distance\n(km)', 'Price', 'Total\nSeats', 'Created By']
+
+
+def build_report(rows: int) -> List[ReportBlock]:
+    """A report laid out like ReportService's upcoming section"""
+    now = datetime(2026, 1, 1)
+    table = [HEADER]
+    for i in range(rows):
+        departure = now + timedelta(minutes=15 * i)
+        table.append([
+            f'BM{i:06d}',
+            f'Benchmark Airline {i % 40}',
+            'AAA → BBB',
+            departure.strftime("%Y-%m-%d %H:%M"),
+            (departure + timedelta(hours=3)).strftime("%Y-%m-%d %H:%M"),
+            '180',
+            '2400',
+            f"${100 + i % 500:.2f}",
+            '180',
+            f"User {i % 25 + 1}"
+        ])
+    return [
+        ('title', "Flight Management System Report"),
+        ('text', "<i>Generated on: benchmark</i>"),
+        ('spacer', 0.3),
+        ('section', "Upcoming Flights (Approved, Not Yet Departed)"),
+        ('table', table),
+        ('spacer', 0.1),
+        ('text', f"<b>Summary:</b> {rows} upcoming flight(s)"),
+        ('spacer', 0.3),
+    ]
+
+
+def timed(label: str, render: Callable[[], bytes]) -> float:
+    started = time.perf_counter()
+    pdf = render()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<9} {elapsed:8.2f} s  {len(pdf) / 1024 / 1024:7.1f} MB")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', default='1000,10000,100000',
+                        help='Comma-separated table sizes to render')
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument('--chunk-rows', type=int, default=1000)
+    parser.add_argument('--single-limit', type=int, default=10000,
+                        help='Largest table rendered as a single document')
+    args = parser.parse_args()
+
+    if pypdf is None:
+        print("pypdf is not installed; chunked rendering needs it to merge the parts")
+        return 1
+
+    serial = PdfReportRenderer(max_workers=1, chunk_rows=args.chunk_rows)
+    parallel = PdfReportRenderer(max_workers=args.workers, chunk_rows=args.chunk_rows)
+    # Pay the process start-up cost outside the timings
+    parallel.render(build_report(args.chunk_rows * args.workers))
+
+    try:
+        for rows in [int(value) for value in args.rows.split(',')]:
+            blocks = build_report(rows)
+            print(f"{rows} rows (chunk {args.chunk_rows}, {args.workers} workers, {os.cpu_count()} CPUs):")
+            if rows <= args.single_limit:
+                timed('single', lambda: render_part(blocks))
+            timed('chunked', lambda: serial.render(blocks))
+            timed('parallel', lambda: parallel.render(blocks))
+    finally:
+        parallel.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
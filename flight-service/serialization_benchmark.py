@@ -0,0 +1,129 @@
+"""
+Response serialization benchmark for flight listings.
+
+Builds a /flights page of --per-page Flight objects with every column set,
+as a query loads them, plus their airline and airports (no database needed) and a /users/<id>/bookings page of bookings
+nesting those flights, then times turning each page into a JSON response:
+
+    marshmallow  FlightResponseDTO(many=True).dump + Flask's stdlib provider
+                 (the previous path)
+    compiled     CompiledSerializer.dump_many + the orjson provider
+
+Both paths must produce the same JSON document; the benchmark checks that
+before timing.
+
+Usage:
+    python serialization_benchmark.py [--per-page 100] [--iterations 300]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.domain.dtos import BookingResponseDTO, FlightResponseDTO
+from app.domain.models.enums import FlightStatus
+from app.domain.models.flights import Airline, Airport, Booking, Flight
+from app.infrastructure.serialization import CompiledSerializer, OrjsonJSONProvider, orjson
+
+
+def build_flights(count: int) -> List[Flight]:
+    now = datetime(2026, 1, 1, 8, 30)
+    airlines = [Airline(name=f'Benchmark Airline {i}', id=i + 1, created_at=now) for i in range(10)]
+    airports = [Airport(name=f'Benchmark Airport {i}', code=f'B{i:02d}', id=i + 1, created_at=now) for i in range(20)]
+    flights = []
+    for i in range(count):
+        airline = airlines[i % len(airlines)]
+        departure, arrival = airports[i % len(airports)], airports[(i + 7) % len(airports)]
+        flight = Flight(
+            flight_name=f'BM{i:06d}',
+            airline_id=airline.id,
+            flight_distance_km=2400,
+            flight_duration=180,
+            departure_time=now + timedelta(minutes=15 * i),
+            departure_airport_id=departure.id,
+            arrival_airport_id=arrival.id,
+            price=Decimal(100 + i % 500) + Decimal('0.99'),
+            total_seats=180,
+            created_by=i % 25 + 1,
+            status=FlightStatus.APPROVED
+        )
+        flight.flight_id = i + 1
+        flight.airline, flight.departure_airport, flight.arrival_airport = airline, departure, arrival
+        flight.approved_by, flight.actual_start_time = 1, None
+        # Set by the repository on listed flights
+        flight.available_seats = flight.total_seats - i % 50
+        flight.created_at = flight.updated_at = now
+        flights.append(flight)
+    return flights
+
+
+def build_bookings(flights: List[Flight]) -> List[Booking]:
+    bookings = []
+    for i, flight in enumerate(flights):
+        booking = Booking(user_id=7, flight_id=flight.flight_id)
+        booking.id = i + 1
+        booking.flight = flight
+        booking.purchased_at = datetime(2025, 12, 1, 12, 0, i % 60)
+        bookings.append(booking)
+    return bookings
+
+
+def page(key: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {key: items, 'page': 1, 'per_page': len(items), 'total': 5000, 'pages': 50,
+            'next_cursor': None, 'total_mode': 'exact'}
+
+
+def timed(label: str, iterations: int, render: Callable[[], bytes]) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    per_page = (time.perf_counter() - started) / iterations
+    print(f"  {label:<12} {per_page * 1e6:9.0f} us/page")
+    return per_page
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=300)
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("orjson is not installed; the compiled path needs it")
+        return 1
+
+    app = Flask(__name__)
+    stdlib_json, orjson_json = DefaultJSONProvider(app), OrjsonJSONProvider(app)
+    flights = build_flights(args.per_page)
+    bookings = build_bookings(flights)
+
+    cases = [
+        ('flights', flights, FlightResponseDTO, CompiledSerializer(FlightResponseDTO)),
+        ('bookings', bookings, BookingResponseDTO, CompiledSerializer(BookingResponseDTO)),
+    ]
+    for key, items, dto, serializer in cases:
+        def marshmallow_path() -> bytes:
+            return stdlib_json.response(page(key, dto(many=True).dump(items))).get_data()
+
+        def compiled_path() -> bytes:
+            return orjson_json.response(page(key, serializer.dump_many(items))).get_data()
+
+        if json.loads(marshmallow_path()) != json.loads(compiled_path()):
+            print(f"{key}: the compiled serializer's JSON differs from marshmallow's")
+            return 1
+
+        print(f"/{key}, {args.per_page} per page ({args.iterations} iterations):")
+        before = timed('marshmallow', args.iterations, marshmallow_path)
+        after = timed('compiled', args.iterations, compiled_path)
+        print(f"  {before / after:.1f}x faster")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
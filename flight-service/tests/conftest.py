@@ -0,0 +1,87 @@
+"""
+Fixtures for the flight-service endpoint tests: the real application from
+create_app(), on a SQLite file seeded before startup (so the reference data
+cache loads it) and without Redis (in-process fallbacks).
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# More flights than the largest page, so per_page=100 returns a full page
+FLIGHTS = 120
+
+
+@pytest.fixture(scope='session')
+def database_url(tmp_path_factory) -> str:
+    from app import db
+    from app.domain.models.enums import FlightStatus
+    from app.domain.models.flights import Airline, Airport, Booking, Flight, Rating
+
+    url = f"sqlite:///{tmp_path_factory.mktemp('db') / 'flights.db'}"
+    engine = create_engine(url)
+    db.metadata.create_all(engine)
+    with Session(engine) as session:
+        airlines = [Airline(name=f'Airline {i}') for i in range(5)]
+        airports = [Airport(name=f'Airport {i}', code=f'AP{i}') for i in range(6)]
+        session.add_all(airlines + airports)
+        session.flush()
+
+        departure = datetime.now() + timedelta(days=30)
+        flights = []
+        for i in range(FLIGHTS):
+            flights.append(Flight(
+                flight_name=f'Flight {i}',
+                airline_id=airlines[i % len(airlines)].id,
+                flight_distance_km=800,
+                flight_duration=120,
+                departure_time=departure + timedelta(hours=i),
+                departure_airport_id=airports[i % len(airports)].id,
+                arrival_airport_id=airports[(i + 1) % len(airports)].id,
+                created_by=1,
+                price=Decimal('100.00'),
+                total_seats=150,
+                status=FlightStatus.APPROVED
+            ))
+        session.add_all(flights)
+        session.flush()
+
+        for i, flight in enumerate(flights):
+            for user_id in range(1, i % 3 + 2):
+                session.add(Booking(user_id=user_id, flight_id=flight.flight_id))
+                session.add(Rating(user_id=user_id, flight_id=flight.flight_id, rating=user_id))
+        session.commit()
+    engine.dispose()
+    return url
+
+
+@pytest.fixture(scope='session')
+def app(database_url):
+    # Blueprints are module level, so one application serves the whole session
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv('DB2_URL', database_url)
+    monkeypatch.delenv('REDIS_URL', raising=False)
+    monkeypatch.setenv('LOG_LEVEL', 'WARNING')
+    monkeypatch.setenv('LEADER_LEASE_TTL', '3')
+
+    from app import create_app
+    flask_app, _ = create_app()
+    yield flask_app
+
+    flask_app.extensions['leader_elector'].stop()
+    flask_app.extensions['task_manager'].stop()
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def engine(app):
+    from app import db
+    with app.app_context():
+        return db.engine
@@ -0,0 +1,33 @@
+"""
+Flight listings compute available seats for the whole page in the page
+query, so they run the same statements whatever the page size.
+"""
+import pytest
+
+from app.infrastructure.metrics import query_budget
+
+# Generous ceiling for one listing; the point of these tests is that it does not grow with the page
+LISTING_BUDGET = 10
+
+
+@pytest.mark.parametrize('path', ['/api/flights', '/api/flights/tabs/upcoming'])
+def test_listing_statements_do_not_depend_on_page_size(client, engine, path):
+    with query_budget(engine, LISTING_BUDGET) as single:
+        response = client.get(f'{path}?per_page=1')
+    assert response.status_code == 200
+    assert len(response.get_json()['flights']) == 1
+
+    with query_budget(engine, single.count) as full:
+        response = client.get(f'{path}?per_page=100')
+    assert response.status_code == 200
+    flights = response.get_json()['flights']
+    assert len(flights) == 100
+    assert full.count == single.count
+
+
+def test_listing_reports_available_seats(client):
+    response = client.get('/api/flights?per_page=3')
+
+    # The seeded flights i have i % 3 + 1 bookings out of 150 seats
+    seats = sorted(flight['available_seats'] for flight in response.get_json()['flights'])
+    assert seats == [147, 148, 149]
@@ -0,0 +1,101 @@
+"""
+Scheduler transitions skip rows locked by concurrent transactions (SKIP
+LOCKED); those flights must be retried shortly, not at the next refresh.
+
+Row locks need PostgreSQL: set TEST_DB2_URL to a scratch database, whose
+tables are created and dropped by the test.
+"""
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from app import db
+from app.domain.models.enums import FlightStatus
+from app.domain.models.flights import Airline, Airport, Flight
+from app.infrastructure.scheduler.flight_scheduler import FlightScheduler
+from app.repositories import SqlAlchemyFlightRepository
+
+TEST_DB2_URL = os.environ.get('TEST_DB2_URL')
+
+pytestmark = pytest.mark.skipif(not (TEST_DB2_URL or '').startswith('postgresql'),
+                                reason='row locks need PostgreSQL (set TEST_DB2_URL)')
+
+
+class RecordingSocketManager:
+    def __init__(self):
+        self.started = []
+        self.completed = []
+
+    def notify_flight_started(self, flight_data):
+        self.started.append(flight_data['flight_id'])
+
+    def notify_flight_completed(self, flight_data):
+        self.completed.append(flight_data['flight_id'])
+
+
+@pytest.fixture
+def postgres_app():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = TEST_DB2_URL
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def departed_flight_id(postgres_app) -> int:
+    with postgres_app.app_context():
+        airline = Airline(name='Scheduler Airline')
+        departure, arrival = Airport(name='Departure', code='SDA'), Airport(name='Arrival', code='SAA')
+        db.session.add_all([airline, departure, arrival])
+        db.session.flush()
+        flight = Flight(flight_name='Locked', airline_id=airline.id, flight_distance_km=800, flight_duration=600,
+                        departure_time=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=1),
+                        departure_airport_id=departure.id, arrival_airport_id=arrival.id,
+                        price=Decimal('100.00'), total_seats=150, status=FlightStatus.APPROVED)
+        db.session.add(flight)
+        db.session.commit()
+        return flight.flight_id
+
+
+def _status(app, flight_id: int) -> FlightStatus:
+    with app.app_context():
+        db.session.expire_all()
+        return db.session.get(Flight, flight_id).status
+
+
+def test_flight_skipped_while_locked_is_retried_on_a_follow_up_tick(postgres_app, departed_flight_id):
+    socket_manager = RecordingSocketManager()
+    scheduler = FlightScheduler(SqlAlchemyFlightRepository(), socket_manager, postgres_app, refresh_interval=900)
+    scheduler.running.set()
+    # Deadlines as if loaded by the last refresh, which is a long way off
+    scheduler._refresh_at = time.time() + scheduler.refresh_interval
+    scheduler.schedule(datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    # A booking holds the flight row (as reserve_seat does) during the tick
+    locker = create_engine(TEST_DB2_URL)
+    with locker.connect() as conn:
+        conn.execute(text('SELECT flight_id FROM flights WHERE flight_id = :id FOR UPDATE'),
+                     {'id': departed_flight_id})
+        scheduler._tick()
+        assert _status(postgres_app, departed_flight_id) == FlightStatus.APPROVED
+        conn.rollback()
+    locker.dispose()
+
+    retry_in = scheduler._seconds_until_next_deadline()
+    assert retry_in <= scheduler.locked_retry_interval
+
+    time.sleep(retry_in)
+    scheduler._tick()
+    assert _status(postgres_app, departed_flight_id) == FlightStatus.IN_PROGRESS
+    assert socket_manager.started == [departed_flight_id]
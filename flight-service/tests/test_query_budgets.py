@@ -0,0 +1,30 @@
+"""
+Statement budgets for the read endpoints whose responses nest flights: the
+Booking.flight / Rating.flight backrefs and the flights' airline and
+airports must not be lazy loaded once per row while they are dumped.
+"""
+import pytest
+
+from app.infrastructure.metrics import query_budget
+
+
+@pytest.mark.parametrize('path, budget', [
+    # The exact total, then the page with its flights
+    ('/api/bookings?per_page=100', 2),
+    ('/api/users/1/bookings?per_page=100', 2),
+    ('/api/users/1/bookings?per_page=100&cursor=', 2),
+    ('/api/users/1/ratings?per_page=100', 2),
+    ('/api/ratings?per_page=100', 2),
+    # Airline and airports come from the reference data cache
+    ('/api/flights/5', 1),
+])
+def test_read_endpoint_stays_within_budget(client, engine, path, budget):
+    with query_budget(engine, budget):
+        response = client.get(path)
+    assert response.status_code == 200
+
+
+def test_budget_reports_the_statements_over_it(client, engine):
+    with pytest.raises(AssertionError, match='Expected at most 0 statements'):
+        with query_budget(engine, 0):
+            client.get('/api/flights/5')
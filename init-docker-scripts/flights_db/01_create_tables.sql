@@ -1,4 +1,7 @@
 -- Database 2: Flight Management Database
+-- Extensions
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Custom types
 CREATE TYPE flight_status AS ENUM ('PENDING', 'APPROVED', 'REJECTED', 'IN_PROGRESS', 'CANCELLED', 'COMPLETED');
 
@@ -44,7 +47,8 @@ CREATE TABLE bookings (
     id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL, -- Reference to user id from users_db
     flight_id INTEGER REFERENCES flights(flight_id) ON DELETE CASCADE,
-    purchased_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    purchased_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT unique_user_flight_booking UNIQUE (user_id, flight_id)
 );
 
 -- Ratings table
@@ -54,13 +58,231 @@ CREATE TABLE ratings (
     flight_id INTEGER REFERENCES flights(flight_id) ON DELETE CASCADE,
     rating SMALLINT CHECK (rating >= 1 AND rating <= 5) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE(user_id, flight_id)
+    CONSTRAINT unique_user_flight_rating UNIQUE (user_id, flight_id)
+);
+
+-- Rating aggregates, maintained by the ratings_summary triggers below so summaries never scan ratings
+CREATE TABLE flight_rating_summaries (
+    flight_id INTEGER PRIMARY KEY REFERENCES flights(flight_id) ON DELETE CASCADE,
+    airline_id INTEGER REFERENCES airlines(id) ON DELETE CASCADE,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE airline_rating_summaries (
+    airline_id INTEGER PRIMARY KEY REFERENCES airlines(id) ON DELETE CASCADE,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Indexes
-CREATE INDEX idx_flights_airline_id ON flights(airline_id);
-CREATE INDEX idx_flights_status ON flights(status);
+-- (airline_id, departure_time) and (status, ...) also serve lookups on their leading column alone,
+-- so there are no separate single-column airline_id / status indexes
+CREATE INDEX idx_flights_airline_departure_time ON flights(airline_id, departure_time);
 CREATE INDEX idx_flights_departure_time ON flights(departure_time);
+-- Scheduler start query (APPROVED, departure_time <= now) and the upcoming / in-progress tabs
+CREATE INDEX idx_flights_status_departure_time ON flights(status, departure_time);
+-- Completed tab (COMPLETED/CANCELLED/REJECTED, newest update first)
+CREATE INDEX idx_flights_status_updated_at ON flights(status, updated_at);
+-- Scheduler complete query; only the handful of in-progress flights are indexed
+CREATE INDEX idx_flights_in_progress_arrival_time ON flights(arrival_time) WHERE status = 'IN_PROGRESS';
 CREATE INDEX idx_flights_created_by ON flights(created_by);
-CREATE INDEX idx_bookings_user_id ON bookings(user_id);
-CREATE INDEX idx_bookings_flight_id ON bookings(flight_id);
\ No newline at end of file
+-- bookings.user_id lookups are served by the unique_user_flight_booking index
+CREATE INDEX idx_bookings_flight_id ON bookings(flight_id);
+
+-- Wake the flight schedulers (LISTEN flight_schedule) when a flight is approved or rescheduled
+CREATE FUNCTION notify_flight_schedule() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('flight_schedule', json_build_object(
+        'flight_id', NEW.flight_id,
+        'departure_time', NEW.departure_time
+    )::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER flights_schedule_notify
+    AFTER INSERT OR UPDATE OF status, departure_time ON flights
+    FOR EACH ROW
+    WHEN (NEW.status = 'APPROVED')
+    EXECUTE FUNCTION notify_flight_schedule();
+
+-- Add (p_sign = 1) or remove (p_sign = -1) one rating from its flight's and airline's aggregates.
+-- Removals only ever UPDATE, so ratings cascading away with their flight cannot recreate its summary.
+CREATE FUNCTION apply_rating_delta(p_flight_id INTEGER, p_rating SMALLINT, p_sign INTEGER) RETURNS void AS $$
+DECLARE
+    v_airline_id INTEGER;
+BEGIN
+    IF p_sign > 0 THEN
+        INSERT INTO flight_rating_summaries (flight_id, airline_id)
+        SELECT flight_id, airline_id FROM flights WHERE flight_id = p_flight_id
+        ON CONFLICT (flight_id) DO NOTHING;
+    END IF;
+
+    UPDATE flight_rating_summaries SET
+        rating_count = rating_count + p_sign,
+        rating_sum = rating_sum + p_sign * p_rating,
+        rating_1 = rating_1 + CASE WHEN p_rating = 1 THEN p_sign ELSE 0 END,
+        rating_2 = rating_2 + CASE WHEN p_rating = 2 THEN p_sign ELSE 0 END,
+        rating_3 = rating_3 + CASE WHEN p_rating = 3 THEN p_sign ELSE 0 END,
+        rating_4 = rating_4 + CASE WHEN p_rating = 4 THEN p_sign ELSE 0 END,
+        rating_5 = rating_5 + CASE WHEN p_rating = 5 THEN p_sign ELSE 0 END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE flight_id = p_flight_id
+    RETURNING airline_id INTO v_airline_id;
+
+    IF v_airline_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    IF p_sign > 0 THEN
+        INSERT INTO airline_rating_summaries (airline_id) VALUES (v_airline_id)
+        ON CONFLICT (airline_id) DO NOTHING;
+    END IF;
+
+    UPDATE airline_rating_summaries SET
+        rating_count = rating_count + p_sign,
+        rating_sum = rating_sum + p_sign * p_rating,
+        rating_1 = rating_1 + CASE WHEN p_rating = 1 THEN p_sign ELSE 0 END,
+        rating_2 = rating_2 + CASE WHEN p_rating = 2 THEN p_sign ELSE 0 END,
+        rating_3 = rating_3 + CASE WHEN p_rating = 3 THEN p_sign ELSE 0 END,
+        rating_4 = rating_4 + CASE WHEN p_rating = 4 THEN p_sign ELSE 0 END,
+        rating_5 = rating_5 + CASE WHEN p_rating = 5 THEN p_sign ELSE 0 END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE airline_id = v_airline_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION maintain_rating_summaries() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_rating_delta(OLD.flight_id, OLD.rating, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_rating_delta(NEW.flight_id, NEW.rating, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ratings_summary
+    AFTER INSERT OR DELETE OR UPDATE OF rating, flight_id ON ratings
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_rating_summaries();
+
+-- Move a flight's aggregate out of its airline's when the flight is deleted or changes airline
+CREATE FUNCTION move_flight_rating_summary() RETURNS trigger AS $$
+DECLARE
+    summary flight_rating_summaries%ROWTYPE;
+BEGIN
+    SELECT * INTO summary FROM flight_rating_summaries WHERE flight_id = OLD.flight_id FOR UPDATE;
+
+    IF summary.flight_id IS NOT NULL THEN
+        UPDATE airline_rating_summaries SET
+            rating_count = rating_count - summary.rating_count,
+            rating_sum = rating_sum - summary.rating_sum,
+            rating_1 = rating_1 - summary.rating_1,
+            rating_2 = rating_2 - summary.rating_2,
+            rating_3 = rating_3 - summary.rating_3,
+            rating_4 = rating_4 - summary.rating_4,
+            rating_5 = rating_5 - summary.rating_5,
+            updated_at = CURRENT_TIMESTAMP
+        -- Skipped when the airline itself is being deleted; its summary cascades away with it
+        WHERE airline_id = summary.airline_id
+          AND EXISTS (SELECT 1 FROM airlines WHERE id = summary.airline_id);
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        -- Gone before the ratings cascade, whose decrements then find nothing to update
+        DELETE FROM flight_rating_summaries WHERE flight_id = OLD.flight_id;
+        RETURN OLD;
+    END IF;
+
+    IF summary.flight_id IS NOT NULL THEN
+        IF NEW.airline_id IS NOT NULL THEN
+            INSERT INTO airline_rating_summaries
+                (airline_id, rating_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5)
+            VALUES (NEW.airline_id, summary.rating_count, summary.rating_sum, summary.rating_1,
+                    summary.rating_2, summary.rating_3, summary.rating_4, summary.rating_5)
+            ON CONFLICT (airline_id) DO UPDATE SET
+                rating_count = airline_rating_summaries.rating_count + EXCLUDED.rating_count,
+                rating_sum = airline_rating_summaries.rating_sum + EXCLUDED.rating_sum,
+                rating_1 = airline_rating_summaries.rating_1 + EXCLUDED.rating_1,
+                rating_2 = airline_rating_summaries.rating_2 + EXCLUDED.rating_2,
+                rating_3 = airline_rating_summaries.rating_3 + EXCLUDED.rating_3,
+                rating_4 = airline_rating_summaries.rating_4 + EXCLUDED.rating_4,
+                rating_5 = airline_rating_summaries.rating_5 + EXCLUDED.rating_5,
+                updated_at = CURRENT_TIMESTAMP;
+        END IF;
+        UPDATE flight_rating_summaries SET airline_id = NEW.airline_id WHERE flight_id = NEW.flight_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER flights_rating_summary_delete
+    BEFORE DELETE ON flights
+    FOR EACH ROW
+    EXECUTE FUNCTION move_flight_rating_summary();
+
+CREATE TRIGGER flights_rating_summary_airline
+    AFTER UPDATE OF airline_id ON flights
+    FOR EACH ROW
+    WHEN (OLD.airline_id IS DISTINCT FROM NEW.airline_id)
+    EXECUTE FUNCTION move_flight_rating_summary();
+
+-- Per-table change counters behind the read endpoints' ETags: a table's version is the sum of its slots.
+-- The counters commit (or roll back) with the change itself, so a version is never visible before its data;
+-- writers are spread over 16 slots by backend so concurrent bookings do not queue on one counter row.
+CREATE TABLE table_versions (
+    table_name VARCHAR(63) NOT NULL,
+    slot SMALLINT NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (table_name, slot)
+);
+
+CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, slot, version)
+    VALUES (TG_TABLE_NAME, pg_backend_pid() % 16, 1)
+    ON CONFLICT (table_name, slot) DO UPDATE SET version = table_versions.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER airports_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON airports
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER airlines_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON airlines
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER flights_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON flights
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER bookings_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON bookings
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_table_version();
+
+-- Trigram indexes for fuzzy name search (similarity, word_similarity and ILIKE '%term%')
+CREATE INDEX idx_flights_flight_name_trgm ON flights USING GIN (flight_name gin_trgm_ops);
+CREATE INDEX idx_airports_name_trgm ON airports USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_airlines_name_trgm ON airlines USING GIN (name gin_trgm_ops);
\ No newline at end of file
@@ -0,0 +1,4 @@
+#!/bin/bash
+# Let the optional read replica (docker-compose replica profile) stream WAL with the same credentials
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
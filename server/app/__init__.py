@@ -8,8 +8,9 @@ from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 
-from app.database.pgsql import engine, Base
+from app.database.pgsql import engine, replica_engine, Base
 from app.database import get_redis_client, init_redis
+from app.database.replica_routing import ReadYourWrites, ReplicaLagMonitor, ReplicaRouter
 
 from app.repositories.user.user_repository import UserRepository
 from app.repositories.redis.blacklist_repository import BlacklistRepository
@@ -17,6 +18,8 @@ from app.repositories.redis.blocklist_repository import BlocklistRepository
 from app.repositories.redis.cache_repository import CacheRepository
 
 from app.infrastructure.gateway.gateway_client import GatewayClient
+from app.infrastructure.metrics.request_metrics import RequestMetrics
+from app.infrastructure.metrics.query_metrics import QueryInstrumentation
 
 from app.services.auth.auth_service import AuthService
 from app.services.mail.mail_service import MailService
@@ -27,6 +30,7 @@ from app.services.gateway.flights.gateway_flight_service import GatewayFlightSer
 from app.services.gateway.flights.gateway_rating_service import GatewayRatingService
 from app.services.gateway.flights.gateway_booking_service import GatewayBookingService
 from app.services.gateway.flights.gateway_report_service import GatewayReportService
+from app.services.gateway.flights.gateway_export_service import GatewayExportService
 
 from app.web_api.controllers.auth.auth_controller import AuthController
 from app.web_api.controllers.user.user_controller import UserController
@@ -36,6 +40,8 @@ from app.web_api.controllers.gateway.flights.gateway_flight_controller import Ga
 from app.web_api.controllers.gateway.flights.gateway_rating_controller import GatewayRatingController
 from app.web_api.controllers.gateway.flights.gateway_booking_controller import GatewayBookingController
 from app.web_api.controllers.gateway.flights.gateway_report_controller import GatewayReportController
+from app.web_api.controllers.gateway.flights.gateway_export_controller import GatewayExportController
+from app.web_api.controllers.metrics.metrics_controller import MetricsController
 
 from app.web_socket.socket import socketio
 
@@ -58,6 +64,29 @@ def create_app() -> Flask:
 
     init_redis()
 
+    request_metrics = RequestMetrics(engine, get_redis_client())
+    request_metrics.init_app(app)
+
+    query_instrumentation = QueryInstrumentation(
+        slow_query_ms=float(os.getenv("SLOW_QUERY_MS", "200")),
+        repeat_threshold=int(os.getenv("N_PLUS_ONE_THRESHOLD", "5")),
+        server_timing=os.getenv("FLASK_ENV") != "production"
+    )
+    query_instrumentation.init_app(app)
+    query_instrumentation.instrument(engine)
+
+    if replica_engine is not None:
+        query_instrumentation.instrument(replica_engine)
+        replica_router = ReplicaRouter(
+            replica_engine,
+            ReplicaLagMonitor(
+                max_lag=float(os.getenv("DB_REPLICA_MAX_LAG", "5")),
+                check_interval=float(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", "1"))
+            ),
+            ReadYourWrites(get_redis_client(), window=float(os.getenv("READ_YOUR_WRITES_WINDOW", "5")))
+        )
+        replica_router.init_app(app)
+
     with app.app_context():
         Base.metadata.create_all(bind=engine)
 
@@ -72,13 +101,15 @@ def create_app() -> Flask:
 
     gateway_flights_base_url = os.getenv("FLIGHTS_URL", "0.0.0.0")
     gateway_flights_version = os.getenv("FLIGHTS_VERSION", "/api/v1")
-    gateway_flights_client = GatewayClient(base_url=gateway_flights_base_url, version=gateway_flights_version)
+    # Cached flight-service reads are revalidated with their ETags instead of refetched
+    gateway_flights_client = GatewayClient(base_url=gateway_flights_base_url, version=gateway_flights_version, cache_repository=cache_repository)
     gateway_airline_service = GatewayAirlineService(gateway_flights_client, cache_repository)
     gateway_airport_service = GatewayAirportService(gateway_flights_client, cache_repository)
     gateway_flight_service = GatewayFlightService(gateway_flights_client, user_repository, mail_service, cache_repository)
     gateway_rating_service = GatewayRatingService(gateway_flights_client)
     gateway_booking_service = GatewayBookingService(gateway_flights_client, gateway_flight_service, user_repository)
     gateway_report_service = GatewayReportService(gateway_flights_client, user_repository, mail_service)
+    gateway_export_service = GatewayExportService(gateway_flights_client)
 
     auth_controller = AuthController(auth_service)
     user_controller = UserController(user_service)
@@ -88,6 +119,8 @@ def create_app() -> Flask:
     gateway_rating_controller = GatewayRatingController(gateway_rating_service)
     gateway_booking_controller = GatewayBookingController(gateway_booking_service)
     gateway_report_controller = GatewayReportController(gateway_report_service)
+    gateway_export_controller = GatewayExportController(gateway_export_service)
+    metrics_controller = MetricsController(request_metrics)
 
     app.register_blueprint(auth_controller.blueprint)
     app.register_blueprint(user_controller.blueprint)
@@ -97,6 +130,8 @@ def create_app() -> Flask:
     app.register_blueprint(gateway_rating_controller.blueprint)
     app.register_blueprint(gateway_booking_controller.blueprint)
     app.register_blueprint(gateway_report_controller.blueprint)
+    app.register_blueprint(gateway_export_controller.blueprint)
+    app.register_blueprint(metrics_controller.blueprint)
 
     socketio.init_app(app)
 
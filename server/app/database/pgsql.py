@@ -7,14 +7,30 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
 from contextlib import contextmanager
 
+from app.database.pool_config import PoolConfig
+from app.database.replica_routing import RoutingSession
+
 DB_URL = os.getenv('DB1_URL')
+DB_REPLICA_URL = os.getenv('DB1_REPLICA_URL')
 
 if not DB_URL:
     raise ValueError("Missing required database environment variables.")
 
-engine = create_engine(DB_URL)
+# Explicit pool sizing, pre-ping and statement/lock timeouts, optionally behind PgBouncer
+pool_config = PoolConfig.from_env()
+engine = create_engine(DB_URL, **pool_config.engine_options())
+pool_config.instrument(engine)
+
+# Optional streaming replica for @read_only repository methods, routed by the ReplicaRouter set up in create_app
+replica_engine = None
+if DB_REPLICA_URL:
+    replica_engine = create_engine(
+        DB_REPLICA_URL,
+        **pool_config.engine_options(connect_timeout=int(os.getenv('DB_REPLICA_CONNECT_TIMEOUT', default='2')))
+    )
+    pool_config.instrument(replica_engine)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
 Base = declarative_base()
 
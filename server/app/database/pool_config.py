@@ -0,0 +1,104 @@
+"""
+Connection pool configuration for the users database: explicit pool
+sizing, pre-ping, recycling and per-connection statement / lock timeouts,
+read from the environment:
+
+    DB_POOL_SIZE (10)               connections kept open per process
+    DB_MAX_OVERFLOW (10)            extra connections opened under load, closed when returned
+    DB_POOL_TIMEOUT (30)            seconds a checkout waits before failing
+    DB_POOL_RECYCLE (1800)          seconds before a connection is replaced
+    DB_POOL_PRE_PING (true)         test connections on checkout, replacing dead ones
+    DB_STATEMENT_TIMEOUT_MS (30000) statement_timeout, 0 to disable
+    DB_LOCK_TIMEOUT_MS (5000)       lock_timeout, 0 to disable
+    DB_PGBOUNCER (false)            connecting through PgBouncer in transaction pooling mode
+
+Behind PgBouncer's transaction pooling, session settings do not follow
+the client from one transaction to the next, so the timeouts are sent
+with SET LOCAL at the start of each transaction instead of as startup
+options (which PgBouncer rejects). psycopg2 never creates server-side
+prepared statements, so no driver setting is needed for those.
+"""
+import os
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+
+from app.infrastructure.metrics.pool_metrics import InstrumentedQueuePool
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class PoolConfig:
+    def __init__(
+        self,
+        size: int = 10,
+        max_overflow: int = 10,
+        timeout: float = 30,
+        recycle: int = 1800,
+        pre_ping: bool = True,
+        statement_timeout_ms: int = 30000,
+        lock_timeout_ms: int = 5000,
+        pgbouncer: bool = False
+    ) -> None:
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.statement_timeout_ms = statement_timeout_ms
+        self.lock_timeout_ms = lock_timeout_ms
+        self.pgbouncer = pgbouncer
+
+    @classmethod
+    def from_env(cls) -> PoolConfig:
+        return cls(
+            size=int(os.getenv("DB_POOL_SIZE", default="10")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", default="10")),
+            timeout=float(os.getenv("DB_POOL_TIMEOUT", default="30")),
+            recycle=int(os.getenv("DB_POOL_RECYCLE", default="1800")),
+            pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+            statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", default="30000")),
+            lock_timeout_ms=int(os.getenv("DB_LOCK_TIMEOUT_MS", default="5000")),
+            pgbouncer=_env_bool("DB_PGBOUNCER", False)
+        )
+
+    def engine_options(self, connect_timeout: int | None = None) -> dict[str, Any]:
+        """create_engine() keyword arguments, waiting at most connect_timeout seconds for a new connection"""
+        options: dict[str, Any] = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout,
+            "pool_recycle": self.recycle,
+            "pool_pre_ping": self.pre_ping,
+        }
+        connect_args: dict[str, Any] = {}
+        timeouts = self._timeouts()
+        if timeouts and not self.pgbouncer:
+            connect_args["options"] = " ".join(f"-c {name}={value}" for name, value in timeouts.items())
+        if connect_timeout is not None:
+            connect_args["connect_timeout"] = connect_timeout
+        if connect_args:
+            options["connect_args"] = connect_args
+        return options
+
+    def instrument(self, engine: Engine) -> None:
+        """Apply the timeouts per transaction when session settings cannot stick (PgBouncer)"""
+        timeouts = self._timeouts()
+        if not self.pgbouncer or not timeouts:
+            return
+        statement = "SELECT " + ", ".join(f"set_config('{name}', '{value}ms', true)" for name, value in timeouts.items())
+
+        def set_local_timeouts(conn: Connection) -> None:
+            conn.exec_driver_sql(statement)
+
+        event.listen(engine, "begin", set_local_timeouts)
+
+    def _timeouts(self) -> dict[str, int]:
+        timeouts = {"statement_timeout": self.statement_timeout_ms, "lock_timeout": self.lock_timeout_ms}
+        return {name: value for name, value in timeouts.items() if value > 0}
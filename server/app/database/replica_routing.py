@@ -0,0 +1,186 @@
+"""
+Read replica routing for the users database: repository methods marked
+@read_only run on the read replica (DB1_REPLICA_URL) when that is safe:
+
+    - only while serving GET/HEAD requests: a write request reads what it
+      is about to change from the primary, and so does background work
+    - never once the session has written, so a request reads its own writes
+    - never for a caller (Authorization header) who wrote within the
+      read-your-writes window, whichever worker handled the write
+    - never while the replica lags past the threshold or cannot be reached
+
+The choice is made once per transaction and can only fall back to the
+primary afterwards.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+
+import redis
+from flask import Flask, current_app, has_app_context, has_request_context, request
+from sqlalchemy import Engine, event, text
+from sqlalchemy.orm import Session
+
+from app.infrastructure.metrics.replica_metrics import READ_ROUTING, REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_KEY = "replica_router"
+
+# Replay lag in seconds; a replica that has replayed everything it received counts as current
+# even when the primary has been idle, and a database that is not a standby has no lag at all
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+
+
+def read_only[**P, R](method: Callable[P, R]) -> Callable[P, R]:
+    """Let the statements of a repository method go to the replica (see ReplicaRouter)"""
+    @wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _read_only.set(True)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+    return wrapper
+
+
+def _caller() -> str | None:
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return None
+    return hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+
+
+class ReplicaLagMonitor:
+    """Replica health, probed at most once per check_interval by whichever thread asks first"""
+
+    def __init__(self, max_lag: float = 5.0, check_interval: float = 1.0) -> None:
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._usable = False
+
+    def usable(self, engine: Engine) -> bool:
+        now = time.monotonic()
+        # Other threads keep the previous answer while one probes
+        if now - self._checked_at >= self.check_interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked_at = now
+                self._usable = self._probe(engine)
+            finally:
+                self._lock.release()
+        return self._usable
+
+    def _probe(self, engine: Engine) -> bool:
+        try:
+            with engine.connect() as conn:
+                lag = float(conn.execute(LAG_QUERY).scalar() or 0)
+        except Exception as e:
+            if self._usable:
+                logger.warning(f"Read replica unreachable, reading from the primary: {str(e)}")
+            return False
+
+        REPLICA_LAG.set(lag)
+        usable = lag <= self.max_lag
+        if self._usable and not usable:
+            logger.warning(f"Read replica lagging {lag:.3f}s (max {self.max_lag}s), reading from the primary")
+        return usable
+
+
+class ReadYourWrites:
+    """Callers who wrote within the last window seconds, shared through Redis"""
+
+    def __init__(self, redis_client: redis.Redis, window: float = 5.0, key_prefix: str = "gateway:ryw:") -> None:
+        self.redis_client = redis_client
+        self.window = window
+        self.key_prefix = key_prefix
+
+    def record(self, caller: str) -> None:
+        try:
+            self.redis_client.set(self.key_prefix + caller, 1, px=int(self.window * 1000))
+        except Exception as e:
+            logger.warning(f"Could not record write for read-your-writes: {str(e)}")
+
+    def is_recent(self, caller: str) -> bool:
+        try:
+            return bool(self.redis_client.exists(self.key_prefix + caller))
+        except Exception:
+            # Without the shared record, play it safe
+            return True
+
+
+class ReplicaRouter:
+    """Decides per transaction whether @read_only statements may use the replica engine"""
+
+    def __init__(self, replica_engine: Engine, lag_monitor: ReplicaLagMonitor, read_your_writes: ReadYourWrites) -> None:
+        self.replica_engine = replica_engine
+        self.lag_monitor = lag_monitor
+        self.read_your_writes = read_your_writes
+
+    def init_app(self, app: Flask) -> None:
+        app.extensions[EXTENSION_KEY] = self
+
+    def use_replica(self, session: Session) -> bool:
+        decision = session.info.get("use_replica")
+        if decision is None:
+            decision, reason = self._decide(session)
+            session.info["use_replica"] = decision
+            READ_ROUTING.labels("replica" if decision else "primary", reason).inc()
+        return decision
+
+    def _decide(self, session: Session) -> tuple[bool, str]:
+        if session.info.get("wrote"):
+            return False, "session_wrote"
+        if not has_request_context():
+            return False, "background"
+        if request.method not in ("GET", "HEAD"):
+            return False, "write_request"
+        caller = _caller()
+        if caller and self.read_your_writes.is_recent(caller):
+            return False, "read_your_writes"
+        if not self.lag_monitor.usable(self.replica_engine):
+            return False, "replica_unavailable"
+        return True, "read_only"
+
+    def record_write(self, session: Session) -> None:
+        session.info["use_replica"] = False
+        if session.info.get("wrote"):
+            return
+        session.info["wrote"] = True
+        if has_request_context():
+            caller = _caller()
+            if caller:
+                self.read_your_writes.record(caller)
+
+
+class RoutingSession(Session):
+    """Session class (sessionmaker class_) sending @read_only statements to the replica when the ReplicaRouter allows it"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):  # type: ignore[override]
+        router: ReplicaRouter | None = current_app.extensions.get(EXTENSION_KEY) if has_app_context() else None
+        if router is not None and bind is None:
+            if self._flushing or getattr(clause, "is_dml", False):
+                router.record_write(self)
+            elif _read_only.get() and router.use_replica(self):
+                return router.replica_engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_route(session: Session) -> None:
+    # Decide again in the next transaction; "wrote" keeps a session that wrote on the primary
+    session.info.pop("use_replica", None)
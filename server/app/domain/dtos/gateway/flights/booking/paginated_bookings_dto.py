@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Self
+from typing import Any, List, Optional, Self
 
 from app.domain.dtos.gateway.flights.booking.booking_dto import BookingDTO
 
@@ -10,6 +10,8 @@ class PaginatedBookingsDTO:
     per_page: int
     total: int
     pages: int
+    next_cursor: Optional[str] = None
+    total_mode: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
@@ -18,7 +20,9 @@ class PaginatedBookingsDTO:
             page=data.get("page", 1),
             per_page=data.get("per_page", 10),
             total=data.get("total", 0),
-            pages=data.get("pages", 1)
+            pages=data.get("pages", 1),
+            next_cursor=data.get("next_cursor"),
+            total_mode=data.get("total_mode")
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -27,5 +31,7 @@ class PaginatedBookingsDTO:
             "page": self.page,
             "per_page": self.per_page,
             "total": self.total,
-            "pages": self.pages
+            "pages": self.pages,
+            "next_cursor": self.next_cursor,
+            "total_mode": self.total_mode
         }
\ No newline at end of file
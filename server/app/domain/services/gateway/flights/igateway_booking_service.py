@@ -11,7 +11,7 @@ class IGatewayBookingService(ABC):
         pass
 
     @abstractmethod
-    def get_all_bookings(self, page: int, per_page: int) -> Result[PaginatedBookingsDTO, int]:
+    def get_all_bookings(self, page: int, per_page: int, cursor: str | None = None, count: str | None = None) -> Result[PaginatedBookingsDTO, int]:
         pass
 
     @abstractmethod
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Mapping
+
+from app.domain.types.export_stream import ExportStream
+from app.domain.types.result import Result
+
+class IGatewayExportService(ABC):
+    @abstractmethod
+    def export(self, entity: str, params: Mapping[str, str], admin_id: int) -> Result[ExportStream, int]:
+        pass
@@ -18,7 +18,7 @@ class IGatewayFlightService(ABC):
         pass
 
     @abstractmethod
-    def get_all_flights(self, page: int, per_page: int, filters: dict[str, Any] | None = None) -> Result[PaginatedFlightsDTO, int]:
+    def get_all_flights(self, page: int, per_page: int, filters: dict[str, Any] | None = None, cursor: str | None = None) -> Result[PaginatedFlightsDTO, int]:
         pass
 
     @abstractmethod
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class CachedResponse[T]:
+    """A DTO cached by the gateway with the upstream validator needed to revalidate it"""
+    data: T
+    etag: str | None
+    # Epoch seconds until which data is served without asking upstream (the response's max-age)
+    fresh_until: float
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+@dataclass(frozen=True)
+class ExportStream:
+    content_type: str
+    content_disposition: str
+    chunks: Iterator[bytes]
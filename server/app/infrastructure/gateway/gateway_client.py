@@ -1,14 +1,23 @@
 import requests
+import time
 from urllib.parse import urljoin
-from typing import Any
+from typing import Any, Callable
 import logging
 
+from werkzeug.http import parse_cache_control_header
+
+from app.domain.repositories.redis.icache_repository import ICacheRepository
+from app.domain.types.cached_response import CachedResponse
+from app.domain.types.result import Result, ok
+from app.infrastructure.gateway.utils.api_callers import make_api_call
+
 logger = logging.getLogger(__name__)
 
 class GatewayClient:
-    def __init__(self, base_url: str, version: str, headers: dict[str, str] | None = None) -> None:
+    def __init__(self, base_url: str, version: str, headers: dict[str, str] | None = None, cache_repository: ICacheRepository | None = None) -> None:
         self.base_url = base_url
         self.version = version
+        self.cache_repository = cache_repository
         self.session = requests.Session()
         default_headers = {"Content-Type": "application/json", "Accept": "application/json"}
         if headers:
@@ -41,4 +50,48 @@ class GatewayClient:
         return self.request(path, method="PATCH", **kwargs)
     
     def delete(self, path: str, **kwargs: Any) -> requests.Response:
-        return self.request(path, method="DELETE", **kwargs)
\ No newline at end of file
+        return self.request(path, method="DELETE", **kwargs)
+
+    def get_cached[T](self, path: str, cache_key: str, on_success: Callable[[requests.Response], T], ttl: int, **kwargs: Any) -> Result[T, int]:
+        """
+        GET through the cache. A cached DTO is served as is while the upstream
+        max-age lasts, then revalidated with If-None-Match: a 304 keeps it (and
+        its TTL restarts) without transferring or parsing the body again.
+        Responses without an ETag are served from the cache for the whole ttl.
+        """
+        if self.cache_repository is None:
+            return make_api_call(lambda: self.get(path, **kwargs), on_success)
+
+        cached = self.cache_repository.get_cache(cache_key)
+        if not isinstance(cached, CachedResponse):
+            cached = None
+        elif time.time() < cached.fresh_until:
+            return ok(cached.data)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        def store(response: requests.Response) -> T:
+            if response.status_code == 304 and cached is not None:
+                data, etag = cached.data, response.headers.get("ETag", cached.etag)
+            else:
+                data, etag = on_success(response), response.headers.get("ETag")
+            self.cache_repository.set_cache(cache_key, CachedResponse(data, etag, self._fresh_until(response, etag, ttl)), ttl)
+            return data
+
+        return make_api_call(
+            lambda: self.get(path, headers=headers, **kwargs),
+            store,
+            success_codes=(200, 304) if cached is not None else (200,)
+        )
+
+    @staticmethod
+    def _fresh_until(response: requests.Response, etag: str | None, ttl: int) -> float:
+        if etag is None:
+            # Nothing to revalidate with: plain TTL caching
+            return time.time() + ttl
+        cache_control = parse_cache_control_header(response.headers.get("Cache-Control"))
+        if cache_control.no_cache or cache_control.max_age is None:
+            return 0.0
+        return time.time() + cache_control.max_age
@@ -0,0 +1,35 @@
+"""
+Connection pool checkout metrics for the gateway: how long requests wait
+for a pooled database connection, and how often they give up after
+pool_timeout. The pool's size and usage are sampled by RequestMetrics.
+"""
+import time
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool.base import ConnectionPoolEntry
+
+CHECKOUT_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds', 'Time to get a connection from the pool, including opening a new one',
+    buckets=CHECKOUT_WAIT_BUCKETS
+)
+CHECKOUT_TIMEOUTS = Counter(
+    'db_pool_checkout_timeouts_total', 'Checkouts that gave up after pool_timeout with the pool exhausted'
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool timing every checkout (engine poolclass)"""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            CHECKOUT_WAIT.observe(time.perf_counter() - started)
@@ -0,0 +1,112 @@
+"""
+Per-request SQL instrumentation for the gateway: counts statements and database time for every request, logs slow
+statements and statement shapes repeated often enough to be an N+1, and
+reports the totals in a Server-Timing header outside production.
+
+SQLAlchemy renders bound parameters as placeholders, so the statement text
+is the statement's shape: a lazy load issued once per row shows up as one
+text executed N times.
+"""
+import logging
+import time
+from collections import Counter
+from typing import Any
+
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExceptionContext
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_STATEMENT = 500
+
+
+def _shorten(statement: str) -> str:
+    statement = ' '.join(statement.split())
+    if len(statement) > MAX_LOGGED_STATEMENT:
+        return statement[:MAX_LOGGED_STATEMENT] + '...'
+    return statement
+
+
+class QueryStats:
+    """Statements executed while handling one request"""
+
+    __slots__ = ('count', 'duration', 'shapes')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least threshold times"""
+        return [(statement, times) for statement, times in self.shapes.most_common() if times >= threshold]
+
+
+class QueryInstrumentation:
+    """SQLAlchemy cursor events scoped to the Flask request being served"""
+
+    def __init__(self, slow_query_ms: float = 200, repeat_threshold: int = 5, server_timing: bool = False) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.repeat_threshold = repeat_threshold
+        self.server_timing = server_timing
+
+    def init_app(self, app: Flask) -> None:
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, 'before_cursor_execute', self._before_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_execute)
+        event.listen(engine, 'handle_error', self._on_error)
+
+    def _before_request(self) -> None:
+        g.query_stats = QueryStats()
+
+    def _after_request(self, response: Response) -> Response:
+        stats = g.pop('query_stats', None)
+        if stats is None:
+            return response
+
+        for statement, times in stats.repeated(self.repeat_threshold):
+            logger.warning(f"Probable N+1 on {_route()}: statement repeated {times} times: {_shorten(statement)}")
+
+        if self.server_timing:
+            response.headers.add(
+                'Server-Timing',
+                f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries, '
+                f'{len(stats.repeated(self.repeat_threshold))} repeated"'
+            )
+        return response
+
+    def _before_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        # A stack, since a statement can run from inside another statement's events
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    def _after_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        duration = time.perf_counter() - conn.info['query_started'].pop()
+        # Background threads (report delivery, mail) run outside any request
+        if not has_request_context():
+            return
+
+        stats = g.get('query_stats')
+        if stats is not None:
+            stats.add(statement, duration)
+        if duration * 1000 >= self.slow_query_ms:
+            logger.warning(f"Slow statement on {_route()} ({duration * 1000:.2f} ms): {_shorten(statement)}")
+
+    def _on_error(self, exception_context: ExceptionContext) -> None:
+        # A failed statement never reaches after_cursor_execute
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('query_started'):
+            conn.info['query_started'].pop()
+
+
+def _route() -> str:
+    return f"{request.method} {request.url_rule.rule if request.url_rule is not None else request.path}"
+
@@ -0,0 +1,114 @@
+"""
+Request instrumentation for the gateway: per-route latency histograms,
+in-flight requests, status codes and connection pool usage in the
+Prometheus exposition format.
+
+Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR
+(set up in gunicorn_config.py) and /metrics aggregates all workers. Pool
+gauges are sampled by each worker after every request and again by the
+worker answering the scrape.
+"""
+import os
+import time
+from typing import Any
+
+import redis
+from flask import Flask, Response, g, request
+from sqlalchemy import Engine
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess
+)
+
+# Routes are labelled by their template (/api/v1/flights/<int:flight_id>), never the raw path
+UNMATCHED_ROUTE = '<unmatched>'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUESTS = Counter(
+    'http_requests_total', 'HTTP requests by route template and status code',
+    ['method', 'route', 'status']
+)
+LATENCY = Histogram(
+    'http_request_duration_seconds', 'Time until the response is returned to the WSGI server',
+    ['method', 'route'], buckets=LATENCY_BUCKETS
+)
+IN_PROGRESS = Gauge(
+    'http_requests_in_progress', 'Requests being handled right now',
+    ['method', 'route'], multiprocess_mode='livesum'
+)
+WORKERS = Gauge(
+    'gunicorn_workers', 'Live worker processes serving requests', multiprocess_mode='livesum'
+)
+DB_POOL = Gauge(
+    'db_pool_connections', 'SQLAlchemy pool connections by state',
+    ['state'], multiprocess_mode='livesum'
+)
+REDIS_POOL = Gauge(
+    'redis_pool_connections', 'Redis pool connections by state',
+    ['state'], multiprocess_mode='livesum'
+)
+
+
+class RequestMetrics:
+    """Flask before/after-request hooks that feed the Prometheus metrics"""
+
+    def __init__(self, engine: Engine, redis_client: redis.Redis | None = None) -> None:
+        self._engine = engine
+        self._redis_client = redis_client
+
+    def init_app(self, app: Flask) -> None:
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        WORKERS.set(1)
+
+    def _before_request(self) -> None:
+        route = request.url_rule.rule if request.url_rule is not None else UNMATCHED_ROUTE
+        g.metrics_route = route
+        g.metrics_started = time.perf_counter()
+        IN_PROGRESS.labels(request.method, route).inc()
+
+    def _after_request(self, response: Response) -> Response:
+        route = g.get('metrics_route')
+        if route is not None:
+            LATENCY.labels(request.method, route).observe(time.perf_counter() - g.metrics_started)
+            REQUESTS.labels(request.method, route, str(response.status_code)).inc()
+            self.observe_pools()
+        return response
+
+    def _teardown_request(self, exc: BaseException | None) -> None:
+        # Runs even when a response could not be built, so the gauge never leaks
+        route = g.pop('metrics_route', None)
+        if route is not None:
+            IN_PROGRESS.labels(request.method, route).dec()
+
+    def observe_pools(self) -> None:
+        """Sample this worker's database and Redis pools"""
+        pool: Any = self._engine.pool
+        if hasattr(pool, 'checkedout'):
+            DB_POOL.labels('checked_out').set(pool.checkedout())
+            DB_POOL.labels('idle').set(pool.checkedin())
+            DB_POOL.labels('overflow').set(max(pool.overflow(), 0))
+            DB_POOL.labels('size').set(pool.size())
+
+        if self._redis_client is not None:
+            redis_pool = self._redis_client.connection_pool
+            REDIS_POOL.labels('in_use').set(len(getattr(redis_pool, '_in_use_connections', ())))
+            REDIS_POOL.labels('idle').set(len(getattr(redis_pool, '_available_connections', ())))
+            REDIS_POOL.labels('max').set(redis_pool.max_connections)
+
+    def render(self) -> tuple[bytes, str]:
+        """Exposition of every worker's metrics (or this process's outside gunicorn)"""
+        self.observe_pools()
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,15 +1,19 @@
 from sqlalchemy.orm import Session
 
+from app.database.replica_routing import read_only
 from app.domain.models.user import User
 from app.domain.repositories.user.iuser_repository import IUserRepository
 
 class UserRepository(IUserRepository):
+    @read_only
     def get_all(self, db: Session)-> list[User]:
         return db.query(User).all()
 
+    @read_only
     def get_by_id(self, user_id: int, db: Session)-> User | None:
         return db.query(User).filter(User.user_id == user_id).first()
 
+    @read_only
     def get_by_ids(self, user_ids: list[int], db: Session) -> list[User]:
         if not user_ids:
             return []
@@ -17,6 +21,7 @@ class UserRepository(IUserRepository):
         users = db.query(User).filter(User.user_id.in_(user_ids)).all()
         return users
         
+    @read_only
     def get_by_email(self, email: str, db: Session)-> User | None:
         return db.query(User).filter(User.email == email).first()
     
@@ -23,40 +23,26 @@ class GatewayAirlineService(IGatewayAirlineService):
         )
 
         if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{result.data.id}", result.data, 300)
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
 
         return result
     
     def get_all_airlines(self, page: int, per_page: int) -> Result[PaginatedAirlinesDTO, int]:
-        cached_data = self.cache_repository.get_cache(f"{self.cache_prefix}page:{page}:per_page:{per_page}")
-        if cached_data is not None:
-            return ok(cached_data)
-        
-        result = make_api_call(
-            lambda: self.client.get("/airlines", params={'page': page, 'per_page': per_page}),
-            lambda r: PaginatedAirlinesDTO.from_dict(r.json()) 
+        return self.client.get_cached(
+            "/airlines",
+            f"{self.cache_prefix}page:{page}:per_page:{per_page}",
+            lambda r: PaginatedAirlinesDTO.from_dict(r.json()),
+            60,
+            params={'page': page, 'per_page': per_page}
         )
 
-        if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}page:{page}:per_page:{per_page}", result.data, 60)
-
-        return result
-
     def get_airline(self, airline_id: int) -> Result[AirlineDTO, int]:
-        cached_data = self.cache_repository.get_cache(f"{self.cache_prefix}{airline_id}")
-        if cached_data is not None:
-            return ok(cached_data)
-
-        result = make_api_call(
-            lambda: self.client.get(f"/airlines/{airline_id}"),
-            lambda r: AirlineDTO.from_dict(r.json()) 
+        return self.client.get_cached(
+            f"/airlines/{airline_id}",
+            f"{self.cache_prefix}{airline_id}",
+            lambda r: AirlineDTO.from_dict(r.json()),
+            300
         )
-
-        if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{airline_id}", result.data, 300)
-
-        return result
     
     def update_airline(self, airline_id: int, data: AirlineUpdateDTO) -> Result[AirlineDTO, int]:
         result = make_api_call(
@@ -66,7 +52,7 @@ class GatewayAirlineService(IGatewayAirlineService):
 
         if isinstance(result, ok):
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
-            self.cache_repository.set_cache(f"{self.cache_prefix}{airline_id}", result.data, 300)
+            self.cache_repository.delete_cache(f"{self.cache_prefix}{airline_id}")
 
         return result
     
@@ -23,39 +23,29 @@ class GatewayAirportService(IGatewayAirportService):
         )
 
         if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{result.data.id}", result.data, 300)
             self.cache_repository.set_cache(f"{self.cache_prefix}code:{result.data.code}", result.data, 300)
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
 
         return result
     
     def get_all_airports(self, page: int, per_page: int) -> Result[PaginatedAirportsDTO, int]:
-        cached_data = self.cache_repository.get_cache(f"{self.cache_prefix}page:{page}:per_page:{per_page}")
-        if cached_data is not None:
-            return ok(cached_data)
-        
-        result = make_api_call(
-            lambda: self.client.get("/airports", params={'page': page, 'per_page': per_page}),
+        return self.client.get_cached(
+            "/airports",
+            f"{self.cache_prefix}page:{page}:per_page:{per_page}",
             lambda r: PaginatedAirportsDTO.from_dict(r.json()),
+            60,
+            params={'page': page, 'per_page': per_page}
         )
 
-        if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}page:{page}:per_page:{per_page}", result.data, 60)
-
-        return result
-
     def get_airport(self, airport_id: int) -> Result[AirportDTO, int]:
-        cached_data = self.cache_repository.get_cache(f"{self.cache_prefix}{airport_id}")
-        if cached_data is not None:
-            return ok(cached_data)
-
-        result = make_api_call(
-            lambda: self.client.get(f"/airports/{airport_id}"),
+        result = self.client.get_cached(
+            f"/airports/{airport_id}",
+            f"{self.cache_prefix}{airport_id}",
             lambda r: AirportDTO.from_dict(r.json()),
+            300
         )
 
         if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{airport_id}", result.data, 300)
             self.cache_repository.set_cache(f"{self.cache_prefix}code:{result.data.code}", result.data, 300)
 
         return result
@@ -70,7 +60,7 @@ class GatewayAirportService(IGatewayAirportService):
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
             self.cache_repository.delete_pattern(f"{self.cache_prefix}code:*")
             self.cache_repository.set_cache(f"{self.cache_prefix}code:{result.data.code}", result.data, 300)
-            self.cache_repository.set_cache(f"{self.cache_prefix}{airport_id}", result.data, 300)
+            self.cache_repository.delete_cache(f"{self.cache_prefix}{airport_id}")
 
         return result
 
@@ -99,7 +89,6 @@ class GatewayAirportService(IGatewayAirportService):
         )
 
         if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{result.data.id}", result.data, 300)
             self.cache_repository.set_cache(f"{self.cache_prefix}code:{airport_code}", result.data, 300)
 
         return result
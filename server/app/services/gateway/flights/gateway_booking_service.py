@@ -47,9 +47,15 @@ class GatewayBookingService(IGatewayBookingService):
             
             return result
 
-    def get_all_bookings(self, page: int, per_page: int) -> Result[PaginatedBookingsDTO, int]:
+    def get_all_bookings(self, page: int, per_page: int, cursor: str | None = None, count: str | None = None) -> Result[PaginatedBookingsDTO, int]:
+        params: dict[str, int | str] = {'page': page, 'per_page': per_page}
+        if cursor is not None:
+            params['cursor'] = cursor
+        if count is not None:
+            params['count'] = count
+
         return make_api_call(
-            lambda: self.client.get("/bookings", params={'page': page, 'per_page': per_page}),
+            lambda: self.client.get("/bookings", params=params),
             lambda r: PaginatedBookingsDTO.from_dict(r.json())
         )
 
@@ -61,7 +67,7 @@ class GatewayBookingService(IGatewayBookingService):
 
     def get_user_bookings(self, page: int, per_page: int, user_id: int) -> Result[PaginatedBookingsDTO, int]:
         return make_api_call(
-            lambda: self.client.get(f"/users/{user_id}/bookings", params={'page': page, 'per_page': per_page}),
+            lambda: self.client.get(f"/users/{user_id}/bookings", headers={'user-id': str(user_id)}, params={'page': page, 'per_page': per_page}),
             lambda r: PaginatedBookingsDTO.from_dict(r.json())
         )
 
@@ -0,0 +1,40 @@
+from typing import Iterator, Mapping
+
+import requests
+
+from app.domain.services.gateway.flights.igateway_export_service import IGatewayExportService
+from app.domain.types.export_stream import ExportStream
+from app.domain.types.result import Result
+
+from app.infrastructure.gateway.gateway_client import GatewayClient
+from app.infrastructure.gateway.utils.api_callers import make_api_call
+
+class GatewayExportService(IGatewayExportService):
+    def __init__(self, gateway_client: GatewayClient, chunk_size: int = 64 * 1024, read_timeout: float = 300) -> None:
+        self.client = gateway_client
+        self.chunk_size = chunk_size
+        self.read_timeout = read_timeout
+
+    def export(self, entity: str, params: Mapping[str, str], admin_id: int) -> Result[ExportStream, int]:
+        # stream=True hands the body over chunk by chunk instead of buffering the whole file in r.content
+        return make_api_call(
+            lambda: self.client.get(
+                f"/exports/{entity}",
+                headers={'admin-id': str(admin_id), 'Accept': '*/*'},
+                params=params,
+                stream=True,
+                timeout=(5, self.read_timeout)
+            ),
+            lambda r: ExportStream(
+                content_type=r.headers.get('Content-Type', 'application/octet-stream'),
+                content_disposition=r.headers.get('Content-Disposition', f'attachment; filename="{entity}"'),
+                chunks=self._relay(r)
+            )
+        )
+
+    def _relay(self, response: requests.Response) -> Iterator[bytes]:
+        # Closing also runs when the client disconnects, which releases the upstream connection
+        try:
+            yield from response.iter_content(chunk_size=self.chunk_size)
+        finally:
+            response.close()
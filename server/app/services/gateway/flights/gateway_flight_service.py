@@ -42,31 +42,31 @@ class GatewayFlightService(IGatewayFlightService):
         )
 
         if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{result.data.flight_id}", result.data, 300)
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
 
             send_to_room('admins', 'flight-created', result.data.to_dict())
 
         return result
 
-    def get_all_flights(self, page: int, per_page: int, filters: dict[str, Any] | None = None) -> Result[PaginatedFlightsDTO, int]:
+    def get_all_flights(self, page: int, per_page: int, filters: dict[str, Any] | None = None, cursor: str | None = None) -> Result[PaginatedFlightsDTO, int]:
         filter_str = str(sorted((filters or {}).items()))
         filter_hash = hashlib.md5(filter_str.encode()).hexdigest()
-
-        cached_data = self.cache_repository.get_cache(f"{self.cache_prefix}page:{page}:per_page:{per_page}:filters:{filter_hash}")
-        if cached_data is not None:
-            return ok(cached_data)
-
-        result = make_api_call(
-            lambda: self.client.get("/flights", params={'page': page, 'per_page': per_page, **(filters or {})}),
-            lambda r: PaginatedFlightsDTO.from_dict(r.json())
+        cache_key = f"{self.cache_prefix}page:{page}:per_page:{per_page}:filters:{filter_hash}"
+        if cursor is not None:
+            cache_key += f":cursor:{cursor}"
+
+        params: dict[str, Any] = {'page': page, 'per_page': per_page, **(filters or {})}
+        if cursor is not None:
+            params['cursor'] = cursor
+
+        return self.client.get_cached(
+            "/flights",
+            cache_key,
+            lambda r: PaginatedFlightsDTO.from_dict(r.json()),
+            60,
+            params=params
         )
 
-        if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}page:{page}:per_page:{per_page}:filters:{filter_hash}", result.data, 60)
-
-        return result
-
     def get_flights_by_tab(self, tab: str, page: int, per_page: int, filters: dict[str, Any] | None = None) -> Result[PaginatedFlightsByTabDTO, int]:
         filter_str = str(sorted((filters or {}).items()))
         filter_hash = hashlib.md5(filter_str.encode()).hexdigest()
@@ -86,20 +86,13 @@ class GatewayFlightService(IGatewayFlightService):
         return result
 
     def get_flight(self, flight_id: int) -> Result[FlightDTO, int]:
-        cached_data = self.cache_repository.get_cache(f"{self.cache_prefix}{flight_id}")
-        if cached_data is not None:
-            return ok(cached_data)
-
-        result = make_api_call(
-            lambda: self.client.get(f"/flights/{flight_id}"),
-            lambda r: FlightDTO.from_dict(r.json())
+        return self.client.get_cached(
+            f"/flights/{flight_id}",
+            f"{self.cache_prefix}{flight_id}",
+            lambda r: FlightDTO.from_dict(r.json()),
+            300
         )
 
-        if isinstance(result, ok):
-            self.cache_repository.set_cache(f"{self.cache_prefix}{flight_id}", result.data, 300)
-
-        return result
-
     def update_flight(self, flight_id: int, data: FlightUpdateDTO, updated_by: int) -> Result[FlightDTO, int]:
         result = make_api_call(
             lambda: self.client.patch(f"/flights/{flight_id}", headers={'user-id': str(updated_by)}, json=data.to_dict()),
@@ -108,7 +101,7 @@ class GatewayFlightService(IGatewayFlightService):
 
         if isinstance(result, ok):
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
-            self.cache_repository.set_cache(f"{self.cache_prefix}{flight_id}", result.data, 300)
+            self.cache_repository.delete_cache(f"{self.cache_prefix}{flight_id}")
 
         return result
 
@@ -120,7 +113,7 @@ class GatewayFlightService(IGatewayFlightService):
 
         if isinstance(result, ok):
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
-            self.cache_repository.set_cache(f"{self.cache_prefix}{flight_id}", result.data, 300)
+            self.cache_repository.delete_cache(f"{self.cache_prefix}{flight_id}")
 
         return result
 
@@ -132,7 +125,7 @@ class GatewayFlightService(IGatewayFlightService):
 
         if isinstance(result, ok):
             self.cache_repository.delete_pattern(f"{self.cache_prefix}page:*")
-            self.cache_repository.set_cache(f"{self.cache_prefix}{flight_id}", result.data.flight, 300)
+            self.cache_repository.delete_cache(f"{self.cache_prefix}{flight_id}")
 
             with get_db() as db:
                 users = self.user_repository.get_by_ids(result.data.affected_user_ids or [], db)
@@ -32,7 +32,7 @@ class GatewayRatingService(IGatewayRatingService):
 
     def get_user_ratings(self, page: int, per_page: int, user_id: int) -> Result[PaginatedRatingsDTO, int]:
         return make_api_call(
-            lambda: self.client.get(f"/users/{user_id}/ratings", params={'page': page, 'per_page': per_page}),
+            lambda: self.client.get(f"/users/{user_id}/ratings", headers={'user-id': str(user_id)}, params={'page': page, 'per_page': per_page}),
             lambda r: PaginatedRatingsDTO.from_dict(r.json())
         )
 
@@ -1,3 +1,8 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from app.database import get_db
 
 from app.domain.services.gateway.flights.igateway_report_service import IGatewayReportService
@@ -11,33 +16,75 @@ from app.services.mail.mail_formatter import MailFormatter
 from app.infrastructure.gateway.gateway_client import GatewayClient
 from app.infrastructure.gateway.utils.api_callers import make_api_call
 
+logger = logging.getLogger(__name__)
+
 class GatewayReportService(IGatewayReportService):
-    def __init__(self, gateway_client: GatewayClient, user_repository: IUserRepository, mail_service: IMailService) -> None:
+    def __init__(self, gateway_client: GatewayClient, user_repository: IUserRepository, mail_service: IMailService,
+                 poll_interval: float = 2, max_wait: float = 600, max_workers: int = 4) -> None:
         self.client = gateway_client
         self.user_repository = user_repository
         self.mail_service = mail_service
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
 
     def generate_pdf_report(self, data: ReportRequestDTO, admin_id: int) -> Result[None, int]:
+        with get_db() as db:
+            user = self.user_repository.get_by_id(admin_id, db)
+
+        if user is None:
+            return err(404, "User not found")
+
+        # The flight service renders the report as a background job (202), or answers 200 when it is cached
         result = make_api_call(
-            lambda: self.client.post("/reports/flights", headers={'admin-id': str(admin_id)}, json=data.to_dict(), timeout=20),
-            lambda r: r.content
+            lambda: self.client.post("/reports/flights", headers={'admin-id': str(admin_id)}, json=data.to_dict(), timeout=10),
+            lambda r: r.json(),
+            success_codes=(200, 202)
         )
         if isinstance(result, ok):
-            pdf_bytes: bytes = result.data
+            job: dict[str, Any] = result.data
+            self._executor.submit(self._deliver_report, job['job_id'], admin_id, user)
+            return ok(None)
 
-            with get_db() as db:
-                user = self.user_repository.get_by_id(admin_id, db)
+        return err(result.status_code, result.message)
 
-            if user is None:
-                return err(404, "User not found")
+    def _deliver_report(self, job_id: str, admin_id: int, user: Any) -> None:
+        """Wait for the report job to finish and mail the PDF to the admin who requested it"""
+        headers = {'admin-id': str(admin_id)}
+        deadline = time.monotonic() + self.max_wait
 
-            self.mail_service.send_async(
-                user.email, 
-                MailFormatter.flight_report_format(user), 
-                attachment_bytes=pdf_bytes, 
-                attachment_name="flight_report.pdf"
+        while True:
+            result = make_api_call(
+                lambda: self.client.get(f"/reports/jobs/{job_id}", headers=headers, timeout=10),
+                lambda r: r.json()
             )
+            if not isinstance(result, ok):
+                logger.error(f"Report job {job_id} lookup failed: {result.message}")
+                return
 
-            return ok(None)
-        
-        return err(result.status_code, result.message)
\ No newline at end of file
+            status = result.data['status']
+            if status == 'completed':
+                break
+            if status == 'failed':
+                logger.error(f"Report job {job_id} failed: {result.data.get('error')}")
+                return
+            if time.monotonic() >= deadline:
+                logger.error(f"Report job {job_id} still {status} after {self.max_wait} s, giving up")
+                return
+            time.sleep(self.poll_interval)
+
+        pdf = make_api_call(
+            lambda: self.client.get(f"/reports/jobs/{job_id}/pdf", headers=headers, timeout=30),
+            lambda r: r.content
+        )
+        if not isinstance(pdf, ok):
+            logger.error(f"Report job {job_id} download failed: {pdf.message}")
+            return
+
+        pdf_bytes: bytes = pdf.data
+        self.mail_service.send_async(
+            user.email,
+            MailFormatter.flight_report_format(user),
+            attachment_bytes=pdf_bytes,
+            attachment_name="flight_report.pdf"
+        )
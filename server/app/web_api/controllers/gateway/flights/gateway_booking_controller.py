@@ -60,8 +60,10 @@ class GatewayBookingController:
     def get_all_bookings(self) -> tuple[Response, int]:
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
+        cursor = request.args.get('cursor', type=str)
+        count = request.args.get('count', type=str)
 
-        result = self.gateway_booking_service.get_all_bookings(page, per_page)
+        result = self.gateway_booking_service.get_all_bookings(page, per_page, cursor, count)
         return handle_response(result)
 
     @authenticate
@@ -0,0 +1,43 @@
+from flask import Blueprint, Response, g, request, jsonify
+
+from app.domain.services.gateway.flights.igateway_export_service import IGatewayExportService
+from app.domain.enums.role import Role
+from app.domain.types.result import ok
+
+from app.middlewares.authentication.authentication import authenticate
+from app.middlewares.authorization.authorization import authorize
+
+from app.web_api.controllers.auth.auth_controller import handle_response
+
+class GatewayExportController:
+    def __init__(self, gateway_export_service: IGatewayExportService) -> None:
+        self._gateway_export_blueprint = Blueprint('exports', __name__, url_prefix='/api/v1')
+        self.gateway_export_service = gateway_export_service
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self._gateway_export_blueprint.add_url_rule('/exports/<any(flights, bookings, ratings):entity>', view_func=self._handle_export, methods=['GET', 'OPTIONS'])
+
+    def _handle_export(self, entity: str):
+        if request.method == 'OPTIONS':
+            return jsonify({}), 200
+        return self.export(entity)
+
+    @authenticate
+    @authorize(Role.ADMINISTRATOR)
+    def export(self, entity: str) -> Response | tuple[Response, int]:
+        admin_id = g.user.user_id
+
+        result = self.gateway_export_service.export(entity, request.args, admin_id)
+        if isinstance(result, ok):
+            stream = result.data
+            return Response(
+                stream.chunks,
+                content_type=stream.content_type,
+                headers={'Content-Disposition': stream.content_disposition}
+            )
+        return handle_response(result)
+
+    @property
+    def blueprint(self) -> Blueprint:
+        return self._gateway_export_blueprint
@@ -102,13 +102,15 @@ class GatewayFlightController:
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
 
+        cursor = request.args.get('cursor', type=str)
+
         filters = {
             k: v
             for k, v in request.args.items()
-            if k not in ('page', 'per_page') and v != ""
+            if k not in ('page', 'per_page', 'cursor') and v != ""
         }
 
-        result = self.gateway_flight_service.get_all_flights(page, per_page, filters)
+        result = self.gateway_flight_service.get_all_flights(page, per_page, filters, cursor)
         return handle_response(result)
     
     @authenticate
@@ -0,0 +1,21 @@
+from flask import Blueprint, Response
+
+from app.infrastructure.metrics.request_metrics import RequestMetrics
+
+class MetricsController:
+    def __init__(self, request_metrics: RequestMetrics) -> None:
+        # Scraped at the root, outside the /api/v1 prefix
+        self._metrics_blueprint = Blueprint('metrics', __name__)
+        self.request_metrics = request_metrics
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self._metrics_blueprint.add_url_rule('/metrics', view_func=self.metrics, methods=['GET'])
+
+    def metrics(self) -> Response:
+        payload, content_type = self.request_metrics.render()
+        return Response(payload, content_type=content_type)
+
+    @property
+    def blueprint(self) -> Blueprint:
+        return self._metrics_blueprint
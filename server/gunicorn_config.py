@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 from gunicorn.arbiter import Arbiter 
 from gunicorn.workers.base import Worker
 from gunicorn.http.message import Request
@@ -17,6 +19,10 @@ max_requests_jitter = 50
 timeout = 120
 keepalive = 5
 
+# Metrics: every worker writes its Prometheus samples here and /metrics aggregates them.
+# Set before the workers are forked, since prometheus_client reads it on import.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'server-metrics'))
+
 # Logging
 accesslog = '-'  # Log to stdout
 errorlog = '-'   # Log to stderr
@@ -42,6 +48,10 @@ tmp_upload_dir = None
 def on_starting(server: Arbiter) -> None:
     """Called just before the master process is initialized."""
     server.log.info("Starting Server with Gunicorn + Gevent") # type: ignore
+    # Samples left by a previous run would be added to this one's
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
 
 def on_reload(server: Arbiter) -> None:
     """Called to recycle workers during a reload via SIGHUP."""
@@ -82,6 +92,8 @@ def post_request(worker: Worker, req: Request, environ: dict[str, str], resp: Re
 def child_exit(server: Arbiter, worker: Worker) -> None:
     """Called just after a worker has been exited."""
     server.log.info(f"Worker exited (pid: {worker.pid})") # type: ignore
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
 
 def worker_abort(worker: Worker) -> None:
     """Called when a worker received the SIGABRT signal."""